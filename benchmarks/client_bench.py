@@ -0,0 +1,127 @@
+"""Offline benchmark of the real BlueskyClient against a recorded session.
+
+Record a session once with ``python -m bluesky_tui --record session.jsonl.gz``,
+then replay it here to time (or profile) parsing of realistic payloads:
+
+    python benchmarks/client_bench.py session.jsonl.gz --out client.json
+    python benchmarks/client_bench.py session.jsonl.gz --profile client.prof
+
+Only requests that are in the archive can be replayed; the timeline pages,
+threads and conversations the session opened are the ones benchmarked.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+async def _timed(timings: dict, name: str, call):
+    """Await *call* and record how long it took; None if the archive can't answer it."""
+    from bluesky_tui.api.errors import status_code_of
+
+    start = time.perf_counter()
+    try:
+        result = await call
+    except Exception as e:
+        if status_code_of(e) == 501:  # not recorded
+            return None
+        raise
+    timings.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+    return result
+
+
+async def run_once(client, timings: dict, pages: int) -> None:
+    # Parsing is what's measured; don't let the caches skip it
+    client.thread_cache.clear()
+    client.profile_cache.clear()
+
+    page = await _timed(timings, "get_timeline", client.get_timeline())
+    posts, cursor = page or ([], None)
+    for _ in range(pages - 1):
+        page = await _timed(timings, "get_timeline", client.get_timeline(cursor=cursor)) if cursor else None
+        if not page:
+            break
+        cursor = page[1]
+
+    for post in posts:
+        await _timed(timings, "get_post_thread", client.get_post_thread(post.uri))
+
+    convos, _ = await _timed(timings, "list_conversations", client.list_conversations()) or ([], None)
+    for convo in convos:
+        await _timed(timings, "get_messages", client.get_messages(convo.id))
+
+
+async def bench(archive: Path, repeats: int, pages: int, time_scale: float, profile: Path | None) -> dict:
+    from bluesky_tui.api import replay, transport
+    from bluesky_tui.api.client import BlueskyClient
+    from bluesky_tui.api.metrics import percentile
+
+    replay.replay_from(archive, time_scale=time_scale)
+    client = BlueskyClient()
+    # The recorded createSession answers whatever is sent
+    await client.login("replay", "replay")
+
+    profiler = cProfile.Profile() if profile else None
+    timings: dict[str, list[float]] = {}
+    if profiler:
+        profiler.enable()
+    for _ in range(repeats):
+        await run_once(client, timings, pages)
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(profile)
+
+    misses = transport.shared_transport().misses
+    await transport.close_shared_transport()
+    return {
+        "timestamp": time.time(),
+        "archive": str(archive),
+        "repeats": repeats,
+        "time_scale": time_scale,
+        "unrecorded_requests": misses,
+        "results": {
+            name: {
+                "calls": len(values),
+                "median_ms": round(statistics.median(values), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+            }
+            for name, values in timings.items()
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("archive", type=Path, help="Session recorded with --record")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=3, help="Timeline pages to fetch per repeat")
+    parser.add_argument(
+        "--time-scale", type=float, default=0.0, help="Multiply recorded response times by this (0 = no delay)",
+    )
+    parser.add_argument("--profile", type=Path, help="Write a cProfile dump of the replayed calls here")
+    parser.add_argument("--out", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    os.environ["HOME"] = tempfile.mkdtemp(prefix="bluesky_tui-bench-")
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+    logging.getLogger("bluesky_tui").addHandler(logging.NullHandler())
+
+    result = asyncio.run(bench(args.archive, args.repeats, args.pages, args.time_scale, args.profile))
+    text = json.dumps(result, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""Headless UI benchmarks for bluesky_tui, driven by Textual's Pilot against DemoClient.
+
+Runs offline against a seeded synthetic dataset (--posts, --seed), optionally
+with simulated latency. Each scenario boots a fresh app, and timings are
+reported in milliseconds as the median of --repeats runs:
+
+    python benchmarks/ui_bench.py --out results.json
+    python benchmarks/ui_bench.py --compare results.json --threshold 0.2
+
+With --compare the run fails (exit status 1) if any scenario's median is
+more than --threshold slower than in the baseline file.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+SCREEN_SIZE = (120, 40)
+CURSOR_PRESSES = 500
+PAGES = 10
+THREADS_OPENED = 10
+FILTER_PAGES = 5
+POLL_INTERVAL = 0.002
+
+
+async def wait_until(predicate: Callable[[], bool], timeout: float = 10.0) -> None:
+    # Polls far more finely than Pilot.pause, whose idle detection sleeps 20 ms at a time
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("condition not reached")
+        await asyncio.sleep(POLL_INTERVAL)
+
+
+def send_keys(app, *keys: str) -> None:
+    """Queue key presses without Pilot's wait-for-idle after each one."""
+    from textual import events
+
+    for key in keys:
+        app.post_message(events.Key(key, " " if key == "space" else key if len(key) == 1 else None))
+
+
+def _feed_count(app) -> int:
+    from bluesky_tui.widgets.post import PostWidget
+
+    return len(app.screen.query(PostWidget)) if type(app.screen).__name__ == "FeedScreen" else 0
+
+
+def _feed_mounted(app) -> bool:
+    """Whether the feed list has mounted everything it was given, not just the first batch."""
+    return not app.screen.query_one("#feed-list").mounter.busy
+
+
+def _notification_count(app) -> int:
+    return len(app.screen.query_one("#notif-list").children)
+
+
+# Set from the command line; see main()
+DEMO_OPTIONS: dict = {}
+
+
+def _new_app():
+    from bluesky_tui.api.demo_client import DemoClient, Latency
+    from bluesky_tui.app import BlueskyApp
+
+    return BlueskyApp(client=DemoClient(
+        posts=DEMO_OPTIONS["posts"],
+        seed=DEMO_OPTIONS["seed"],
+        latency=Latency(DEMO_OPTIONS["latency_ms"] / 1000),
+    ))
+
+
+async def bench_first_feed(samples: dict) -> None:
+    app = _new_app()
+    start = time.perf_counter()
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await wait_until(lambda: _feed_count(app) > 0)
+        samples["first_feed_ms"] = (time.perf_counter() - start) * 1000
+
+
+async def bench_cursor(samples: dict) -> None:
+    app = _new_app()
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await wait_until(lambda: _feed_count(app) > 0)
+        start, cpu_start = time.perf_counter(), time.process_time()
+        send_keys(app, *["j"] * CURSOR_PRESSES)
+        # Returns once the process stops burning CPU, i.e. every press is handled
+        await pilot.pause()
+        samples[f"cursor_{CURSOR_PRESSES}_presses_ms"] = (time.perf_counter() - start) * 1000
+        samples[f"cursor_{CURSOR_PRESSES}_presses_cpu_ms"] = (time.process_time() - cpu_start) * 1000
+
+
+async def bench_append_pages(samples: dict) -> None:
+    app = _new_app()
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await wait_until(lambda: _feed_count(app) > 0)
+        await wait_until(lambda: _feed_mounted(app))
+        feed = app.screen
+        start = time.perf_counter()
+        pages = 0
+        while pages < PAGES and feed._cursor:
+            shown = _feed_count(app)
+            send_keys(app, "space")
+            await wait_until(lambda: _feed_count(app) > shown)
+            await wait_until(lambda: _feed_mounted(app))
+            pages += 1
+        samples[f"append_{PAGES}_pages_ms"] = (time.perf_counter() - start) * 1000
+        samples["pages_appended"] = pages
+        samples["feed_posts"] = _feed_count(app)
+
+
+async def bench_filter_cycle(samples: dict) -> None:
+    app = _new_app()
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await wait_until(lambda: _feed_count(app) > 0)
+        await wait_until(lambda: _feed_mounted(app))
+        feed = app.screen
+        for _ in range(FILTER_PAGES - 1):
+            if not feed._cursor:
+                break
+            shown = _feed_count(app)
+            send_keys(app, "space")
+            await wait_until(lambda: _feed_count(app) > shown)
+            await wait_until(lambda: _feed_mounted(app))
+        await pilot.pause()
+        timings = []
+        for _ in feed._filters:
+            start = time.perf_counter()
+            send_keys(app, "f")
+            await pilot.pause()
+            timings.append((time.perf_counter() - start) * 1000)
+        samples["filter_cycle_posts"] = _feed_count(app)
+    samples["filter_cycle_ms"] = statistics.median(timings)
+
+
+async def bench_thread_open(samples: dict) -> None:
+    from bluesky_tui.screens.thread import ThreadScreen
+    from bluesky_tui.widgets.post import PostWidget
+
+    app = _new_app()
+    timings = []
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await wait_until(lambda: _feed_count(app) > 0)
+        for _ in range(THREADS_OPENED):
+            await pilot.press("j")
+            start = time.perf_counter()
+            send_keys(app, "t")
+            await wait_until(
+                lambda: isinstance(app.screen, ThreadScreen) and len(app.screen.query(PostWidget)) > 0,
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+            await pilot.press("escape")
+            await wait_until(lambda: _feed_count(app) > 0)
+    samples["thread_open_ms"] = statistics.median(timings)
+    samples["thread_open_max_ms"] = max(timings)
+
+
+async def bench_notifications(samples: dict) -> None:
+    from bluesky_tui.screens.notifications import NotificationsScreen
+
+    app = _new_app()
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await wait_until(lambda: _feed_count(app) > 0)
+        await pilot.press("n")
+        await wait_until(lambda: isinstance(app.screen, NotificationsScreen) and _notification_count(app) > 0)
+        await pilot.pause()
+        rows = app.screen.query_one("#notif-list").children
+        old = {id(row) for row in rows}
+        start = time.perf_counter()
+        app.screen._rebuild_list()
+        # clear() and append() take effect asynchronously; done once every row is new
+        await wait_until(lambda: len(rows) == len(old) and not old & {id(row) for row in rows})
+        samples["notifications_rebuild_ms"] = (time.perf_counter() - start) * 1000
+
+
+async def bench_debug_open(samples: dict) -> None:
+    from bluesky_tui.screens.debug import DebugScreen
+
+    # A fresh session has recorded no stalls, which the screen must cope with
+    app = _new_app()
+    async with app.run_test(size=SCREEN_SIZE) as pilot:
+        await wait_until(lambda: _feed_count(app) > 0)
+        start = time.perf_counter()
+        send_keys(app, "f12")
+        await wait_until(lambda: isinstance(app.screen, DebugScreen) and app.screen.is_mounted)
+        await pilot.pause()
+        samples["debug_open_ms"] = (time.perf_counter() - start) * 1000
+        await pilot.press("escape")
+        await wait_until(lambda: _feed_count(app) > 0)
+
+
+SCENARIOS: list[Callable[[dict], Awaitable[None]]] = [
+    bench_first_feed,
+    bench_cursor,
+    bench_append_pages,
+    bench_filter_cycle,
+    bench_thread_open,
+    bench_notifications,
+    bench_debug_open,
+]
+
+
+def run(repeats: int) -> dict:
+    runs: dict[str, list[float]] = {}
+    for scenario in SCENARIOS:
+        for _ in range(repeats):
+            samples: dict = {}
+            asyncio.run(scenario(samples))
+            for name, value in samples.items():
+                runs.setdefault(name, []).append(value)
+
+    import textual
+
+    return {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "textual": textual.__version__,
+        "repeats": repeats,
+        "results": {
+            name: {
+                "median": round(statistics.median(values), 2),
+                "min": round(min(values), 2),
+                "max": round(max(values), 2),
+            }
+            for name, values in runs.items()
+        },
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print each timing against the baseline; return the names that regressed."""
+    regressions = []
+    for name, stats in result["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if old is None or not name.endswith("_ms") or not old["median"]:
+            continue
+        change = stats["median"] / old["median"] - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:32} {old['median']:10.1f} -> {stats['median']:10.1f} ms  {change:+7.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    print(f"{'peak_rss_mib':32} {baseline.get('peak_rss_mib', 0):10.1f} -> {result['peak_rss_mib']:10.1f} MiB")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--posts", type=int, default=2000, help="Synthetic posts in the demo client")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the demo client's data")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median simulated latency per call")
+    parser.add_argument("--out", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE", help="Compare against an earlier results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown vs. the baseline (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    # Keep the user's settings, accounts and outbox out of the measurements
+    os.environ["HOME"] = tempfile.mkdtemp(prefix="bluesky_tui-bench-")
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+    # Stall warnings from the loop monitor would otherwise go to stderr
+    logging.getLogger("bluesky_tui").addHandler(logging.NullHandler())
+
+    DEMO_OPTIONS.update(posts=args.posts, seed=args.seed, latency_ms=args.latency_ms)
+    result = run(args.repeats)
+    result["demo"] = DEMO_OPTIONS
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2) + "\n")
+    if args.compare:
+        regressions = compare(result, json.loads(args.compare.read_text()), args.threshold)
+        return 1 if regressions else 0
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
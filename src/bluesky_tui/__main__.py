@@ -1,4 +1,6 @@
 import argparse
+import logging
+from pathlib import Path
 
 from bluesky_tui.app import BlueskyApp
 
@@ -6,15 +8,107 @@ from bluesky_tui.app import BlueskyApp
 def main():
     parser = argparse.ArgumentParser(description="Bluesky TUI")
     parser.add_argument("--demo", action="store_true", help="Run with mock data for screenshots")
+    parser.add_argument(
+        "--demo-posts",
+        type=int,
+        metavar="N",
+        help="With --demo, generate N synthetic posts (and matching users, threads and notifications)",
+    )
+    parser.add_argument(
+        "--demo-latency",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="With --demo, delay each call by a log-normal latency with this median",
+    )
+    parser.add_argument(
+        "--service-url",
+        metavar="URL",
+        help="Send requests to this server instead of bsky.social, e.g. a local bluesky_tui.mock_server",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Write a debug log, including event-loop stalls and their stacks, to ~/.config/bluesky_tui/debug.log",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        metavar="PATH",
+        help="Append a JSON line of request, cache and event-loop metrics every minute (rotated at 1 MB)",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=Path("bluesky_tui-profile"),
+        metavar="DIR",
+        help="Profile the session with cProfile; reports are written to DIR (default ./bluesky_tui-profile) on exit and on F9",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="With --profile, also trace allocations and report the largest",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        metavar="PATH",
+        help="Save every request and response of the session to a gzipped archive (tokens are redacted; DMs are not)",
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        metavar="PATH",
+        help="Answer requests from an archive made with --record instead of the network",
+    )
+    parser.add_argument(
+        "--replay-time-scale",
+        type=float,
+        default=1.0,
+        metavar="X",
+        help="With --replay, delay responses by X times their recorded duration (0 = no delay)",
+    )
     args = parser.parse_args()
 
+    if args.debug:
+        from bluesky_tui.config import CONFIG_DIR
+
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        logging.basicConfig(
+            filename=CONFIG_DIR / "debug.log",
+            level=logging.DEBUG,
+            format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        )
+
+    if args.record:
+        from bluesky_tui.api import replay
+        replay.record_to(args.record)
+    elif args.replay:
+        from bluesky_tui.api import replay
+        replay.replay_from(args.replay, time_scale=args.replay_time_scale)
+
     client = None
     if args.demo:
-        from bluesky_tui.api.demo_client import DemoClient
-        client = DemoClient()
+        from bluesky_tui.api.demo_client import DemoClient, Latency
+        client = DemoClient(posts=args.demo_posts, latency=Latency(args.demo_latency / 1000))
+
+    profiler = None
+    if args.profile:
+        from bluesky_tui.profiling import SessionProfiler
+        profiler = SessionProfiler(args.profile, trace_memory=args.profile_memory)
 
-    app = BlueskyApp(client=client)
-    app.run()
+    app = BlueskyApp(
+        client=client, metrics_file=args.metrics_file, profiler=profiler, service_url=args.service_url,
+    )
+    if profiler is None:
+        app.run()
+        return
+    profiler.start()
+    try:
+        app.run()
+    finally:
+        print(f"Profile report: {profiler.stop()}")
 
 
 if __name__ == "__main__":
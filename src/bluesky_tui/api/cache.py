@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterator, TypeVar
+
+from bluesky_tui.api.models import ProfileData, ThreadData, ThreadNode
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU cache whose entries expire *ttl* seconds after being stored."""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> V | None:
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def age(self, key: Hashable) -> float | None:
+        """Seconds since *key* was stored, or None if it is absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = time.monotonic() - entry[0]
+        return age if age <= self.ttl else None
+
+    def items(self) -> Iterator[tuple[Hashable, V]]:
+        now = time.monotonic()
+        for key, (stored_at, value) in list(self._entries.items()):
+            if now - stored_at <= self.ttl:
+                yield key, value
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.age(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _node_uris(nodes: list[ThreadNode]) -> Iterator[str]:
+    for node in nodes:
+        yield node.post.uri
+        yield from _node_uris(node.replies)
+
+
+def thread_uris(thread: ThreadData) -> Iterator[str]:
+    """Every post URI in *thread*, including lazily loaded subtrees."""
+    for parent in thread.parents:
+        yield parent.uri
+    if thread.post:
+        yield thread.post.uri
+    yield from _node_uris(thread.replies)
+
+
+class ThreadCache(TTLCache[ThreadData]):
+    """Thread views keyed by the URI they were opened with."""
+
+    def __init__(self, maxsize: int = 64, ttl: float = 300.0) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+    def invalidate_post(self, uri: str) -> None:
+        """Drop every cached thread that contains *uri*."""
+        # Subtrees are attached to cached threads after the fact as replies get
+        # expanded, so membership is checked on the live tree rather than indexed.
+        for key, thread in list(self.items()):
+            if uri in thread_uris(thread):
+                self.pop(key)
+
+
+class ProfileCache(TTLCache[ProfileData]):
+    """Profiles reachable by either DID or handle."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+    def put_profile(self, profile: ProfileData) -> None:
+        self.put(profile.did, profile)
+        self.put(profile.handle, profile)
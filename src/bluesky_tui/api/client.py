@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
 from atproto import AsyncClient
 
-from bluesky_tui.api.models import PostData, ProfileData, ThreadData, NotificationData, MessageData, ConversationData
+from bluesky_tui.api import mutes, transport
+from bluesky_tui.api.cache import ProfileCache, ThreadCache
+from bluesky_tui.api.metrics import ClientMetrics
+from bluesky_tui.api.resilience import Resilience
+from bluesky_tui.api.scheduler import RequestScheduler
+from bluesky_tui.api.search_index import SearchIndex
+from bluesky_tui.api.singleflight import SingleFlight, single_flight
+from bluesky_tui.api.write_queue import PendingWrite, WriteQueue, next_tid
+from bluesky_tui.api.models import PostData, PostFlags, ProfileData, ThreadData, ThreadNode, NotificationData, MessageData, ConversationData
+
+# Reply levels requested per thread fetch; deeper branches are fetched on expand.
+THREAD_DEPTH = 1
+THREAD_PARENT_HEIGHT = 10
 
 
 def _has_media(embed) -> tuple[bool, bool]:
@@ -19,14 +34,141 @@ def _has_media(embed) -> tuple[bool, bool]:
     return has_image, has_video
 
 
+def _link_quote_flags(post) -> PostFlags:
+    """LINK and QUOTE flags from a post view's embed and its record's link facets."""
+    flags = PostFlags.NONE
+    embed = post.embed
+    if embed:
+        if hasattr(embed, "external") or hasattr(getattr(embed, "media", None), "external"):
+            flags |= PostFlags.LINK
+        if hasattr(embed, "record"):
+            flags |= PostFlags.QUOTE
+    if not flags & PostFlags.LINK:
+        for facet in getattr(post.record, "facets", None) or ():
+            if any(hasattr(feature, "uri") for feature in facet.features):
+                flags |= PostFlags.LINK
+                break
+    return flags
+
+
+def _parse_thread_post(tv) -> PostData | None:
+    if not hasattr(tv, "post"):
+        return None
+    post = tv.post
+    record = post.record
+    viewer = post.viewer
+    return PostData(
+        uri=post.uri,
+        cid=post.cid,
+        author_did=post.author.did,
+        author_handle=post.author.handle,
+        author_display_name=post.author.display_name or post.author.handle,
+        text=record.text if hasattr(record, "text") else "",
+        created_at=record.created_at if hasattr(record, "created_at") else "",
+        like_count=post.like_count or 0,
+        repost_count=post.repost_count or 0,
+        reply_count=post.reply_count or 0,
+        is_liked=bool(viewer and viewer.like),
+        is_reposted=bool(viewer and viewer.repost),
+        like_uri=viewer.like if viewer else None,
+        repost_uri=viewer.repost if viewer else None,
+        reason_repost_by=None,
+        reply_parent_uri=None,
+        reply_parent_author=None,
+        reply_root_uri=None,
+        embed_type=None,
+        embed_text=None,
+        embed_author=None,
+        has_image=_has_media(post.embed)[0],
+        has_video=_has_media(post.embed)[1],
+        langs=getattr(record, "langs", None) or (),
+        flags=_link_quote_flags(post),
+    )
+
+
+def _parse_thread_replies(tv) -> list[ThreadNode]:
+    """Convert the replies of a thread view into ThreadNodes, recursively."""
+    nodes = []
+    for reply_view in getattr(tv, "replies", None) or []:
+        post = _parse_thread_post(reply_view)
+        if not post:
+            continue
+        # The server omits ``replies`` entirely once the requested depth is exhausted
+        loaded = getattr(reply_view, "replies", None) is not None
+        nodes.append(ThreadNode(
+            post=post,
+            replies=_parse_thread_replies(reply_view) if loaded else [],
+            replies_loaded=loaded,
+        ))
+    return nodes
+
+
 class BlueskyClient:
     def __init__(self):
-        self._client = AsyncClient()
+        self.scheduler = RequestScheduler()
+        # Transport and hooks carry over to clones such as the chat proxy
+        request = transport.OffloadingRequest(
+            transport=transport.shared_transport(),
+            event_hooks={"request": [transport.stats.on_request], "response": [self._on_response]},
+        )
+        self._client = AsyncClient(base_url=transport.service_url(), request=request)
         self.me: ProfileData | None = None
         self.__dm = None
+        self.thread_cache = ThreadCache()
+        self.profile_cache = ProfileCache()
+        # Likes, reposts and follows are batched into applyWrites commits
+        self.writes = WriteQueue(self._apply_writes, lambda: self.me.did if self.me else "")
+        self.metrics = ClientMetrics()
+        # Concurrent identical reads (prefetch + screen load, say) share one request
+        self.flights = SingleFlight(self.scheduler, self.metrics.record_dedup)
+        self.resilience = Resilience(self.metrics, self.scheduler)
+        # Everything loaded through this client, for the search screen
+        self.search_index = SearchIndex()
+
+    @property
+    def _my_did(self) -> str | None:
+        return self.me.did if self.me else None
+
+    async def _on_response(self, response) -> None:
+        self.scheduler.observe(response)
+        # Hooks run before the body is read; read it now to count its size
+        await response.aread()
+        request = response.request
+        self.metrics.record_bytes(
+            request.url.path.rsplit("/", 1)[-1],
+            sent=len(request.content),
+            received=response.num_bytes_downloaded,
+        )
+
+    async def _call(self, endpoint: str, fn, *args, **kwargs):
+        """Issue one XRPC call through *fn*, keeping per-client request counters.
+
+        The call first waits for the scheduler to admit it at the caller's
+        priority. Cancellation (a screen being dismissed, a superseded worker)
+        is left to propagate so httpx aborts the request and releases its
+        connection.
+        """
+        await self.scheduler.acquire(endpoint)
+        self.metrics.requests += 1
+        start = time.perf_counter()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            self.metrics.record_cancel(endpoint)
+            raise
+        except Exception:
+            self.metrics.errors += 1
+            self.metrics.record_call(endpoint, time.perf_counter() - start, ok=False)
+            raise
+        self.metrics.record_call(endpoint, time.perf_counter() - start, ok=True)
+        return result
+
+    async def _read(self, endpoint: str, fn, *args, **kwargs):
+        """Like _call, for idempotent reads: retried, hedged and circuit-broken."""
+        return await self.resilience.run(endpoint, lambda: self._call(endpoint, fn, *args, **kwargs))
 
     async def login(self, handle: str, app_password: str) -> None:
-        profile = await self._client.login(handle, app_password)
+        profile = await self._call("com.atproto.server.createSession", self._client.login, handle, app_password)
         self.me = ProfileData(
             did=profile.did,
             handle=profile.handle,
@@ -40,8 +182,11 @@ class BlueskyClient:
             follow_uri=None,
         )
 
+    @single_flight
     async def get_timeline(self, cursor: str | None = None, limit: int = 30) -> tuple[list[PostData], str | None]:
-        resp = await self._client.get_timeline(cursor=cursor, limit=limit)
+        resp = await self._read(
+            "app.bsky.feed.getTimeline", self._client.get_timeline, cursor=cursor, limit=limit,
+        )
         posts = []
         for item in resp.feed:
             post = item.post
@@ -90,32 +235,74 @@ class BlueskyClient:
                 embed_author=None,
                 has_image=_has_media(post.embed)[0],
                 has_video=_has_media(post.embed)[1],
+                langs=getattr(record, "langs", None) or (),
+                flags=_link_quote_flags(post),
             ))
+        posts = mutes.current().visible(posts, self._my_did)
+        self.search_index.add_posts(posts)
         return posts, resp.cursor
 
-    async def like(self, uri: str, cid: str) -> str:
-        resp = await self._client.like(uri, cid)
-        return resp.uri
+    def like(self, uri: str, cid: str, rkey: str | None = None) -> PendingWrite:
+        from atproto import models as atproto_models
+
+        self.thread_cache.invalidate_post(uri)
+        record = atproto_models.AppBskyFeedLike.Record(
+            created_at=self._client.get_current_time_iso(),
+            subject=atproto_models.ComAtprotoRepoStrongRef.Main(uri=uri, cid=cid),
+        )
+        return self.writes.create("app.bsky.feed.like", record, subject=uri, rkey=rkey)
+
+    def unlike(self, like_uri: str, subject_uri: str | None = None) -> PendingWrite:
+        if subject_uri:
+            self.thread_cache.invalidate_post(subject_uri)
+        return self.writes.delete(like_uri, subject=subject_uri)
+
+    def repost(self, uri: str, cid: str) -> PendingWrite:
+        from atproto import models as atproto_models
 
-    async def unlike(self, like_uri: str) -> None:
-        await self._client.unlike(like_uri)
+        self.thread_cache.invalidate_post(uri)
+        record = atproto_models.AppBskyFeedRepost.Record(
+            created_at=self._client.get_current_time_iso(),
+            subject=atproto_models.ComAtprotoRepoStrongRef.Main(uri=uri, cid=cid),
+        )
+        return self.writes.create("app.bsky.feed.repost", record, subject=uri)
+
+    def unrepost(self, repost_uri: str, subject_uri: str | None = None) -> PendingWrite:
+        if subject_uri:
+            self.thread_cache.invalidate_post(subject_uri)
+        return self.writes.delete(repost_uri, subject=subject_uri)
 
-    async def repost(self, uri: str, cid: str) -> str:
-        resp = await self._client.repost(uri, cid)
-        return resp.uri
+    async def _apply_writes(self, repo: str, writes: list[PendingWrite]) -> list[str | None]:
+        from atproto import models as atproto_models
 
-    async def unrepost(self, repost_uri: str) -> None:
-        await self._client.unrepost(repost_uri)
+        ops = []
+        for w in writes:
+            if w.action == "create":
+                ops.append(atproto_models.ComAtprotoRepoApplyWrites.Create(
+                    collection=w.collection, rkey=w.rkey, value=w.record,
+                ))
+            else:
+                ops.append(atproto_models.ComAtprotoRepoApplyWrites.Delete(collection=w.collection, rkey=w.rkey))
+        resp = await self._call(
+            "com.atproto.repo.applyWrites",
+            self._client.com.atproto.repo.apply_writes,
+            atproto_models.ComAtprotoRepoApplyWrites.Data(repo=repo, writes=ops),
+        )
+        return [getattr(r, "uri", None) for r in resp.results or []]
 
     async def delete_post(self, uri: str) -> None:
-        await self._client.delete_post(uri)
+        self.thread_cache.invalidate_post(uri)
+        self.search_index.remove(uri)
+        await self._call("com.atproto.repo.deleteRecord", self._client.delete_post, uri)
 
     async def create_post(
         self,
         text: str,
         reply_to: PostData | None = None,
         quote: PostData | None = None,
+        rkey: str | None = None,
     ) -> PostData:
+        """Publish a post. Passing the same *rkey* again never creates a duplicate."""
         from atproto import models as atproto_models
 
         def _strong_ref(uri: str, cid: str):
@@ -138,12 +325,23 @@ class BlueskyClient:
                 record=_strong_ref(quote.uri, quote.cid),
             )
 
-        resp = await self._client.send_post(
+        record = atproto_models.AppBskyFeedPost.Record(
+            created_at=self._client.get_current_time_iso(),
             text=text,
-            reply_to=reply_ref,
+            reply=reply_ref,
             embed=embed,
+            langs=["en"],
         )
-        return PostData(
+        resp = await self._call(
+            "com.atproto.repo.createRecord",
+            self._client.app.bsky.feed.post.create,
+            self.me.did if self.me else "",
+            record,
+            rkey=rkey or next_tid(),
+        )
+        if reply_to:
+            self.thread_cache.invalidate_post(reply_to.uri)
+        post = PostData(
             uri=resp.uri,
             cid=resp.cid,
             author_did=self.me.did if self.me else "",
@@ -167,8 +365,13 @@ class BlueskyClient:
             embed_author=None,
             has_image=False,
             has_video=False,
+            langs=record.langs,
+            flags=PostFlags.QUOTE if quote else PostFlags.NONE,
         )
+        self.search_index.add_posts([post])
+        return post
 
+    @single_flight
     async def resolve_repost_uri(self, repost_uri: str) -> str | None:
         """Given a repost AT URI, fetch the record and return the original post URI."""
         try:
@@ -177,8 +380,10 @@ class BlueskyClient:
             if len(parts) != 3:
                 return None
             repo, collection, rkey = parts
-            resp = await self._client.com.atproto.repo.get_record(
-                {"repo": repo, "collection": collection, "rkey": rkey}
+            resp = await self._read(
+                "com.atproto.repo.getRecord",
+                self._client.com.atproto.repo.get_record,
+                {"repo": repo, "collection": collection, "rkey": rkey},
             )
             subject = getattr(resp.value, "subject", None)
             if subject and hasattr(subject, "uri"):
@@ -187,42 +392,17 @@ class BlueskyClient:
             pass
         return None
 
-    async def get_post_thread(self, uri: str) -> ThreadData:
-        resp = await self._client.get_post_thread(uri, depth=10, parent_height=10)
+    @single_flight
+    async def get_post_thread(self, uri: str, depth: int = THREAD_DEPTH) -> ThreadData:
+        resp = await self._read(
+            "app.bsky.feed.getPostThread",
+            self._client.get_post_thread,
+            uri,
+            depth=depth,
+            parent_height=THREAD_PARENT_HEIGHT,
+        )
         thread = resp.thread
 
-        def _parse_thread_post(tv) -> PostData | None:
-            if not hasattr(tv, "post"):
-                return None
-            post = tv.post
-            record = post.record
-            viewer = post.viewer
-            return PostData(
-                uri=post.uri,
-                cid=post.cid,
-                author_did=post.author.did,
-                author_handle=post.author.handle,
-                author_display_name=post.author.display_name or post.author.handle,
-                text=record.text if hasattr(record, "text") else "",
-                created_at=record.created_at if hasattr(record, "created_at") else "",
-                like_count=post.like_count or 0,
-                repost_count=post.repost_count or 0,
-                reply_count=post.reply_count or 0,
-                is_liked=bool(viewer and viewer.like),
-                is_reposted=bool(viewer and viewer.repost),
-                like_uri=viewer.like if viewer else None,
-                repost_uri=viewer.repost if viewer else None,
-                reason_repost_by=None,
-                reply_parent_uri=None,
-                reply_parent_author=None,
-                reply_root_uri=None,
-                embed_type=None,
-                embed_text=None,
-                embed_author=None,
-                has_image=_has_media(post.embed)[0],
-                has_video=_has_media(post.embed)[1],
-            )
-
         # Collect parents
         parents = []
         node = thread
@@ -235,23 +415,32 @@ class BlueskyClient:
         # Main post
         main_post = _parse_thread_post(thread)
 
-        # Collect replies
-        replies = []
-        if hasattr(thread, "replies") and thread.replies:
-            for reply_view in thread.replies:
-                r = _parse_thread_post(reply_view)
-                if r:
-                    replies.append(r)
-
-        return ThreadData(
+        result = ThreadData(
             parents=parents,
             post=main_post,
-            replies=replies,
+            replies=mutes.current().visible_nodes(_parse_thread_replies(thread), self._my_did),
         )
+        self.thread_cache.put(uri, result)
+        self.search_index.add_thread(result)
+        return result
+
+    @single_flight
+    async def get_thread_replies(self, uri: str, depth: int = THREAD_DEPTH) -> list[ThreadNode]:
+        """Fetch the reply subtree below *uri*, without its parents."""
+        resp = await self._read(
+            "app.bsky.feed.getPostThread", self._client.get_post_thread, uri, depth=depth, parent_height=0,
+        )
+        nodes = mutes.current().visible_nodes(_parse_thread_replies(resp.thread), self._my_did)
+        self.search_index.add_thread_nodes(nodes)
+        return nodes
 
+    @single_flight
     async def get_profile(self, handle_or_did: str) -> ProfileData:
-        p = await self._client.get_profile(handle_or_did)
-        return ProfileData(
+        cached = self.profile_cache.get(handle_or_did)
+        if cached:
+            return cached
+        p = await self._read("app.bsky.actor.getProfile", self._client.get_profile, handle_or_did)
+        profile = ProfileData(
             did=p.did,
             handle=p.handle,
             display_name=p.display_name or p.handle,
@@ -263,9 +452,14 @@ class BlueskyClient:
             is_following=bool(p.viewer and p.viewer.following),
             follow_uri=p.viewer.following if p.viewer else None,
         )
+        self.profile_cache.put_profile(profile)
+        return profile
 
+    @single_flight
     async def get_author_feed(self, did: str, cursor: str | None = None, limit: int = 30) -> tuple[list[PostData], str | None]:
-        resp = await self._client.get_author_feed(did, cursor=cursor, limit=limit)
+        resp = await self._read(
+            "app.bsky.feed.getAuthorFeed", self._client.get_author_feed, did, cursor=cursor, limit=limit,
+        )
         posts = []
         for item in resp.feed:
             post = item.post
@@ -297,19 +491,31 @@ class BlueskyClient:
                 embed_author=None,
                 has_image=_has_media(post.embed)[0],
                 has_video=_has_media(post.embed)[1],
+                langs=getattr(record, "langs", None) or (),
+                flags=_link_quote_flags(post),
             ))
+        posts = mutes.current().visible(posts, self._my_did)
+        self.search_index.add_posts(posts)
         return posts, resp.cursor
 
-    async def follow(self, did: str) -> str:
-        resp = await self._client.follow(did)
-        return resp.uri
+    def follow(self, did: str) -> PendingWrite:
+        from atproto import models as atproto_models
 
-    async def unfollow(self, follow_uri: str) -> None:
-        await self._client.unfollow(follow_uri)
+        record = atproto_models.AppBskyGraphFollow.Record(
+            created_at=self._client.get_current_time_iso(),
+            subject=did,
+        )
+        return self.writes.create("app.bsky.graph.follow", record, subject=did)
 
+    def unfollow(self, follow_uri: str, subject_did: str | None = None) -> PendingWrite:
+        return self.writes.delete(follow_uri, subject=subject_did)
+
+    @single_flight
     async def get_notifications(self, cursor: str | None = None) -> tuple[list[NotificationData], str | None]:
-        resp = await self._client.app.bsky.notification.list_notifications(
-            {"cursor": cursor, "limit": 30}
+        resp = await self._read(
+            "app.bsky.notification.listNotifications",
+            self._client.app.bsky.notification.list_notifications,
+            {"cursor": cursor, "limit": 30},
         )
         notifications = []
         for n in resp.notifications:
@@ -330,12 +536,17 @@ class BlueskyClient:
                 is_read=n.is_read,
                 subject_uri=n.reason_subject or "",
             ))
+        self.search_index.add_notifications(notifications)
         return notifications, resp.cursor
 
     async def mark_notifications_read(self) -> None:
         from datetime import datetime, timezone
         now = datetime.now(timezone.utc).isoformat()
-        await self._client.app.bsky.notification.update_seen({"seen_at": now})
+        await self._call(
+            "app.bsky.notification.updateSeen",
+            self._client.app.bsky.notification.update_seen,
+            {"seen_at": now},
+        )
 
     @property
     def _dm(self):
@@ -345,11 +556,12 @@ class BlueskyClient:
             self.__dm = proxy.chat.bsky.convo
         return self.__dm
 
+    @single_flight
     async def list_conversations(self, cursor: str | None = None) -> tuple[list[ConversationData], str | None]:
         params: dict = {"limit": 20}
         if cursor:
             params["cursor"] = cursor
-        resp = await self._dm.list_convos(params)
+        resp = await self._read("chat.bsky.convo.listConvos", self._dm.list_convos, params)
         convos = []
         for c in resp.convos:
             last_msg = None
@@ -378,13 +590,15 @@ class BlueskyClient:
                 unread_count=c.unread_count,
                 muted=c.muted,
             ))
+        self.search_index.add_conversations(convos)
         return convos, getattr(resp, "cursor", None)
 
+    @single_flight
     async def get_messages(self, convo_id: str, cursor: str | None = None) -> tuple[list[MessageData], str | None]:
         params: dict = {"convo_id": convo_id, "limit": 50}
         if cursor:
             params["cursor"] = cursor
-        resp = await self._dm.get_messages(params)
+        resp = await self._read("chat.bsky.convo.getMessages", self._dm.get_messages, params)
         messages = []
         for m in resp.messages:
             if not hasattr(m, "text"):  # skip deleted/system messages
@@ -403,17 +617,20 @@ class BlueskyClient:
             ))
         # API returns newest-first; reverse for chronological display
         messages.reverse()
+        self.search_index.add_messages(messages)
         return messages, getattr(resp, "cursor", None)
 
     async def send_dm(self, convo_id: str, text: str) -> MessageData:
         from atproto import models as atproto_models
-        resp = await self._dm.send_message(
+        resp = await self._call(
+            "chat.bsky.convo.sendMessage",
+            self._dm.send_message,
             atproto_models.ChatBskyConvoSendMessage.Data(
                 convo_id=convo_id,
                 message=atproto_models.ChatBskyConvoDefs.MessageInput(text=text),
             )
         )
-        return MessageData(
+        message = MessageData(
             id=resp.id,
             convo_id=convo_id,
             sender_did=self.me.did if self.me else "",
@@ -423,6 +640,12 @@ class BlueskyClient:
             sent_at=resp.sent_at,
             is_mine=True,
         )
+        self.search_index.add_messages([message])
+        return message
 
     async def mark_convo_read(self, convo_id: str, message_id: str) -> None:
-        await self._dm.update_read({"convo_id": convo_id, "message_id": message_id})
+        await self._call(
+            "chat.bsky.convo.updateRead",
+            self._dm.update_read,
+            {"convo_id": convo_id, "message_id": message_id},
+        )
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+
+class ClientPool:
+    """Authenticated clients for recently used accounts, keyed by handle.
+
+    Keeps at most *max_size* sessions, least recently used first out, and
+    drops sessions unused for *idle_timeout* seconds when evict_idle runs.
+    """
+
+    def __init__(self, max_size: int = 4, idle_timeout: float = 1800.0) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._clients: OrderedDict[str, tuple[object, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self, handle: str):
+        entry = self._clients.get(handle)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._clients[handle] = (entry[0], time.monotonic())
+        self._clients.move_to_end(handle)
+        return entry[0]
+
+    def peek(self, handle: str):
+        """Return the client for *handle* without counting it as a use."""
+        entry = self._clients.get(handle)
+        return entry[0] if entry else None
+
+    def put(self, handle: str, client) -> list[str]:
+        """Add or refresh *client*; return the handles evicted to make room."""
+        self._clients[handle] = (client, time.monotonic())
+        self._clients.move_to_end(handle)
+        evicted = []
+        while len(self._clients) > self.max_size:
+            old, _ = self._clients.popitem(last=False)
+            evicted.append(old)
+        return evicted
+
+    def pop(self, handle: str):
+        entry = self._clients.pop(handle, None)
+        return entry[0] if entry else None
+
+    def evict_idle(self, keep: str | None = None) -> list[str]:
+        """Drop sessions idle for longer than idle_timeout, except *keep*; return their handles."""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [h for h, (_, used) in self._clients.items() if used < cutoff and h != keep]
+        for handle in idle:
+            del self._clients[handle]
+        return idle
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import random
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 
-from bluesky_tui.api.models import PostData, ProfileData, ThreadData, NotificationData, MessageData, ConversationData
+from bluesky_tui.api import mutes
+from bluesky_tui.api.cache import ProfileCache, ThreadCache
+from bluesky_tui.api.errors import StatusError
+from bluesky_tui.api.metrics import ClientMetrics
+from bluesky_tui.api.models import PostData, PostFlags, ProfileData, ThreadData, ThreadNode, NotificationData, MessageData, ConversationData
+from bluesky_tui.api.resilience import Resilience
+from bluesky_tui.api.scheduler import RequestScheduler
+from bluesky_tui.api.search_index import SearchIndex
+from bluesky_tui.api.write_queue import PendingWrite, WriteQueue, next_tid
 
 # ---------------------------------------------------------------------------
 # Mock users
@@ -108,11 +120,60 @@ def _build_posts() -> list[PostData]:
             embed_author=None,
             has_image=has_img,
             has_video=has_vid,
+            langs=("en",),
         ))
         now_hours += 1.2
     return posts
 
 
+# ---------------------------------------------------------------------------
+# Build mock thread replies
+# ---------------------------------------------------------------------------
+
+_THREAD_REPLY_DEFS = [
+    # (user_idx, text, likes, reposts, replies)
+    (2, "Totally agree with this. Well said!", 12, 1, 0),
+    (4, "Counter-point: I think there's more nuance here than people realize. But overall yes.", 8, 0, 1),
+    (6, "Thanks for sharing this perspective. Bookmarked.", 5, 0, 0),
+]
+
+_NESTED_REPLY_DEFS = [
+    (1, "Fair, but the nuance usually gets lost once a take goes viral.", 3, 0, 0),
+]
+
+
+def _reply_post(
+    idx: int, user_idx: int, text: str, likes: int, reposts: int, replies: int,
+    parent_uri: str, parent_handle: str, root_uri: str,
+) -> PostData:
+    r_did, r_handle, r_display = _USERS[user_idx]
+    return PostData(
+        uri=_uri(r_did, f"thread_reply{idx}"),
+        cid=f"bafyreithreadreply{idx}",
+        author_did=r_did,
+        author_handle=r_handle,
+        author_display_name=r_display,
+        text=text,
+        created_at=_ts(0.5 + idx * 0.3),
+        like_count=likes,
+        repost_count=reposts,
+        reply_count=replies,
+        is_liked=False,
+        is_reposted=False,
+        like_uri=None,
+        repost_uri=None,
+        reason_repost_by=None,
+        reply_parent_uri=parent_uri,
+        reply_parent_author=parent_handle,
+        reply_root_uri=root_uri,
+        embed_type=None,
+        embed_text=None,
+        embed_author=None,
+        has_image=False,
+        has_video=False,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Build mock profiles
 # ---------------------------------------------------------------------------
@@ -275,14 +336,214 @@ def _build_conversations_and_messages(
     return all_convos, all_messages
 
 
+# ---------------------------------------------------------------------------
+# Synthetic data at scale
+# ---------------------------------------------------------------------------
+
+_FIRST_NAMES = [
+    "Ada", "Ben", "Chloe", "Dev", "Elif", "Femi", "Gus", "Hana", "Ivan", "Jia",
+    "Kofi", "Lena", "Mo", "Nia", "Omar", "Pia", "Quinn", "Rosa", "Sam", "Tara",
+]
+_LAST_NAMES = [
+    "Abbott", "Baker", "Costa", "Dube", "Evans", "Fischer", "Garcia", "Haddad",
+    "Ito", "Jensen", "Kim", "Lopez", "Mensah", "Novak", "Ortiz", "Patel",
+]
+_WORDS = (
+    "the a to and of in is it you that for on with this my just so but not be "
+    "have are was today new post think really about people time work code open "
+    "source protocol terminal app python rust feed thread reply bluesky weekend "
+    "release bug fix ship build learn read coffee music photo city great good"
+).split()
+
+# Share of generated posts that are replies / reposts / written by the demo user
+_REPLY_SHARE = 0.35
+_REPOST_SHARE = 0.05
+_OWN_SHARE = 0.02
+_NOTIFICATION_REASONS = ["like", "like", "like", "repost", "reply", "follow", "mention", "quote"]
+
+
+class _Phrases:
+    """Random word runs, cut from one long pre-drawn sequence (far cheaper than drawing per word)."""
+
+    def __init__(self, rng: random.Random, size: int = 8192) -> None:
+        self._rng = rng
+        self._words = rng.choices(_WORDS, k=size)
+
+    def __call__(self, low: int, high: int) -> str:
+        count = self._rng.randint(low, high)
+        start = self._rng.randrange(len(self._words) - count)
+        return " ".join(self._words[start:start + count]).capitalize()
+
+
+@dataclass
+class Latency:
+    """Log-normal per-call delay: *median* seconds, spread by *sigma*."""
+
+    median: float = 0.0
+    sigma: float = 0.6
+
+    def sample(self, rng: random.Random) -> float:
+        return self.median * rng.lognormvariate(0, self.sigma) if self.median else 0.0
+
+
+def _synthetic_users(rng: random.Random, count: int) -> list[tuple[str, str, str]]:
+    return [
+        (f"did:plc:synth{i:09d}", f"user{i:06d}.bsky.social", f"{rng.choice(_FIRST_NAMES)} {rng.choice(_LAST_NAMES)}")
+        for i in range(count)
+    ]
+
+
+def _synthetic_profiles(rng: random.Random, users: list[tuple[str, str, str]]) -> dict[str, ProfileData]:
+    phrase = _Phrases(rng)
+    return {
+        did: ProfileData(
+            did=did,
+            handle=handle,
+            display_name=display,
+            description=phrase(4, 14),
+            avatar_url="",
+            followers_count=int(rng.paretovariate(1.2) * 50),
+            following_count=rng.randint(0, 2000),
+            posts_count=rng.randint(0, 5000),
+            is_following=rng.random() < 0.3,
+            follow_uri=None,
+        )
+        for did, handle, display in users
+    }
+
+
+def _synthetic_posts(rng: random.Random, users: list[tuple[str, str, str]], count: int) -> list[PostData]:
+    """*count* posts, newest first, about one a minute; a share are replies forming threads."""
+    now = datetime.now(timezone.utc)
+    phrase = _Phrases(rng)
+    oldest_first: list[PostData] = []
+    for idx in range(count):
+        did, handle, display = _DEMO_USER if rng.random() < _OWN_SHARE else rng.choice(users)
+        parent = None
+        if oldest_first and rng.random() < _REPLY_SHARE:
+            # Replies mostly go to recent posts, which makes some threads deep
+            back = min(len(oldest_first), 1 + int(rng.expovariate(1 / 40)))
+            parent = oldest_first[-back]
+            parent.reply_count += 1
+        liked = rng.random() < 0.1
+        oldest_first.append(PostData(
+            uri=_uri(did, f"s{idx:09d}"),
+            cid=f"bafyreisynth{idx:09d}",
+            author_did=did,
+            author_handle=handle,
+            author_display_name=display,
+            text=phrase(3, 45) + ".",
+            created_at=(now - timedelta(minutes=count - idx)).isoformat(),
+            like_count=int(rng.paretovariate(1.1)) - 1,
+            repost_count=int(rng.paretovariate(1.5)) - 1,
+            reply_count=0,
+            is_liked=liked,
+            is_reposted=False,
+            like_uri=f"at://{_DEMO_USER[0]}/app.bsky.feed.like/s{idx:09d}" if liked else None,
+            repost_uri=None,
+            reason_repost_by=rng.choice(users)[1] if rng.random() < _REPOST_SHARE else None,
+            reply_parent_uri=parent.uri if parent else None,
+            reply_parent_author=parent.author_handle if parent else None,
+            reply_root_uri=(parent.reply_root_uri or parent.uri) if parent else None,
+            embed_type=None,
+            embed_text=None,
+            embed_author=None,
+            has_image=rng.random() < 0.15,
+            has_video=rng.random() < 0.03,
+            langs=("en",),
+        ))
+    oldest_first.reverse()
+    return oldest_first
+
+
+def _synthetic_notifications(
+    rng: random.Random, users: list[tuple[str, str, str]], posts: list[PostData], count: int,
+) -> list[NotificationData]:
+    own = [p for p in posts if p.author_did == _DEMO_USER[0]] or posts[:1]
+    now = datetime.now(timezone.utc)
+    phrase = _Phrases(rng)
+    notifs = []
+    for idx in range(count):
+        did, handle, display = rng.choice(users)
+        reason = rng.choice(_NOTIFICATION_REASONS)
+        has_text = reason in ("reply", "mention", "quote")
+        notifs.append(NotificationData(
+            uri=f"at://{did}/app.bsky.feed.post/n{idx:09d}",
+            cid=f"bafyreisynthnotif{idx:09d}",
+            author_did=did,
+            author_handle=handle,
+            author_display_name=display,
+            reason=reason,
+            text=phrase(3, 25) if has_text else "",
+            created_at=(now - timedelta(minutes=3 * idx)).isoformat(),
+            is_read=idx > count // 20,
+            subject_uri=rng.choice(own).uri if reason not in ("follow", "mention") else "",
+        ))
+    return notifs
+
+
+def _synthetic_conversations(
+    rng: random.Random, users: list[tuple[str, str, str]], count: int,
+) -> tuple[list[ConversationData], dict[str, list[MessageData]]]:
+    me = {"did": _DEMO_USER[0], "handle": _DEMO_USER[1], "display_name": _DEMO_USER[2]}
+    now = datetime.now(timezone.utc)
+    phrase = _Phrases(rng)
+    convos: list[ConversationData] = []
+    messages: dict[str, list[MessageData]] = {}
+    for idx, other in enumerate(rng.sample(users, min(count, len(users)))):
+        convo_id = f"synthconvo{idx:06d}"
+        started = rng.uniform(60, 60 * 24 * 30)
+        total = rng.randint(3, 80)
+        msgs = []
+        for i in range(total):
+            sender = _DEMO_USER if rng.random() < 0.5 else other
+            msgs.append(MessageData(
+                id=f"{convo_id}_msg{i:05d}",
+                convo_id=convo_id,
+                sender_did=sender[0],
+                sender_handle=sender[1],
+                sender_display_name=sender[2],
+                text=phrase(2, 30),
+                sent_at=(now - timedelta(minutes=started * (1 - i / total))).isoformat(),
+                is_mine=sender is _DEMO_USER,
+            ))
+        convos.append(ConversationData(
+            id=convo_id,
+            members=[me, {"did": other[0], "handle": other[1], "display_name": other[2]}],
+            last_message=msgs[-1],
+            unread_count=rng.choice([0, 0, 0, 1, 2, 5]),
+            muted=False,
+        ))
+        messages[convo_id] = msgs
+    convos.sort(key=lambda c: c.last_message.sent_at, reverse=True)
+    return convos, messages
+
+
 # ---------------------------------------------------------------------------
 # DemoClient
 # ---------------------------------------------------------------------------
 
 class DemoClient:
-    """Drop-in replacement for BlueskyClient that returns mock data."""
+    """Drop-in replacement for BlueskyClient that returns mock data.
+
+    By default it serves a small hand-written dataset, for screenshots. Given
+    *posts* it instead generates that many posts from *users* synthetic
+    accounts, seeded by *seed* so runs are repeatable, for load-testing the
+    UI and caches without a network. Every call can be slowed by a *latency*
+    distribution (overridden per endpoint by *endpoint_latency*) and made to
+    fail with an injected 503 (*error_rate*) or 429 (*rate_limit_rate*).
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        posts: int | None = None,
+        users: int = 500,
+        seed: int = 0,
+        latency: Latency | None = None,
+        endpoint_latency: dict[str, Latency] | None = None,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+    ) -> None:
         did, handle, display = _DEMO_USER
         self.me: ProfileData = ProfileData(
             did=did,
@@ -296,10 +557,74 @@ class DemoClient:
             is_following=False,
             follow_uri=None,
         )
-        self._posts = _build_posts()
-        self._profiles = _build_profiles()
-        self._notifications = _build_notifications(self._posts)
-        self._conversations, self._messages = _build_conversations_and_messages(did)
+        self.synthetic = posts is not None
+        if self.synthetic:
+            rng = random.Random(seed)
+            synthetic_users = _synthetic_users(rng, users)
+            self._posts = _synthetic_posts(rng, synthetic_users, posts)
+            self._profiles = _synthetic_profiles(rng, synthetic_users)
+            self._profiles[did] = self.me
+            self._notifications = _synthetic_notifications(rng, synthetic_users, self._posts, max(30, posts // 10))
+            self._conversations, self._messages = _synthetic_conversations(rng, synthetic_users, 40)
+        else:
+            self._posts = _build_posts()
+            self._profiles = _build_profiles()
+            self._notifications = _build_notifications(self._posts)
+            self._conversations, self._messages = _build_conversations_and_messages(did)
+        self._index()
+
+        self.latency = latency or Latency()
+        self.endpoint_latency = endpoint_latency or {}
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        # Separate from the data seed so changing fault settings keeps the same data
+        self._faults = random.Random(seed + 1)
+
+        self.thread_cache = ThreadCache()
+        self.profile_cache = ProfileCache()
+        self.writes = WriteQueue(self._apply_writes, lambda: self.me.did)
+        self.scheduler = RequestScheduler()
+        self.metrics = ClientMetrics()
+        self.resilience = Resilience(self.metrics, self.scheduler)
+        self.search_index = SearchIndex()
+
+    def _index(self) -> None:
+        self._by_uri: dict[str, PostData] = {p.uri: p for p in self._posts}
+        self._by_author: dict[str, list[PostData]] = {}
+        self._replies: dict[str, list[PostData]] = {}
+        for post in self._posts:
+            self._by_author.setdefault(post.author_did, []).append(post)
+            if post.reply_parent_uri:
+                self._replies.setdefault(post.reply_parent_uri, []).append(post)
+        for replies in self._replies.values():
+            replies.reverse()  # oldest reply first, as the AppView orders them
+        self._by_handle: dict[str, ProfileData] = {p.handle: p for p in self._profiles.values()}
+
+    async def _call(self, endpoint: str) -> None:
+        """Simulate one XRPC round trip: a sampled delay, then maybe an injected failure."""
+        self.metrics.requests += 1
+        start = time.perf_counter()
+        try:
+            delay = self.endpoint_latency.get(endpoint, self.latency).sample(self._faults)
+            if delay:
+                await asyncio.sleep(delay)
+            roll = self._faults.random()
+            if roll < self.rate_limit_rate:
+                raise StatusError(429, "RateLimitExceeded")
+            if roll < self.rate_limit_rate + self.error_rate:
+                raise StatusError(503, "Service Unavailable")
+        except asyncio.CancelledError:
+            self.metrics.record_cancel(endpoint)
+            raise
+        except Exception:
+            self.metrics.errors += 1
+            self.metrics.record_call(endpoint, time.perf_counter() - start, ok=False)
+            raise
+        self.metrics.record_call(endpoint, time.perf_counter() - start, ok=True)
+
+    async def _read(self, endpoint: str) -> None:
+        """Like _call, for reads: retried and circuit-broken as BlueskyClient's are."""
+        await self.resilience.run(endpoint, lambda: self._call(endpoint))
 
     # -- Auth ---------------------------------------------------------------
 
@@ -311,33 +636,62 @@ class DemoClient:
     async def get_timeline(
         self, cursor: str | None = None, limit: int = 30,
     ) -> tuple[list[PostData], str | None]:
+        await self._read("app.bsky.feed.getTimeline")
         start = int(cursor) if cursor else 0
         end = start + limit
         chunk = self._posts[start:end]
         next_cursor = str(end) if end < len(self._posts) else None
+        chunk = mutes.current().visible(chunk, self.me.did)
+        self.search_index.add_posts(chunk)
         return chunk, next_cursor
 
     async def get_author_feed(
         self, did: str, cursor: str | None = None, limit: int = 30,
     ) -> tuple[list[PostData], str | None]:
-        user_posts = [p for p in self._posts if p.author_did == did]
+        await self._read("app.bsky.feed.getAuthorFeed")
+        user_posts = self._by_author.get(did, [])
         start = int(cursor) if cursor else 0
         end = start + limit
         chunk = user_posts[start:end]
         next_cursor = str(end) if end < len(user_posts) else None
+        chunk = mutes.current().visible(chunk, self.me.did)
+        self.search_index.add_posts(chunk)
         return chunk, next_cursor
 
     # -- Threads ------------------------------------------------------------
 
-    async def get_post_thread(self, uri: str) -> ThreadData:
-        # Find the requested post
-        main = None
-        for p in self._posts:
-            if p.uri == uri:
-                main = p
-                break
+    def _reply_nodes(self, uri: str, depth: int) -> list[ThreadNode]:
+        return [
+            ThreadNode(
+                post=reply,
+                replies=self._reply_nodes(reply.uri, depth - 1) if depth > 1 else [],
+                replies_loaded=depth > 1,
+            )
+            for reply in self._replies.get(uri, [])
+        ]
+
+    def _synthetic_thread(self, uri: str, depth: int) -> ThreadData:
+        main = self._by_uri.get(uri)
         if main is None:
-            main = self._posts[0]
+            raise StatusError(400, "NotFound: Post not found")
+        parents = []
+        parent_uri = main.reply_parent_uri
+        while parent_uri in self._by_uri and len(parents) < 10:
+            parent = self._by_uri[parent_uri]
+            parents.insert(0, parent)
+            parent_uri = parent.reply_parent_uri
+        replies = mutes.current().visible_nodes(self._reply_nodes(uri, depth), self.me.did)
+        return ThreadData(parents=parents, post=main, replies=replies)
+
+    async def get_post_thread(self, uri: str, depth: int = 1) -> ThreadData:
+        await self._read("app.bsky.feed.getPostThread")
+        if self.synthetic:
+            thread = self._synthetic_thread(uri, depth)
+            self.thread_cache.put(uri, thread)
+            self.search_index.add_thread(thread)
+            return thread
+
+        main = self._by_uri.get(uri, self._posts[0])
 
         # Build a parent post
         p_did, p_handle, p_display = _USERS[0]
@@ -367,100 +721,109 @@ class DemoClient:
             has_video=False,
         )
 
-        # Build reply posts
-        replies: list[PostData] = []
-        reply_defs = [
-            (2, "Totally agree with this. Well said!", 12, 1, 0),
-            (4, "Counter-point: I think there's more nuance here than people realize. But overall yes.", 8, 0, 1),
-            (6, "Thanks for sharing this perspective. Bookmarked.", 5, 0, 0),
+        replies = [
+            ThreadNode(post=_reply_post(i, u_idx, text, likes, rp, rc, main.uri, main.author_handle, parent.uri))
+            for i, (u_idx, text, likes, rp, rc) in enumerate(_THREAD_REPLY_DEFS)
         ]
-        for i, (u_idx, text, likes, rp, rc) in enumerate(reply_defs):
-            r_did, r_handle, r_display = _USERS[u_idx]
-            replies.append(PostData(
-                uri=_uri(r_did, f"thread_reply{i}"),
-                cid=f"bafyreithreadreply{i}",
-                author_did=r_did,
-                author_handle=r_handle,
-                author_display_name=r_display,
-                text=text,
-                created_at=_ts(0.5 + i * 0.3),
-                like_count=likes,
-                repost_count=rp,
-                reply_count=rc,
-                is_liked=False,
-                is_reposted=False,
-                like_uri=None,
-                repost_uri=None,
-                reason_repost_by=None,
-                reply_parent_uri=main.uri,
-                reply_parent_author=main.author_handle,
-                reply_root_uri=parent.uri,
-                embed_type=None,
-                embed_text=None,
-                embed_author=None,
-                has_image=False,
-                has_video=False,
-            ))
-
-        return ThreadData(parents=[parent], post=main, replies=replies)
+        thread = ThreadData(parents=[parent], post=main, replies=mutes.current().visible_nodes(replies, self.me.did))
+        self.thread_cache.put(uri, thread)
+        self.search_index.add_thread(thread)
+        return thread
+
+    async def get_thread_replies(self, uri: str, depth: int = 1) -> list[ThreadNode]:
+        await self._read("app.bsky.feed.getPostThread")
+        if self.synthetic:
+            nodes = self._reply_nodes(uri, depth)
+        # Only the second demo reply has a nested conversation under it
+        elif uri.endswith("/thread_reply1"):
+            parent_handle = _USERS[_THREAD_REPLY_DEFS[1][0]][1]
+            root_uri = _uri(_USERS[0][0], "thread_parent")
+            nodes = [
+                ThreadNode(
+                    post=_reply_post(10 + i, u_idx, text, likes, rp, rc, uri, parent_handle, root_uri),
+                    replies_loaded=True,
+                )
+                for i, (u_idx, text, likes, rp, rc) in enumerate(_NESTED_REPLY_DEFS)
+            ]
+        else:
+            return []
+        nodes = mutes.current().visible_nodes(nodes, self.me.did)
+        self.search_index.add_thread_nodes(nodes)
+        return nodes
 
     # -- Profiles -----------------------------------------------------------
 
     async def get_profile(self, handle_or_did: str) -> ProfileData:
-        if handle_or_did in self._profiles:
-            return self._profiles[handle_or_did]
-        # Lookup by handle
-        for prof in self._profiles.values():
-            if prof.handle == handle_or_did:
-                return prof
+        await self._read("app.bsky.actor.getProfile")
+        profile = self._profiles.get(handle_or_did) or self._by_handle.get(handle_or_did)
+        if profile:
+            return profile
         # Fallback to first non-demo user
-        return list(self._profiles.values())[1]
+        return next(p for p in self._profiles.values() if p.did != self.me.did)
 
     # -- Notifications ------------------------------------------------------
 
     async def get_notifications(
         self, cursor: str | None = None,
     ) -> tuple[list[NotificationData], str | None]:
+        await self._read("app.bsky.notification.listNotifications")
         start = int(cursor) if cursor else 0
         end = start + 30
         chunk = self._notifications[start:end]
         next_cursor = str(end) if end < len(self._notifications) else None
+        self.search_index.add_notifications(chunk)
         return chunk, next_cursor
 
     async def mark_notifications_read(self) -> None:
-        pass
+        await self._call("app.bsky.notification.updateSeen")
 
     # -- Actions (no-ops with fake URIs) ------------------------------------
 
-    async def like(self, uri: str, cid: str) -> str:
-        return f"at://{_DEMO_USER[0]}/app.bsky.feed.like/{uuid.uuid4().hex[:12]}"
+    def like(self, uri: str, cid: str, rkey: str | None = None) -> PendingWrite:
+        self.thread_cache.invalidate_post(uri)
+        return self.writes.create("app.bsky.feed.like", {"subject": uri}, subject=uri, rkey=rkey)
 
-    async def unlike(self, like_uri: str) -> None:
-        pass
+    def unlike(self, like_uri: str, subject_uri: str | None = None) -> PendingWrite:
+        if subject_uri:
+            self.thread_cache.invalidate_post(subject_uri)
+        return self.writes.delete(like_uri, subject=subject_uri)
 
-    async def repost(self, uri: str, cid: str) -> str:
-        return f"at://{_DEMO_USER[0]}/app.bsky.feed.repost/{uuid.uuid4().hex[:12]}"
+    def repost(self, uri: str, cid: str) -> PendingWrite:
+        self.thread_cache.invalidate_post(uri)
+        return self.writes.create("app.bsky.feed.repost", {"subject": uri}, subject=uri)
 
-    async def unrepost(self, repost_uri: str) -> None:
-        pass
+    def unrepost(self, repost_uri: str, subject_uri: str | None = None) -> PendingWrite:
+        if subject_uri:
+            self.thread_cache.invalidate_post(subject_uri)
+        return self.writes.delete(repost_uri, subject=subject_uri)
 
-    async def follow(self, did: str) -> str:
-        return f"at://{_DEMO_USER[0]}/app.bsky.graph.follow/{uuid.uuid4().hex[:12]}"
+    def follow(self, did: str) -> PendingWrite:
+        return self.writes.create("app.bsky.graph.follow", {"subject": did}, subject=did)
 
-    async def unfollow(self, follow_uri: str) -> None:
-        pass
+    def unfollow(self, follow_uri: str, subject_did: str | None = None) -> PendingWrite:
+        return self.writes.delete(follow_uri, subject=subject_did)
+
+    async def _apply_writes(self, repo: str, writes: list[PendingWrite]) -> list[str | None]:
+        await self._call("com.atproto.repo.applyWrites")
+        return [w.uri if w.action == "create" else None for w in writes]
 
     async def delete_post(self, uri: str) -> None:
-        pass
+        await self._call("com.atproto.repo.deleteRecord")
+        self.thread_cache.invalidate_post(uri)
+        self.search_index.remove(uri)
 
     async def create_post(
         self,
         text: str,
         reply_to: PostData | None = None,
         quote: PostData | None = None,
+        rkey: str | None = None,
     ) -> PostData:
-        new_rkey = uuid.uuid4().hex[:12]
-        return PostData(
+        await self._call("com.atproto.repo.createRecord")
+        if reply_to:
+            self.thread_cache.invalidate_post(reply_to.uri)
+        new_rkey = rkey or next_tid()
+        post = PostData(
             uri=_uri(_DEMO_USER[0], new_rkey),
             cid=f"bafyrei{new_rkey}",
             author_did=self.me.did,
@@ -484,9 +847,14 @@ class DemoClient:
             embed_author=None,
             has_image=False,
             has_video=False,
+            langs=("en",),
+            flags=PostFlags.QUOTE if quote else PostFlags.NONE,
         )
+        self.search_index.add_posts([post])
+        return post
 
     async def resolve_repost_uri(self, repost_uri: str) -> str | None:
+        await self._read("com.atproto.repo.getRecord")
         return self._posts[0].uri if self._posts else None
 
     # -- Direct Messages ----------------------------------------------------
@@ -494,15 +862,18 @@ class DemoClient:
     async def list_conversations(
         self, cursor: str | None = None,
     ) -> tuple[list[ConversationData], str | None]:
+        await self._read("chat.bsky.convo.listConvos")
         start = int(cursor) if cursor else 0
         end = start + 20
         chunk = self._conversations[start:end]
         next_cursor = str(end) if end < len(self._conversations) else None
+        self.search_index.add_conversations(chunk)
         return chunk, next_cursor
 
     async def get_messages(
         self, convo_id: str, cursor: str | None = None,
     ) -> tuple[list[MessageData], str | None]:
+        await self._read("chat.bsky.convo.getMessages")
         all_msgs = self._messages.get(convo_id, [])
         # Messages stored oldest-first; API would return newest-first then reversed
         # For demo, just paginate from end
@@ -510,9 +881,11 @@ class DemoClient:
         end = start + 50
         chunk = all_msgs[start:end]
         next_cursor = str(end) if end < len(all_msgs) else None
+        self.search_index.add_messages(chunk)
         return chunk, next_cursor
 
     async def send_dm(self, convo_id: str, text: str) -> MessageData:
+        await self._call("chat.bsky.convo.sendMessage")
         msg_id = uuid.uuid4().hex[:12]
         msg = MessageData(
             id=msg_id,
@@ -526,7 +899,8 @@ class DemoClient:
         )
         if convo_id in self._messages:
             self._messages[convo_id].append(msg)
+        self.search_index.add_messages([msg])
         return msg
 
     async def mark_convo_read(self, convo_id: str, message_id: str) -> None:
-        pass
+        await self._call("chat.bsky.convo.updateRead")
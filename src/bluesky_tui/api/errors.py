@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from atproto_client import exceptions as atproto_exceptions
+
+# Gateway and server errors worth retrying; the request may succeed on another backend
+TRANSIENT_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised without contacting the server while its circuit breaker is open."""
+
+
+class StatusError(Exception):
+    """An error response with an HTTP status, raised by clients that don't go through atproto."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def status_code_of(exc: BaseException) -> int | None:
+    """HTTP status of the response that carried *exc*, if one arrived."""
+    if isinstance(exc, StatusError):
+        return exc.status_code
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_network_error(exc: BaseException) -> bool:
+    """True when *exc* means the server could not be reached at all (we are offline)."""
+    if isinstance(exc, atproto_exceptions.NetworkError):
+        # NetworkError is also raised for some status codes; those did reach the server
+        return status_code_of(exc) is None
+    return isinstance(exc, (ConnectionError, TimeoutError))
+
+
+def is_already_exists(exc: BaseException) -> bool:
+    """True when a create failed because a record with that rkey is already in the repo."""
+    return status_code_of(exc) == 400 and "already exists" in str(exc).lower()
+
+
+def is_rejected(exc: BaseException) -> bool:
+    """True when the server refused the request itself; sent again unchanged, it fails the same way.
+
+    Expired sessions (401) and rate limiting (429) are not about the request's content.
+    """
+    status = status_code_of(exc)
+    return status is not None and 400 <= status < 500 and status not in (401, 429)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """True when retrying the same request later may succeed."""
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, atproto_exceptions.InvokeTimeoutError):
+        return True
+    return is_network_error(exc) or status_code_of(exc) in TRANSIENT_STATUSES
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Callable
+
+from bluesky_tui.api.models import ConversationData, NotificationData
+from bluesky_tui.api.scheduler import Priority, request_priority
+
+log = logging.getLogger(__name__)
+
+NOTIFICATIONS = "notifications"
+CONVERSATIONS = "conversations"
+
+
+def _epoch(timestamp: str) -> float:
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+@dataclass(eq=False)
+class InboxEntry:
+    """One notification or conversation from one of the accounts in the inbox."""
+
+    account: str  # handle
+    my_did: str
+    key: str  # account-qualified notification URI or conversation id
+    timestamp: str
+    notification: NotificationData | None = None
+    conversation: ConversationData | None = None
+
+    @property
+    def order(self) -> float:
+        # heapq.merge wants ascending keys; newest first
+        return -_epoch(self.timestamp)
+
+
+def _notification_entries(handle: str, my_did: str, notifications: list[NotificationData]) -> list[InboxEntry]:
+    return [
+        InboxEntry(handle, my_did, f"{handle}:{n.uri}", n.created_at, notification=n)
+        for n in notifications
+    ]
+
+
+def _conversation_entries(handle: str, my_did: str, convos: list[ConversationData]) -> list[InboxEntry]:
+    return [
+        InboxEntry(handle, my_did, f"{handle}:{c.id}", c.last_message.sent_at, conversation=c)
+        for c in convos
+        if c.last_message
+    ]
+
+
+class InboxAggregator:
+    """Notifications and conversations of several accounts, merged newest first.
+
+    Accounts are fetched at most *max_concurrent* at a time, each with its
+    own cursors, and results are folded into ``entries`` as they arrive.
+    Accounts without a client are signed in, and *on_login* is called with
+    each new client so it can be kept for next time.
+    """
+
+    def __init__(self, max_concurrent: int = 3, on_login: Callable[[object], None] | None = None) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._on_login = on_login
+        self.clients: dict[str, object] = {}  # handle -> logged-in client
+        self._logins: dict[str, asyncio.Task] = {}
+        self.cursors: dict[tuple[str, str], str | None] = {}  # (handle, kind) -> next page
+        self.errors: dict[tuple[str, str], str] = {}
+        self.entries: list[InboxEntry] = []
+
+    def add_client(self, handle: str, client) -> None:
+        self.clients[handle] = client
+
+    def has_more(self) -> bool:
+        return any(self.cursors.values())
+
+    async def _ensure_client(self, handle: str, app_password: str):
+        if handle in self.clients:
+            return self.clients[handle]
+        # Both of an account's fetches wait on the same login
+        if handle not in self._logins:
+            self._logins[handle] = asyncio.ensure_future(self._login(handle, app_password))
+        try:
+            return await asyncio.shield(self._logins[handle])
+        except Exception:
+            self._logins.pop(handle, None)
+            raise
+
+    async def _login(self, handle: str, app_password: str):
+        from bluesky_tui.api.client import BlueskyClient
+
+        client = BlueskyClient()
+        await client.login(handle, app_password)
+        self.clients[handle] = client
+        if self._on_login:
+            self._on_login(client)
+        return client
+
+    async def _fetch(self, handle: str, app_password: str, kind: str, more: bool) -> list[InboxEntry]:
+        cursor = self.cursors.get((handle, kind)) if more else None
+        if more and not cursor:
+            return []
+        async with self._semaphore:
+            client = await self._ensure_client(handle, app_password)
+            with request_priority(Priority.VISIBLE):
+                if kind == NOTIFICATIONS:
+                    items, next_cursor = await client.get_notifications(cursor=cursor)
+                else:
+                    items, next_cursor = await client.list_conversations(cursor=cursor)
+        # A refresh only looks at the first page; keep the cursor we had for deeper pages
+        if more or (handle, kind) not in self.cursors:
+            self.cursors[(handle, kind)] = next_cursor
+        if kind == NOTIFICATIONS:
+            return _notification_entries(handle, client.me.did, items)
+        return _conversation_entries(handle, client.me.did, items)
+
+    async def poll(self, accounts: list[tuple[str, str]], more: bool = False) -> AsyncIterator[list[InboxEntry]]:
+        """Fetch every account's newest page (or next page, with *more*) concurrently.
+
+        *accounts* holds ``(handle, app_password)`` pairs; the password may be
+        empty for handles that already have a client. Yields each fetch's
+        entries as it completes, ready to be passed to ``merge``.
+        """
+        tasks = [
+            asyncio.ensure_future(self._fetch_reporting(handle, password, kind, more))
+            for handle, password in accounts
+            for kind in (NOTIFICATIONS, CONVERSATIONS)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                batch = await next_done
+                if batch:
+                    yield batch
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_reporting(self, handle: str, app_password: str, kind: str, more: bool) -> list[InboxEntry]:
+        # One account failing (bad password, chat scope missing) mustn't hide the others
+        try:
+            batch = await self._fetch(handle, app_password, kind, more)
+        except Exception as e:
+            log.info("Inbox %s fetch for %s failed: %s", kind, handle, e)
+            self.errors[(handle, kind)] = str(e)
+            return []
+        self.errors.pop((handle, kind), None)
+        return batch
+
+    def merge(self, *batches: list[InboxEntry]) -> tuple[list[int], list[int]]:
+        """K-way merge *batches* into ``entries``.
+
+        Entries already present with the same timestamp are ignored; changed
+        ones (a conversation with a newer message) move. Returns the indexes
+        removed from the old list, highest first, and the indexes of the
+        inserted entries in the new list, lowest first. Applying removals and
+        then insertions in that order turns the old list into the new one.
+        """
+        current = {e.key: e.timestamp for e in self.entries}
+        fresh = [
+            sorted((e for e in batch if current.get(e.key) != e.timestamp), key=lambda e: e.order)
+            for batch in batches
+        ]
+        keys = {e.key for batch in fresh for e in batch}
+        if not keys:
+            return [], []
+        removed = [i for i, e in enumerate(self.entries) if e.key in keys]
+        kept = [e for e in self.entries if e.key not in keys]
+        merged = list(heapq.merge(kept, *fresh, key=lambda e: e.order))
+        inserted_ids = {id(e) for batch in fresh for e in batch}
+        inserted = [i for i, e in enumerate(merged) if id(e) in inserted_ids]
+        self.entries = merged
+        return removed[::-1], inserted
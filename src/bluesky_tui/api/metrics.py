@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import logging.handlers
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+# Latencies kept per endpoint for percentiles
+LATENCY_WINDOW = 1000
+
+
+def percentile(samples, q: float) -> float | None:
+    """The *q*-th percentile (0-100) of *samples*, nearest-rank."""
+    if not samples:
+        return None
+    return _ranked(sorted(samples), q)
+
+
+def _ranked(ordered: list, q: float):
+    return ordered[max(0, min(len(ordered) - 1, round(q / 100 * len(ordered)) - 1))]
+
+
+@dataclass
+class ByteMeter:
+    """Bytes received by the calls made inside a ``metered()`` block."""
+
+    received: int = 0
+
+
+_meter: contextvars.ContextVar[ByteMeter | None] = contextvars.ContextVar("byte_meter", default=None)
+
+
+@contextmanager
+def metered():
+    """Count the bytes that client calls made inside the block receive, in the ByteMeter it yields.
+
+    Tasks started inside the block (a shared in-flight request, a hedged
+    duplicate) count towards it too; joining a request someone else
+    started counts nothing.
+    """
+    meter = ByteMeter()
+    token = _meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _meter.reset(token)
+
+
+@dataclass
+class EndpointStats:
+    """Latency, error and bandwidth figures for one XRPC endpoint."""
+
+    calls: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0  # on the wire, before decompression
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self.latencies)  # once for all three percentiles
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "error_rate": round(self.error_rate, 3),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            **{f"p{q}_ms": round(_ranked(ordered, q) * 1000, 1) if ordered else None for q in (50, 95, 99)},
+        }
+
+
+@dataclass
+class ClientMetrics:
+    """Counters for requests issued through a client."""
+
+    requests: int = 0
+    errors: int = 0
+    cancelled: int = 0  # requests abandoned because their worker was cancelled
+    cancelled_by_endpoint: Counter = field(default_factory=Counter)
+    deduplicated: int = 0  # calls that joined an identical request already in flight
+    deduplicated_by_method: Counter = field(default_factory=Counter)
+    retries: int = 0
+    retries_by_endpoint: Counter = field(default_factory=Counter)
+    hedges: int = 0  # duplicate reads sent because the first was slower than p95
+    hedge_wins: int = 0  # hedged duplicates that answered first
+    circuit_trips: int = 0
+    circuit_rejections: int = 0  # reads failed fast while a circuit was open
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+
+    def endpoint(self, endpoint: str) -> EndpointStats:
+        if endpoint not in self.endpoints:
+            self.endpoints[endpoint] = EndpointStats()
+        return self.endpoints[endpoint]
+
+    def record_call(self, endpoint: str, seconds: float, ok: bool) -> None:
+        stats = self.endpoint(endpoint)
+        stats.calls += 1
+        stats.latencies.append(seconds)
+        if not ok:
+            stats.errors += 1
+
+    def record_bytes(self, endpoint: str, sent: int, received: int) -> None:
+        stats = self.endpoint(endpoint)
+        stats.bytes_sent += sent
+        stats.bytes_received += received
+        meter = _meter.get()
+        if meter is not None:
+            meter.received += received
+
+    def record_cancel(self, endpoint: str) -> None:
+        self.cancelled += 1
+        self.cancelled_by_endpoint[endpoint] += 1
+
+    def record_dedup(self, method: str) -> None:
+        self.deduplicated += 1
+        self.deduplicated_by_method[method] += 1
+
+    def record_retry(self, endpoint: str) -> None:
+        self.retries += 1
+        self.retries_by_endpoint[endpoint] += 1
+
+    def snapshot(self) -> dict:
+        # Not asdict(): that would deep-copy every endpoint's latency samples
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "endpoints"}
+        data["cancelled_by_endpoint"] = dict(self.cancelled_by_endpoint)
+        data["deduplicated_by_method"] = dict(self.deduplicated_by_method)
+        data["retries_by_endpoint"] = dict(self.retries_by_endpoint)
+        data["endpoints"] = {name: stats.snapshot() for name, stats in self.endpoints.items()}
+        return data
+
+
+class MetricsFile:
+    """Appends metrics snapshots as JSON lines, rotating at *max_bytes*."""
+
+    def __init__(self, path: Path, max_bytes: int = 1_000_000, backups: int = 3) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+
+    def write(self, record: dict) -> None:
+        self._handler.emit(logging.makeLogRecord({"msg": json.dumps(record, default=str)}))
+
+    def close(self) -> None:
+        self._handler.close()
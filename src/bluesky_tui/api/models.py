@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntFlag, auto
+
+
+class PostFlags(IntFlag):
+    """Features of a post, worked out once when it is parsed so filters are a mask test."""
+
+    NONE = 0
+    REPOST = auto()
+    REPLY = auto()
+    IMAGE = auto()
+    VIDEO = auto()
+    LINK = auto()
+    QUOTE = auto()
 
 
 @dataclass
@@ -28,6 +41,22 @@ class PostData:
     embed_author: str | None
     has_image: bool
     has_video: bool
+    langs: tuple[str, ...] = ()
+    # LINK and QUOTE come from the parser; the rest follow from the fields above
+    flags: PostFlags = PostFlags.NONE
+
+    def __post_init__(self) -> None:
+        flags = PostFlags(self.flags)
+        if self.reason_repost_by:
+            flags |= PostFlags.REPOST
+        if self.reply_parent_uri:
+            flags |= PostFlags.REPLY
+        if self.has_image:
+            flags |= PostFlags.IMAGE
+        if self.has_video:
+            flags |= PostFlags.VIDEO
+        self.flags = flags
+        self.langs = tuple(self.langs)
 
     @property
     def web_url(self) -> str:
@@ -49,11 +78,25 @@ class ProfileData:
     follow_uri: str | None
 
 
+@dataclass
+class ThreadNode:
+    post: PostData
+    replies: list[ThreadNode] = field(default_factory=list)
+    replies_loaded: bool = False  # False when the server stopped short of this node's replies
+    expanded: bool = False
+
+    @property
+    def can_expand(self) -> bool:
+        if self.replies_loaded:
+            return bool(self.replies)
+        return self.post.reply_count > 0
+
+
 @dataclass
 class ThreadData:
     parents: list[PostData]
     post: PostData | None
-    replies: list[PostData]
+    replies: list[ThreadNode]
 
 
 @dataclass
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import logging
+import math
+import re
+from typing import Iterable
+
+from bluesky_tui.api.cache import TTLCache
+from bluesky_tui.api.models import PostData, ThreadNode
+
+log = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+_HASHTAG = re.compile(r"#(\w+)")
+
+
+class MuteFilter:
+    """The user's muted words, compiled once and checked against each post as it is parsed.
+
+    Each term is a word, a phrase, a ``#hashtag`` or a ``/regex/``, matched
+    case-insensitively; all but regexes match whole words only, and a muted
+    word also mutes its hashtag. Words and hashtags go into sets that the
+    post's tokens are looked up in, and phrases are grouped into one pattern
+    per first word, searched only when that word occurs, so the cost per
+    post grows with its length rather than with the number of terms. Regexes
+    are joined into a single pattern. Verdicts are cached by CID, since a
+    post's content never changes under the same CID.
+    """
+
+    def __init__(self, terms: Iterable[str] = (), cache_size: int = 4096) -> None:
+        words: set[str] = set()
+        hashtags: set[str] = set()
+        phrases: dict[str, list[str]] = {}
+        patterns: list[str] = []
+        for term in terms:
+            term = term.strip()
+            if len(term) > 2 and term.startswith("/") and term.endswith("/"):
+                try:
+                    re.compile(term[1:-1])
+                except re.error as e:
+                    log.warning("Ignoring muted pattern %r: %s", term, e)
+                    continue
+                patterns.append(f"(?:{term[1:-1]})")
+                continue
+            term = term.casefold()
+            if _WORD.fullmatch(term):
+                words.add(term)
+            elif term.startswith("#") and _WORD.fullmatch(term[1:]):
+                hashtags.add(term[1:])
+            elif head := _WORD.search(term):
+                phrases.setdefault(head.group(), []).append(r"\s+".join(map(re.escape, term.split())))
+            elif term:
+                patterns.append(rf"(?<!\w){re.escape(term)}(?!\w)")
+        self._words = frozenset(words)
+        self._hashtags = frozenset(hashtags)
+        self._phrases = {
+            head: re.compile(rf"(?<!\w)(?:{'|'.join(sorted(alts, key=len, reverse=True))})(?!\w)")
+            for head, alts in phrases.items()
+        }
+        self._phrase_heads = frozenset(self._phrases)
+        self._pattern = re.compile("|".join(patterns), re.IGNORECASE) if patterns else None
+        self.verdicts: TTLCache[bool] = TTLCache(maxsize=cache_size, ttl=math.inf)
+
+    def __bool__(self) -> bool:
+        return bool(self._words or self._hashtags or self._phrases or self._pattern)
+
+    def _matches_text(self, text: str) -> bool:
+        folded = text.casefold()
+        if self._words or self._phrases:
+            tokens = set(_WORD.findall(folded))
+            if not self._words.isdisjoint(tokens):
+                return True
+            for head in self._phrase_heads.intersection(tokens):
+                if self._phrases[head].search(folded):
+                    return True
+        if self._hashtags and "#" in folded and not self._hashtags.isdisjoint(_HASHTAG.findall(folded)):
+            return True
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def is_muted(self, post: PostData) -> bool:
+        verdict = self.verdicts.get(post.cid)
+        if verdict is None:
+            verdict = self._matches_text(post.text) or bool(post.embed_text and self._matches_text(post.embed_text))
+            self.verdicts.put(post.cid, verdict)
+        return verdict
+
+    def visible(self, posts: list[PostData], me: str | None = None) -> list[PostData]:
+        """*posts* without the muted ones; the user's own posts (by DID *me*) are always kept."""
+        if not self:
+            return posts
+        return [p for p in posts if p.author_did == me or not self.is_muted(p)]
+
+    def visible_nodes(self, nodes: list[ThreadNode], me: str | None = None) -> list[ThreadNode]:
+        """Thread *nodes* without muted replies, and the replies under them."""
+        if not self:
+            return nodes
+        kept = []
+        for node in nodes:
+            if node.post.author_did != me and self.is_muted(node.post):
+                continue
+            node.replies = self.visible_nodes(node.replies, me)
+            kept.append(node)
+        return kept
+
+
+_current = MuteFilter()
+
+
+def configure(terms: Iterable[str]) -> None:
+    """Mute *terms* (the ``muted_words`` setting) in every client from now on."""
+    global _current
+    _current = MuteFilter(terms)
+
+
+def current() -> MuteFilter:
+    return _current
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from bluesky_tui.api.errors import is_already_exists, is_network_error
+from bluesky_tui.api.models import PostData
+from bluesky_tui.config import CONFIG_DIR
+from bluesky_tui.loop_monitor import offload
+
+OUTBOX_FILE = CONFIG_DIR / "outbox.json"
+
+log = logging.getLogger(__name__)
+
+# How far the chat server's clock may run behind ours when matching a DM that did land
+CLOCK_SKEW = timedelta(minutes=1)
+
+
+def _parse_time(timestamp: str) -> datetime | None:
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class OutboxEntry:
+    id: str  # TID; doubles as the record key for posts and likes so replays are idempotent
+    account: str  # DID of the account that made the write
+    kind: str  # post, like, dm
+    payload: dict
+    queued_at: str
+
+
+class Outbox:
+    """Writes made while offline, persisted on disk and replayed in order once we reconnect."""
+
+    def __init__(self, path: Path = OUTBOX_FILE) -> None:
+        self._path = path
+        self.entries: list[OutboxEntry] = []
+        self._save_lock = asyncio.Lock()
+        self._sending: str | None = None  # id of the entry replay() is sending
+        try:
+            self.entries = [OutboxEntry(**e) for e in json.loads(path.read_text())]
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, TypeError) as e:
+            log.warning("Ignoring unreadable outbox %s: %s", path, e)
+
+    def _write(self, content: str) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(".tmp")
+        tmp.write_text(content)
+        os.replace(tmp, self._path)
+
+    async def _save(self) -> None:
+        # Serialised so a slower, older snapshot can't land over a newer one
+        async with self._save_lock:
+            await offload(self._write, json.dumps([asdict(e) for e in self.entries]))
+
+    async def add(self, entry_id: str, account: str, kind: str, payload: dict) -> OutboxEntry:
+        entry = OutboxEntry(
+            id=entry_id,
+            account=account,
+            kind=kind,
+            payload=payload,
+            queued_at=datetime.now(timezone.utc).isoformat(),
+        )
+        self.entries.append(entry)
+        await self._save()
+        return entry
+
+    async def remove(self, entry: OutboxEntry) -> None:
+        self.entries = [e for e in self.entries if e.id != entry.id]
+        await self._save()
+
+    def pending(self, account: str, kind: str | None = None) -> list[OutboxEntry]:
+        return [e for e in self.entries if e.account == account and (kind is None or e.kind == kind)]
+
+    async def queue_post(self, account: str, rkey: str, text: str, reply_to: PostData | None, quote: PostData | None) -> OutboxEntry:
+        return await self.add(rkey, account, "post", {
+            "text": text,
+            "reply_to": asdict(reply_to) if reply_to else None,
+            "quote": asdict(quote) if quote else None,
+        })
+
+    async def queue_like(self, account: str, rkey: str, uri: str, cid: str) -> OutboxEntry:
+        return await self.add(rkey, account, "like", {"uri": uri, "cid": cid})
+
+    async def discard_like(self, account: str, rkey: str, uri: str) -> bool:
+        """Drop a queued like of *uri* (or with record key *rkey*) that hasn't been sent yet.
+
+        Returns False if there is none, or if replay() is sending it right now;
+        the caller must then delete the like on the server.
+        """
+        for entry in self.pending(account, "like"):
+            if (entry.id == rkey or entry.payload["uri"] == uri) and entry.id != self._sending:
+                await self.remove(entry)
+                return True
+        return False
+
+    async def queue_dm(self, account: str, entry_id: str, convo_id: str, text: str, attempted_at: str) -> OutboxEntry:
+        """Queue a DM whose first send, started at *attempted_at*, failed."""
+        return await self.add(entry_id, account, "dm", {"convo_id": convo_id, "text": text, "attempted_at": attempted_at})
+
+    async def replay(self, client) -> tuple[int, list[str]]:
+        """Send the pending writes of *client*'s account, oldest first.
+
+        Stops at the first network error so order is preserved for the next
+        attempt. Writes the server rejects are dropped and reported.
+
+        Returns the number of writes sent and a description of each rejected one.
+        """
+        if not client.me:
+            return 0, []
+        sent = 0
+        rejected: list[str] = []
+        for entry in self.pending(client.me.did):
+            if entry not in self.entries:
+                continue  # discarded while an earlier entry was being sent
+            self._sending = entry.id
+            try:
+                await self._send(client, entry)
+            except Exception as e:
+                if is_network_error(e):
+                    break
+                if not is_already_exists(e):
+                    log.warning("Outbox %s %s rejected: %s", entry.kind, entry.id, e)
+                    rejected.append(f"{entry.kind}: {e}")
+                    await self.remove(entry)
+                    continue
+            finally:
+                self._sending = None
+            sent += 1
+            await self.remove(entry)
+        return sent, rejected
+
+    async def _send(self, client, entry: OutboxEntry) -> None:
+        p = entry.payload
+        if entry.kind == "post":
+            await client.create_post(
+                p["text"],
+                reply_to=PostData(**p["reply_to"]) if p["reply_to"] else None,
+                quote=PostData(**p["quote"]) if p["quote"] else None,
+                rkey=entry.id,
+            )
+        elif entry.kind == "like":
+            await client.like(p["uri"], p["cid"], rkey=entry.id)
+        elif entry.kind == "dm":
+            # chat.bsky has no idempotency key; skip if an earlier attempt did land.
+            # Entries queued before attempted_at was recorded fall back to queued_at.
+            attempted = _parse_time(p.get("attempted_at") or entry.queued_at)
+            since = attempted - CLOCK_SKEW if attempted else None
+            recent, _ = await client.get_messages(p["convo_id"])
+            for m in recent:
+                if m.is_mine and m.text == p["text"]:
+                    sent = _parse_time(m.sent_at)
+                    if since is None or (sent is not None and sent >= since):
+                        return
+            await client.send_dm(p["convo_id"], p["text"])
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from bluesky_tui.api.metrics import metered
+from bluesky_tui.api.scheduler import Priority, request_priority
+
+log = logging.getLogger(__name__)
+
+# Reserved for a prefetch before any response size has been measured
+DEFAULT_RESPONSE_BYTES = 30_000
+
+
+@dataclass
+class _Charge:
+    at: float
+    bytes: int  # reserved while in flight, then what the response actually took
+
+
+class ThreadPrefetcher:
+    """Speculatively warms a client's thread cache for the post the user is resting on.
+
+    At most *max_concurrent* prefetches run at once across the whole app, and
+    no new prefetch starts once *byte_budget* bytes have been spent within the
+    last *window* seconds. Each prefetch reserves a typical response's size
+    when it starts, so prefetches in flight count too, and is charged the
+    bytes its response measured on the wire once it ends.
+    """
+
+    def __init__(self, max_concurrent: int = 2, byte_budget: int = 512_000, window: float = 60.0) -> None:
+        self.max_concurrent = max_concurrent
+        self.byte_budget = byte_budget
+        self.window = window
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._spent: deque[_Charge] = deque()
+        self.typical_bytes = DEFAULT_RESPONSE_BYTES  # running average of measured responses
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.skipped = 0
+
+    def _budget_left(self) -> int:
+        cutoff = time.monotonic() - self.window
+        while self._spent and self._spent[0].at < cutoff:
+            self._spent.popleft()
+        return self.byte_budget - sum(charge.bytes for charge in self._spent)
+
+    def prefetch(self, client, uri: str) -> None:
+        """Start warming *uri*, cancelling any prefetch for a post the user has moved past."""
+        self.cancel(keep=uri)
+        if uri in self._tasks or uri in client.thread_cache:
+            return
+        if self._budget_left() < self.typical_bytes:
+            self.skipped += 1
+            return
+        # Prefetch is optional; don't spend rate-limit budget the user may need
+        if not client.scheduler.admits(Priority.PREFETCH):
+            client.scheduler.skip(Priority.PREFETCH)
+            self.skipped += 1
+            return
+        self.started += 1
+        charge = _Charge(time.monotonic(), self.typical_bytes)
+        self._spent.append(charge)
+        task = asyncio.create_task(self._run(client, uri, charge))
+        self._tasks[uri] = task
+        task.add_done_callback(lambda _: self._tasks.pop(uri, None))
+
+    def cancel(self, keep: str | None = None) -> None:
+        for uri, task in list(self._tasks.items()):
+            if uri != keep:
+                task.cancel()
+
+    async def _run(self, client, uri: str, charge: _Charge) -> None:
+        with metered() as meter:
+            try:
+                async with self._semaphore:
+                    with request_priority(Priority.PREFETCH):
+                        await client.get_post_thread(uri)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            except Exception as e:
+                log.debug("Prefetch of %s failed: %s", uri, e)
+                return
+            finally:
+                charge.bytes = meter.received
+        self.completed += 1
+        if meter.received:
+            self.typical_bytes = (3 * self.typical_bytes + meter.received) // 4
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import base64
+import gzip
+import json
+import logging
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+
+import httpx
+
+from bluesky_tui.api import transport
+
+log = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+# Dropped when recording: the body is stored decoded, and cookies aren't needed to replay
+_SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"})
+_SESSION_ENDPOINTS = ("com.atproto.server.createSession", "com.atproto.server.refreshSession")
+# Replayed tokens stay valid this long, so the client never tries to refresh them
+_TOKEN_LIFETIME = 10 * 365 * 24 * 3600
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def fake_jwt(claims: dict) -> str:
+    """An unsigned JWT carrying *claims*; enough for a client that only reads the payload."""
+    header = _b64url(json.dumps({"alg": "none", "typ": "JWT"}).encode())
+    payload = _b64url(json.dumps(claims).encode())
+    return f"{header}.{payload}.{_b64url(b'unsigned')}"
+
+
+def _jwt_claims(token: str) -> dict:
+    try:
+        payload = token.split(".")[1]
+        return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return {}
+
+
+def _redact_session(body: bytes) -> bytes:
+    """Swap the real tokens in a session response for unsigned long-lived ones."""
+    try:
+        session = json.loads(body)
+    except ValueError:
+        return body
+    for field in ("accessJwt", "refreshJwt"):
+        if field in session:
+            claims = _jwt_claims(session[field])
+            claims["exp"] = int(time.time()) + _TOKEN_LIFETIME
+            session[field] = fake_jwt(claims)
+    return json.dumps(session).encode()
+
+
+def _key(method: str, url: httpx.URL) -> str:
+    # The host is left out: the PDS, AppView and chat proxy may differ between sessions
+    query = sorted(url.params.multi_items())
+    return f"{method} {url.path}?{httpx.QueryParams(query)}"
+
+
+class _Interceptor(httpx.AsyncBaseTransport):
+    # Stands in for the shared pool, which outlives the clients that "close" it
+    async def aclose(self) -> None:
+        pass
+
+    async def close_pool(self) -> None:
+        pass
+
+
+class RecordingTransport(_Interceptor):
+    """Forwards requests to *inner* and appends every XRPC exchange to a gzipped JSON-lines archive.
+
+    Bodies are stored decoded, with how long each response took. Tokens in
+    session responses are replaced before they are written; everything else,
+    direct messages included, is stored as received. Each exchange is
+    flushed to disk as it is written, so a session that crashes or is killed
+    can still be replayed up to that point; the archive is closed at exit.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, path: Path) -> None:
+        self._inner = inner
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(path, "wb")
+        atexit.register(self._close)
+        self._started = time.monotonic()
+        self._write({"version": ARCHIVE_VERSION, "recorded_at": time.time()})
+
+    def _write(self, record: dict) -> None:
+        self._file.write((json.dumps(record) + "\n").encode())
+        # Complete the compressed block so everything so far can be read back without the trailer
+        self._file.flush(zlib.Z_SYNC_FLUSH)
+
+    def _close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            log.info("Recorded session to %s", self.path)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        sent = time.monotonic()
+        response = await self._inner.handle_async_request(request)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        elapsed = time.monotonic() - sent
+        if request.url.path.rsplit("/", 1)[-1] in _SESSION_ENDPOINTS:
+            body = _redact_session(body)
+        headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _SKIPPED_HEADERS]
+        self._write({
+            "key": _key(request.method, request.url),
+            "offset": round(sent - self._started, 4),
+            "elapsed": round(elapsed, 4),
+            "status": response.status_code,
+            "headers": headers,
+            "body": base64.b64encode(body).decode(),
+        })
+        return httpx.Response(response.status_code, headers=headers, content=body, extensions=response.extensions)
+
+    async def close_pool(self) -> None:
+        self._close()
+        atexit.unregister(self._close)
+        await self._inner.close_pool()
+
+
+class ReplayTransport(_Interceptor):
+    """Answers requests from a recorded archive instead of the network.
+
+    Requests are matched on method, path and query. Repeats of the same
+    request get the recorded responses in order, and the last one once those
+    run out. Each response is delayed by its recorded duration times
+    *time_scale* (0 answers at once). Requests missing from the archive get
+    a 501 XRPC error.
+    """
+
+    def __init__(self, path: Path, time_scale: float = 1.0) -> None:
+        self.path = path
+        self.time_scale = time_scale
+        self._responses: dict[str, deque[dict]] = {}
+        self.misses = 0
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"{path}: unsupported archive version {header.get('version')}")
+            try:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break  # cut off mid-write
+                    entry = json.loads(line)
+                    self._responses.setdefault(entry["key"], deque()).append(entry)
+            except EOFError:
+                # The recording session never closed the archive (it crashed or was killed)
+                log.warning("%s was not closed cleanly; replaying the %d exchanges before its end", path, len(self))
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._responses.values())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        key = _key(request.method, request.url)
+        entries = self._responses.get(key)
+        if not entries:
+            self.misses += 1
+            log.debug("No recorded response for %s", key)
+            return httpx.Response(
+                501,
+                json={"error": "NotRecorded", "message": f"{key} is not in {self.path.name}"},
+                request=request,
+            )
+        entry = entries.popleft() if len(entries) > 1 else entries[0]
+        if self.time_scale:
+            await asyncio.sleep(entry["elapsed"] * self.time_scale)
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body"]),
+            request=request,
+        )
+
+
+def record_to(path: Path) -> None:
+    """Record every request the clients make from now on to *path*."""
+    transport.intercept(lambda inner: RecordingTransport(inner, path))
+
+
+def replay_from(path: Path, time_scale: float = 1.0) -> None:
+    """Serve every request from the archive at *path* instead of the network."""
+    transport.intercept(lambda inner: ReplayTransport(path, time_scale))
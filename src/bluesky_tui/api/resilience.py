@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from bluesky_tui.api.errors import CircuitOpenError, is_transient
+from bluesky_tui.api.metrics import ClientMetrics
+from bluesky_tui.api.scheduler import RequestScheduler, current_priority
+
+log = logging.getLogger(__name__)
+
+# Latencies kept per endpoint, and how many are needed before hedging kicks in
+LATENCY_SAMPLES = 200
+MIN_SAMPLES_TO_HEDGE = 20
+
+
+def _service(endpoint: str) -> str:
+    # Chat calls are proxied to a different service than the AppView
+    return "chat" if endpoint.startswith("chat.") else "appview"
+
+
+class CircuitBreaker:
+    """Fails calls fast after *threshold* consecutive transient failures.
+
+    Once *cooldown* seconds have passed a single probe call is let through;
+    its outcome closes the circuit again or restarts the cooldown.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def retry_in(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown - time.monotonic())
+
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        if not self._probing and self.retry_in() == 0:
+            self._probing = True
+            return True
+        return False
+
+    def abandon_probe(self) -> None:
+        """Let the next caller probe after this one was cancelled without an outcome."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a transient failure; return True if it opened the circuit."""
+        self.failures += 1
+        if self._probing or (self._opened_at is None and self.failures >= self.threshold):
+            self._opened_at = time.monotonic()
+            self._probing = False
+            return True
+        return False
+
+
+class Resilience:
+    """Retries, hedging and circuit breaking for idempotent (read-only) calls.
+
+    Transient failures are retried up to *attempts* times with full-jitter
+    exponential backoff. When *hedge* is on and a call is slower than its
+    endpoint's recent p95 latency, a duplicate is sent and whichever answers
+    first wins, provided the scheduler has budget to spare for it.
+    """
+
+    def __init__(
+        self,
+        metrics: ClientMetrics,
+        scheduler: RequestScheduler,
+        attempts: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 2.0,
+        hedge: bool = True,
+    ) -> None:
+        self.metrics = metrics
+        self.scheduler = scheduler
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._latencies: dict[str, deque[float]] = {}
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        service = _service(endpoint)
+        if service not in self.breakers:
+            self.breakers[service] = CircuitBreaker()
+        return self.breakers[service]
+
+    def p95(self, endpoint: str) -> float | None:
+        samples = self._latencies.get(endpoint)
+        if not samples or len(samples) < MIN_SAMPLES_TO_HEDGE:
+            return None
+        ordered = sorted(samples)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def run(self, endpoint: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        breaker = self._breaker(endpoint)
+        for attempt in range(self.attempts):
+            if not breaker.allow():
+                self.metrics.circuit_rejections += 1
+                raise CircuitOpenError(
+                    f"{_service(endpoint)} is not responding; retrying in {breaker.retry_in():.0f}s"
+                )
+            # Let through while open means this call is the half-open probe
+            probe = breaker.is_open
+            try:
+                result = await self._hedged(endpoint, call)
+            except asyncio.CancelledError:
+                if probe:
+                    breaker.abandon_probe()
+                raise
+            except Exception as e:
+                if not is_transient(e):
+                    # The server answered; it's healthy even if it said no
+                    breaker.record_success()
+                    raise
+                if breaker.record_failure():
+                    self.metrics.circuit_trips += 1
+                    log.warning("Circuit for %s opened after %r", _service(endpoint), e)
+                if attempt + 1 == self.attempts or breaker.is_open:
+                    raise
+                self.metrics.record_retry(endpoint)
+                log.debug("Retrying %s after %s", endpoint, e)
+                await asyncio.sleep(self._backoff(attempt))
+            else:
+                breaker.record_success()
+                return result
+
+    async def _timed(self, endpoint: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.monotonic()
+        result = await call()
+        samples = self._latencies.setdefault(endpoint, deque(maxlen=LATENCY_SAMPLES))
+        samples.append(time.monotonic() - start)
+        return result
+
+    async def _hedged(self, endpoint: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        threshold = self.p95(endpoint) if self.hedge else None
+        if threshold is None:
+            return await self._timed(endpoint, call)
+        tasks = {asyncio.ensure_future(self._timed(endpoint, call))}
+        first = next(iter(tasks))
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=threshold)
+            if done or not self.scheduler.admits(current_priority()):
+                return await first
+            self.metrics.hedges += 1
+            hedge = asyncio.ensure_future(self._timed(endpoint, call))
+            tasks.add(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.metrics.hedge_wins += 1
+                        return task.result()
+            return first.result()  # both failed; report the original error
+        finally:
+            for task in tasks:
+                task.cancel()
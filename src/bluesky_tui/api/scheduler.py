@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from enum import IntEnum
+
+import httpx
+
+log = logging.getLogger(__name__)
+
+# Conservative stand-in until the server tells us its real policy
+DEFAULT_LIMIT = 3000
+DEFAULT_WINDOW = 300.0
+# Longest single wait before re-checking the bucket
+MAX_WAIT = 5.0
+
+
+class Priority(IntEnum):
+    BULK = 0  # background sync nobody is looking at
+    PREFETCH = 1  # speculative; may be skipped outright
+    VISIBLE = 2  # refreshing something already on screen
+    INTERACTIVE = 3  # the user is waiting on it
+
+
+# Fraction of the bucket each priority must leave untouched for the ones above it
+RESERVE = {
+    Priority.BULK: 0.4,
+    Priority.PREFETCH: 0.25,
+    Priority.VISIBLE: 0.1,
+    Priority.INTERACTIVE: 0.0,
+}
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar("request_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Issue the client calls made inside the block at *priority*."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+# Routes the server limits on their own terms (sessions, write points), on top
+# of the global per-account limit; their ratelimit-* headers describe that
+# route's policy, not the global one
+ROUTE_LIMITED = frozenset({
+    "com.atproto.server.createSession",
+    "com.atproto.server.refreshSession",
+    "com.atproto.repo.createRecord",
+    "com.atproto.repo.putRecord",
+    "com.atproto.repo.deleteRecord",
+    "com.atproto.repo.applyWrites",
+})
+
+
+class _Bucket:
+    """One rate-limit policy: ``limit`` tokens refilled over ``window`` seconds."""
+
+    def __init__(self, limit: int = DEFAULT_LIMIT, window: float = DEFAULT_WINDOW) -> None:
+        self.limit = limit
+        self.window = window
+        self.tokens = float(limit)
+        self._updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.limit / self.window
+
+    def refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.limit, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def floor(self, priority: Priority) -> float:
+        return self.limit * RESERVE[priority]
+
+    def admits(self, priority: Priority) -> bool:
+        self.refill()
+        return time.monotonic() >= self.blocked_until and self.tokens - 1 >= self.floor(priority)
+
+    def wait(self, priority: Priority) -> float:
+        """Seconds until *priority* may spend a token here, if nothing else spends one."""
+        return max(self.blocked_until - time.monotonic(), (self.floor(priority) + 1 - self.tokens) / self.rate)
+
+    def observe(self, headers: httpx.Headers) -> None:
+        try:
+            limit = int(headers["ratelimit-limit"])
+            remaining = int(headers["ratelimit-remaining"])
+        except (KeyError, ValueError):
+            limit = remaining = None
+        if limit:
+            self.limit = limit
+            policy = headers.get("ratelimit-policy", "")
+            # e.g. "3000;w=300"
+            if ";w=" in policy:
+                try:
+                    self.window = float(policy.split(";w=", 1)[1].split(";")[0])
+                except ValueError:
+                    pass
+        self.refill()
+        if remaining is not None:
+            self.tokens = min(self.tokens, remaining)
+
+
+class RequestScheduler:
+    """Token buckets that follow the server's advertised rate limits.
+
+    The global bucket refills at ``limit / window`` tokens a second and is
+    pulled down to ``ratelimit-remaining`` whenever a response reports it.
+    Routes in ROUTE_LIMITED report their own policy instead, so each gets a
+    bucket of its own, spent alongside the global one. Each priority may
+    only spend down to its RESERVE share of a bucket, so as the budget runs
+    low background work waits while the user's own actions still go
+    through. After a 429 the bucket it came from waits for
+    ``ratelimit-reset``.
+    """
+
+    def __init__(self, limit: int = DEFAULT_LIMIT, window: float = DEFAULT_WINDOW) -> None:
+        self._global = _Bucket(limit, window)
+        self._routes: dict[str, _Bucket] = {}
+        self.delayed: Counter = Counter()  # by priority name
+        self.shed: Counter = Counter()
+        self.rate_limited = 0
+        # Set and cleared on each escalation, waking requests waiting for budget to re-check.
+        # Made on first wait, since an Event belongs to the loop that first waits on it.
+        self._escalated: asyncio.Event | None = None
+        self._escalated_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def limit(self) -> int:
+        return self._global.limit
+
+    @property
+    def window(self) -> float:
+        return self._global.window
+
+    @property
+    def tokens(self) -> float:
+        self._global.refill()
+        return self._global.tokens
+
+    def _buckets(self, endpoint: str | None) -> list[_Bucket]:
+        route = self._routes.get(endpoint) if endpoint in ROUTE_LIMITED else None
+        return [self._global, route] if route else [self._global]
+
+    def admits(self, priority: Priority, endpoint: str | None = None) -> bool:
+        """True if a request at *priority* could start now without waiting."""
+        return all(bucket.admits(priority) for bucket in self._buckets(endpoint))
+
+    def escalate(self, context: contextvars.Context, priority: Priority) -> None:
+        """Raise the priority of the calls made in *context* (a running task's) to *priority*, if higher."""
+        if context.run(_priority.get) < priority:
+            context.run(_priority.set, priority)
+            if self._escalated is not None:
+                self._escalated.set()
+                self._escalated.clear()
+
+    def _escalation(self) -> asyncio.Event:
+        loop = asyncio.get_running_loop()
+        if self._escalated is None or self._escalated_loop is not loop:
+            self._escalated, self._escalated_loop = asyncio.Event(), loop
+        return self._escalated
+
+    def skip(self, priority: Priority) -> None:
+        """Record that optional work at *priority* was dropped for lack of budget."""
+        self.shed[priority.name] += 1
+
+    async def acquire(self, endpoint: str | None = None) -> None:
+        """Wait until the current priority may spend a token on *endpoint*, then spend it."""
+        waited = False
+        # Re-read each time round: a caller waiting on this request may have escalated it
+        while not self.admits(priority := current_priority(), endpoint):
+            if not waited:
+                waited = True
+                self.delayed[priority.name] += 1
+            wait = max(bucket.wait(priority) for bucket in self._buckets(endpoint))
+            try:
+                await asyncio.wait_for(self._escalation().wait(), min(max(wait, 0.05), MAX_WAIT))
+            except asyncio.TimeoutError:
+                pass
+        for bucket in self._buckets(endpoint):
+            bucket.tokens -= 1
+
+    def observe(self, response: httpx.Response) -> None:
+        """Update the bucket of the response's route from its ``ratelimit-*`` headers."""
+        endpoint = response.request.url.path.rsplit("/", 1)[-1]
+        if endpoint in ROUTE_LIMITED:
+            bucket = self._routes.setdefault(endpoint, _Bucket())
+        else:
+            bucket = self._global
+        bucket.observe(response.headers)
+        if response.status_code == 429:
+            self.rate_limited += 1
+            bucket.tokens = 0
+            bucket.blocked_until = time.monotonic() + self._reset_delay(response.headers)
+            log.warning(
+                "Rate limited on %s; holding its requests for %.0fs",
+                endpoint, bucket.blocked_until - time.monotonic(),
+            )
+
+    @staticmethod
+    def _reset_delay(headers: httpx.Headers) -> float:
+        try:
+            # ratelimit-reset is a Unix timestamp on Bluesky's servers
+            return max(0.0, float(headers["ratelimit-reset"]) - time.time())
+        except (KeyError, ValueError):
+            pass
+        try:
+            return float(headers["retry-after"])
+        except (KeyError, ValueError):
+            return MAX_WAIT
+
+    def snapshot(self) -> dict:
+        for bucket in self._routes.values():
+            bucket.refill()
+        return {
+            "limit": self.limit,
+            "window": self.window,
+            "tokens": round(self.tokens, 1),
+            "routes": {
+                endpoint: {"limit": b.limit, "window": b.window, "tokens": round(b.tokens, 1)}
+                for endpoint, b in self._routes.items()
+            },
+            "delayed": dict(self.delayed),
+            "shed": dict(self.shed),
+            "rate_limited": self.rate_limited,
+        }
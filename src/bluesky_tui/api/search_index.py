@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import math
+import re
+import sys
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Union
+
+from bluesky_tui.api.models import ConversationData, MessageData, NotificationData, PostData, ThreadData, ThreadNode
+
+_WORD = re.compile(r"\w+")
+# BM25 term-frequency saturation and length normalisation
+_K1 = 1.2
+_B = 0.75
+# Vocabulary terms a prefix (the word still being typed) expands to, at most,
+# and the shortest prefix that is expanded at all
+MAX_PREFIX_TERMS = 64
+MIN_PREFIX = 2
+# Matches scored per query; broader queries rank only the most recently seen
+MAX_CANDIDATES = 2000
+
+SearchItem = Union[PostData, NotificationData, MessageData]
+
+
+@dataclass
+class SearchResult:
+    kind: str  # post, notification or message
+    item: SearchItem
+    score: float
+
+
+@dataclass
+class _Doc:
+    kind: str
+    item: SearchItem
+    terms: tuple[str, ...]
+    length: int
+    created_at: str
+
+
+def _handle_terms(handle: str, display_name: str) -> list[str]:
+    # The first label of a handle is what people type; "bsky" and "social" would match everyone
+    return _WORD.findall(f"{handle.split('.', 1)[0]} {display_name}".casefold())
+
+
+class SearchIndex:
+    """In-memory inverted index over the posts, notifications and DMs a client has loaded.
+
+    Each document's terms map to postings; queries match documents holding
+    every query word, the last one as a prefix while it is being typed, and
+    rank them by BM25, newest first among equals. At most *max_docs*
+    documents are kept: seeing an item again refreshes it, and the least
+    recently seen are evicted first. Terms are interned and their
+    frequencies kept in the postings, so a document costs little beyond the
+    item it points to.
+    """
+
+    def __init__(self, max_docs: int = 20_000) -> None:
+        self.max_docs = max_docs
+        self._docs: OrderedDict[str, _Doc] = OrderedDict()
+        self._postings: dict[str, dict[str, int]] = {}  # term -> {key: term frequency}
+        self._vocab: list[str] = []  # sorted, for prefix lookups
+        self._total_length = 0
+        # Conversations by id, so message results can be opened
+        self.conversations: dict[str, ConversationData] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def clear(self) -> None:
+        self._docs.clear()
+        self._postings.clear()
+        self._vocab.clear()
+        self._total_length = 0
+        self.conversations.clear()
+
+    def _add(self, key: str, kind: str, item: SearchItem, text: str, author_terms: list[str], created_at: str) -> None:
+        self.remove(key)
+        terms = Counter(map(sys.intern, _WORD.findall(text.casefold())))
+        terms.update(map(sys.intern, author_terms))
+        if not terms:
+            return
+        length = sum(terms.values())
+        self._docs[key] = _Doc(kind, item, tuple(terms), length, created_at)
+        self._total_length += length
+        for term, tf in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._vocab, term)
+            postings[key] = tf
+        while len(self._docs) > self.max_docs:
+            self.remove(next(iter(self._docs)))
+
+    def remove(self, key: str) -> None:
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        self._total_length -= doc.length
+        for term in doc.terms:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+                del self._vocab[bisect.bisect_left(self._vocab, term)]
+
+    def add_posts(self, posts: Iterable[PostData]) -> None:
+        for post in posts:
+            text = f"{post.text} {post.embed_text}" if post.embed_text else post.text
+            author = _handle_terms(post.author_handle, post.author_display_name)
+            self._add(post.uri, "post", post, text, author, post.created_at)
+
+    def add_thread(self, thread: ThreadData) -> None:
+        self.add_posts(p for p in (*thread.parents, thread.post) if p)
+        self.add_thread_nodes(thread.replies)
+
+    def add_thread_nodes(self, nodes: Iterable[ThreadNode]) -> None:
+        for node in nodes:
+            self.add_posts([node.post])
+            self.add_thread_nodes(node.replies)
+
+    def add_notifications(self, notifications: Iterable[NotificationData]) -> None:
+        for n in notifications:
+            # Likes, reposts and follows carry no text of their own
+            if n.text:
+                author = _handle_terms(n.author_handle, n.author_display_name)
+                self._add(f"notification {n.uri}", "notification", n, n.text, author, n.created_at)
+
+    def add_messages(self, messages: Iterable[MessageData]) -> None:
+        for m in messages:
+            author = _handle_terms(m.sender_handle, m.sender_display_name)
+            self._add(f"message {m.convo_id} {m.id}", "message", m, m.text, author, m.sent_at)
+
+    def add_conversations(self, convos: Iterable[ConversationData]) -> None:
+        for convo in convos:
+            self.conversations[convo.id] = convo
+            if convo.last_message:
+                self.add_messages([convo.last_message])
+
+    def _expand(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self._vocab, prefix)
+        terms = []
+        for term in self._vocab[start:start + MAX_PREFIX_TERMS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query: str, limit: int = 50) -> list[SearchResult]:
+        words = _WORD.findall(query.casefold())
+        if not words or not self._docs:
+            return []
+        # The last word is still being typed unless the query ends in a space
+        typing = not query[-1].isspace()
+        groups: list[list[str]] = []
+        for i, word in enumerate(words):
+            if typing and i == len(words) - 1:
+                if len(word) < MIN_PREFIX and groups:
+                    break  # too short to narrow anything down yet
+                terms = self._expand(word) if len(word) >= MIN_PREFIX else []
+            else:
+                terms = [word] if word in self._postings else []
+            if not terms:
+                return []
+            groups.append(terms)
+
+        matches = sorted(
+            (set().union(*(self._postings[t].keys() for t in terms)) for terms in groups),
+            key=len,
+        )
+        candidates = matches[0].intersection(*matches[1:])
+        if len(candidates) > MAX_CANDIDATES:
+            recent = (key for key in reversed(self._docs) if key in candidates)
+            candidates = list(islice(recent, MAX_CANDIDATES))
+
+        count = len(self._docs)
+        average = self._total_length / count
+        idf = {
+            term: math.log(1 + (count - len(self._postings[term]) + 0.5) / (len(self._postings[term]) + 0.5))
+            for terms in groups for term in terms
+        }
+
+        def score(key: str) -> float:
+            doc = self._docs[key]
+            norm = _K1 * (1 - _B + _B * doc.length / average)
+            total = 0.0
+            for terms in groups:
+                best = 0.0
+                for term in terms:
+                    tf = self._postings[term].get(key)
+                    if tf:
+                        best = max(best, idf[term] * tf * (_K1 + 1) / (tf + norm))
+                total += best
+            return total
+
+        scored = ((score(key), self._docs[key].created_at, key) for key in candidates)
+        return [
+            SearchResult(self._docs[key].kind, self._docs[key].item, round(value, 3))
+            for value, _, key in heapq.nlargest(limit, scored)
+        ]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+from bluesky_tui.api.scheduler import RequestScheduler, current_priority
+
+
+@dataclass(eq=False)
+class _Flight:
+    task: asyncio.Task
+    context: contextvars.Context  # the task's, so joining callers can raise its priority
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Lets concurrent identical calls share one in-flight request.
+
+    The request is cancelled only once every caller waiting on it has been
+    cancelled, so a dismissed screen doesn't abort a fetch another screen
+    still needs. The request runs at the highest priority of the callers
+    waiting on it, raised through *scheduler*. *on_shared* is called with the key's name (its first
+    element) each time a caller joins a request already in flight.
+    """
+
+    def __init__(self, scheduler: RequestScheduler, on_shared: Callable[[str], None] | None = None) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+        self._scheduler = scheduler
+        self._on_shared = on_shared
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: tuple, fn: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is None:
+            context = contextvars.copy_context()
+            flight = _Flight(asyncio.get_running_loop().create_task(fn(), context=context), context)
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self._scheduler.escalate(flight.context, current_priority())
+            if self._on_shared:
+                self._on_shared(key[0])
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+def single_flight(method):
+    """Decorate a client read method so identical concurrent calls share one request.
+
+    Calls are keyed by method name and arguments, bound to the method's
+    signature with defaults filled in, so ``get_timeline()``,
+    ``get_timeline(None, 30)`` and ``get_timeline(limit=30)`` share one
+    request. The instance must have a ``flights`` attribute holding a
+    SingleFlight.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(bound.arguments.items())[1:]  # without self
+        key = (method.__name__, arguments)
+        return await self.flights.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
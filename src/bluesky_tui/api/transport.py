@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+import httpx
+from atproto_client.request import AsyncRequest, Response, _parse_response
+
+from bluesky_tui.loop_monitor import offload
+
+log = logging.getLogger(__name__)
+
+# JSON bodies at least this large are decoded on a worker thread
+OFFLOAD_PARSE_BYTES = 256 * 1024
+
+
+@dataclass
+class TransportConfig:
+    max_connections: int = 20
+    max_keepalive: int = 10
+    keepalive_expiry: float = 90.0  # seconds an idle connection is kept open
+    http2: bool = True  # used only when the h2 package is installed
+    service_url: str | None = None  # server clients log in to; None for bsky.social
+
+    @classmethod
+    def from_settings(cls, settings: dict) -> TransportConfig:
+        return cls(
+            max_connections=int(settings.get("http_max_connections", cls.max_connections)),
+            max_keepalive=int(settings.get("http_max_keepalive", cls.max_keepalive)),
+            keepalive_expiry=float(settings.get("http_keepalive_expiry", cls.keepalive_expiry)),
+            http2=bool(settings.get("http2", cls.http2)),
+            service_url=settings.get("service_url") or None,
+        )
+
+
+class TransportStats:
+    """Connection reuse and handshake timings, collected through httpx's ``trace`` extension."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.connections = 0  # new TCP connections opened
+        self.handshakes: deque[float] = deque(maxlen=200)  # TCP + TLS setup, seconds
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests sent over an already-open connection."""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections / self.requests)
+
+    async def on_request(self, request: httpx.Request) -> None:
+        request.extensions["trace"] = self._tracer()
+
+    def _tracer(self):
+        connect_started: list[float] = []
+
+        async def trace(event: str, info: dict) -> None:
+            if event == "connection.connect_tcp.started":
+                connect_started.append(time.perf_counter())
+            elif event == "connection.connect_tcp.complete":
+                self.connections += 1
+            elif event.endswith(".send_request_headers.started"):
+                self.requests += 1
+                if connect_started:
+                    # A new connection is ready once the first request goes out on it
+                    self.handshakes.append(time.perf_counter() - connect_started.pop())
+
+        return trace
+
+    def snapshot(self) -> dict:
+        handshakes = sorted(self.handshakes)
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "reuse_rate": round(self.reuse_rate, 3),
+            "handshake_ms_median": round(handshakes[len(handshakes) // 2] * 1000, 1) if handshakes else None,
+        }
+
+
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    # Individual clients come and go (account switches, the chat proxy);
+    # the pool outlives them and is closed once, at exit.
+    async def aclose(self) -> None:
+        pass
+
+    async def close_pool(self) -> None:
+        await super().aclose()
+
+
+class OffloadingRequest(AsyncRequest):
+    """AsyncRequest that decodes large JSON responses (long threads, full timeline pages) off the event loop."""
+
+    async def get(self, *args, **kwargs) -> Response:
+        return await _parse(await self._send_request("GET", *args, **kwargs))
+
+    async def post(self, *args, **kwargs) -> Response:
+        return await _parse(await self._send_request("POST", *args, **kwargs))
+
+
+async def _parse(response: httpx.Response) -> Response:
+    if len(response.content) < OFFLOAD_PARSE_BYTES:
+        return _parse_response(response)
+    return await offload(_parse_response, response)
+
+
+_config = TransportConfig()
+_transport: httpx.AsyncBaseTransport | None = None
+_interceptor: Callable[[_SharedTransport], httpx.AsyncBaseTransport] | None = None
+stats = TransportStats()
+
+
+def configure(config: TransportConfig) -> None:
+    """Set the pool configuration; takes effect if the pool hasn't been created yet."""
+    global _config
+    if _transport is not None:
+        log.debug("Shared transport already created; new config ignored")
+    _config = config
+
+
+def service_url() -> str | None:
+    """Base URL new clients send XRPC calls to, e.g. a local mock server; None for bsky.social."""
+    return _config.service_url
+
+
+def intercept(factory: Callable[[_SharedTransport], httpx.AsyncBaseTransport]) -> None:
+    """Wrap the pool in *factory(pool)* when it is created, e.g. to record or replay a session.
+
+    The wrapper must provide ``close_pool`` and ignore ``aclose``, as the pool does.
+    """
+    global _interceptor
+    if _transport is not None:
+        log.debug("Shared transport already created; interceptor ignored")
+    _interceptor = factory
+
+
+def shared_transport() -> httpx.AsyncBaseTransport:
+    """The connection pool every BlueskyClient (and its chat proxy) sends through.
+
+    Compression needs nothing here: httpx advertises gzip/deflate, and
+    brotli/zstd when those packages are installed.
+    """
+    global _transport
+    if _transport is None:
+        http2 = _config.http2 and importlib.util.find_spec("h2") is not None
+        pool = _SharedTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=_config.max_connections,
+                max_keepalive_connections=_config.max_keepalive,
+                keepalive_expiry=_config.keepalive_expiry,
+            ),
+        )
+        log.debug("Created shared transport (http2=%s, %s)", http2, _config)
+        _transport = _interceptor(pool) if _interceptor else pool
+    return _transport
+
+
+async def close_shared_transport() -> None:
+    global _transport
+    if _transport is not None:
+        await _transport.close_pool()
+        _transport = None
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from bluesky_tui.api.errors import is_rejected
+from bluesky_tui.api.scheduler import Priority, current_priority, request_priority
+
+_TID_ALPHABET = "234567abcdefghijklmnopqrstuvwxyz"
+_TID_CLOCK_ID = random.randrange(1024)
+_last_tid_micros = 0
+
+
+def next_tid() -> str:
+    """Return a fresh AT Protocol TID (timestamp record key), unique within this process."""
+    global _last_tid_micros
+    _last_tid_micros = max(time.time_ns() // 1000, _last_tid_micros + 1)
+    value = (_last_tid_micros << 10) | _TID_CLOCK_ID
+    return "".join(_TID_ALPHABET[(value >> (5 * i)) & 31] for i in reversed(range(13)))
+
+
+@dataclass(eq=False)
+class PendingWrite:
+    """One queued createRecord/deleteRecord.
+
+    The record URI is known as soon as the write is queued; awaiting the
+    write yields the committed URI, or None for deletes and for writes that
+    were cancelled out by an opposite write before being sent.
+    """
+
+    action: str  # "create" or "delete"
+    uri: str
+    collection: str
+    rkey: str
+    subject: str | None
+    record: Any = None
+    priority: Priority = field(default_factory=current_priority)  # the caller's
+    future: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+    def __await__(self):
+        # Shielded: a dismissed screen must not abort a write the user already made
+        return asyncio.shield(self.future).__await__()
+
+    def resolve(self, uri: str | None) -> None:
+        if not self.future.done():
+            self.future.set_result(uri)
+
+    def fail(self, exc: BaseException) -> None:
+        if not self.future.done():
+            self.future.set_exception(exc)
+            # Callers that went away without awaiting shouldn't log "never retrieved"
+            self.future.exception()
+
+
+CommitFn = Callable[[str, list[PendingWrite]], Awaitable[list[str | None]]]
+
+
+class WriteQueue:
+    """Collects record writes briefly, cancels out opposing pairs, and commits the rest in batches.
+
+    *commit* receives the repo DID and the surviving writes in order and
+    returns one committed URI (or None) per write, e.g. from the results of
+    ``com.atproto.repo.applyWrites``. Each batch is committed at the highest
+    priority of the callers whose writes it carries. A commit is all or
+    nothing, so a batch the server rejects is split in halves and retried
+    until only the writes it refuses fail.
+    """
+
+    def __init__(self, commit: CommitFn, repo: Callable[[], str], delay: float = 0.3, max_batch: int = 50) -> None:
+        self._commit = commit
+        self._repo = repo
+        self.delay = delay
+        self.max_batch = max_batch
+        self._pending: list[PendingWrite] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flushing: asyncio.Task | None = None
+        self.coalesced = 0
+        self.batches = 0
+        self.splits = 0  # rejected batches retried as two halves
+
+    def create(self, collection: str, record: Any, subject: str | None = None, rkey: str | None = None) -> PendingWrite:
+        # Re-creating something whose delete hasn't been sent yet: keep the original record
+        for write in self._pending:
+            if write.action == "delete" and subject and write.subject == subject and write.collection == collection:
+                self._pending.remove(write)
+                write.resolve(None)
+                self.coalesced += 2
+                kept = PendingWrite("create", write.uri, collection, write.rkey, subject, record)
+                kept.resolve(write.uri)
+                return kept
+        rkey = rkey or next_tid()
+        uri = f"at://{self._repo()}/{collection}/{rkey}"
+        return self._enqueue(PendingWrite("create", uri, collection, rkey, subject, record))
+
+    def delete(self, uri: str, subject: str | None = None) -> PendingWrite:
+        collection, rkey = uri.rsplit("/", 2)[-2:]
+        # Deleting a record whose create hasn't been sent yet: drop both
+        for write in self._pending:
+            if write.action == "create" and write.uri == uri:
+                self._pending.remove(write)
+                write.resolve(None)
+                self.coalesced += 2
+                dropped = PendingWrite("delete", uri, collection, rkey, subject)
+                dropped.resolve(None)
+                return dropped
+        return self._enqueue(PendingWrite("delete", uri, collection, rkey, subject))
+
+    def _enqueue(self, write: PendingWrite) -> PendingWrite:
+        self._pending.append(write)
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.delay, self._start_flush)
+        return write
+
+    def _start_flush(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Commit everything queued so far, one batch at a time and in order."""
+        while self._pending:
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            self.batches += 1
+            await self._commit_batch(batch)
+
+    async def _commit_batch(self, batch: list[PendingWrite]) -> None:
+        try:
+            with request_priority(max(write.priority for write in batch)):
+                results = await self._commit(self._repo(), batch)
+        except Exception as e:
+            if len(batch) > 1 and is_rejected(e):
+                # One bad write (a like already deleted, say) mustn't fail the rest
+                self.splits += 1
+                middle = len(batch) // 2
+                await self._commit_batch(batch[:middle])
+                await self._commit_batch(batch[middle:])
+                return
+            for write in batch:
+                write.fail(e)
+            return
+        for write, uri in zip(batch, results):
+            write.resolve(uri if write.action == "create" else None)
+        for write in batch[len(results):]:
+            write.resolve(None)
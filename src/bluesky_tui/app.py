@@ -1,35 +1,243 @@
+import time
+from pathlib import Path
+
+from textual import work
 from textual.app import App
+from textual.binding import Binding
 
+from bluesky_tui.api import mutes, transport
 from bluesky_tui.api.client import BlueskyClient
+from bluesky_tui.api.client_pool import ClientPool
+from bluesky_tui.api.metrics import MetricsFile
+from bluesky_tui.api.models import PostData
+from bluesky_tui.api.outbox import Outbox
+from bluesky_tui.api.prefetch import ThreadPrefetcher
+from bluesky_tui.api.scheduler import Priority, request_priority
 from bluesky_tui.config import load_settings
+from bluesky_tui.loop_monitor import LoopMonitor, offload
+
+
+OUTBOX_REPLAY_INTERVAL = 30.0
+SESSION_EVICT_INTERVAL = 60.0
+METRICS_FILE_INTERVAL = 60.0
+# Worker group prefixes of screen reads, cancelled as soon as their screen is left
+LOADER_GROUPS = ("load", "poll")
 
 
 class BlueskyApp(App):
     TITLE = "Bluesky TUI"
     CSS_PATH = "css/app.tcss"
+    BINDINGS = [
+        Binding("f12", "show_debug", "Debug", show=False),
+        Binding("f9", "profile_snapshot", "Profile snapshot", show=False),
+    ]
 
-    def __init__(self, client=None) -> None:
+    def __init__(
+        self,
+        client=None,
+        metrics_file: Path | None = None,
+        profiler=None,
+        service_url: str | None = None,
+    ) -> None:
         super().__init__()
-        self.client = client if client is not None else BlueskyClient()
         self.settings: dict = load_settings()
+        config = transport.TransportConfig.from_settings(self.settings)
+        if service_url:
+            config.service_url = service_url
+        transport.configure(config)
+        mutes.configure(self.settings.get("muted_words", []))
+        self.client = client if client is not None else BlueskyClient()
+        self.prefetcher = ThreadPrefetcher()
+        self.outbox = Outbox()
+        # Logged-in clients of recently used accounts, for instant switching
+        self.clients = ClientPool()
+        # Records every time something blocks the event loop for over 100 ms
+        self.loop_monitor = LoopMonitor()
+        self.metrics_file = MetricsFile(metrics_file) if metrics_file else None
+        self.profiler = profiler  # SessionProfiler when run with --profile
+
+    def _cancel_loads(self, screen) -> None:
+        # Only reads ("load", "load-more", "poll", ...) are cancelled early; a
+        # like or post in flight must get to roll back or queue itself offline.
+        for worker in list(self.workers):
+            if worker.node is screen and worker.group.startswith(LOADER_GROUPS):
+                worker.cancel()
+
+    def pop_screen(self):
+        # Cancel the outgoing screen's loads right away rather than waiting for
+        # it to unmount, so popped screens stop fetching immediately.
+        self._cancel_loads(self.screen)
+        return super().pop_screen()
+
+    def switch_screen(self, screen):
+        self._cancel_loads(self.screen)
+        return super().switch_screen(screen)
+
+    def open_url(self, url: str, *, new_tab: bool = True) -> None:
+        if self.is_web:
+            # Served to a browser (textual-serve): the driver asks that browser to open it
+            super().open_url(url, new_tab=new_tab)
+            return
+        # webbrowser.open can take seconds to launch a browser
+        self._open_url(url, new_tab)
+
+    @work(group="browser")
+    async def _open_url(self, url: str, new_tab: bool) -> None:
+        import webbrowser
+
+        await offload(webbrowser.open, url, new=2 if new_tab else 0)
+
+    def activate_client(self, client) -> None:
+        """Make the logged-in *client* the current account and show its feed."""
+        self.client = client
+        self.pool_client(client)
+        self.show_feed()
+
+    def pool_client(self, client) -> None:
+        """Keep the logged-in *client* for reuse, e.g. one the inbox signed in."""
+        for handle in self.clients.put(client.me.handle, client):
+            self.forget_session(handle)
+
+    def show_feed(self) -> None:
+        """Show the current account's feed, reusing its screen from an earlier visit."""
+        from bluesky_tui.screens.feed import FeedScreen
+
+        name = f"feed:{self.client.me.handle}"
+        if not self.is_screen_installed(name):
+            self.install_screen(FeedScreen(), name)
+        with self.batch_update():
+            while len(self.screen_stack) > 2:
+                self.pop_screen()
+            if len(self.screen_stack) == 2:
+                self.switch_screen(name)
+            else:
+                self.push_screen(name)
+        self._update_outbox_status()
+
+    def forget_session(self, handle: str) -> None:
+        name = f"feed:{handle}"
+        if self.is_screen_installed(name) and self.get_screen(name) not in self.screen_stack:
+            self.uninstall_screen(name)
+
+    def _evict_idle_sessions(self) -> None:
+        keep = self.client.me.handle if self.client.me else None
+        for handle in self.clients.evict_idle(keep=keep):
+            self.forget_session(handle)
+
+    def _update_outbox_status(self) -> None:
+        count = len(self.outbox.pending(self.client.me.did)) if self.client.me else 0
+        self.sub_title = f"{count} queued offline" if count else ""
+
+    async def queue_offline_post(self, rkey: str, text: str, reply_to: PostData | None, quote: PostData | None) -> None:
+        await self.outbox.queue_post(self.client.me.did, rkey, text, reply_to, quote)
+        self._update_outbox_status()
+        self.notify("Offline: post queued and will be sent when the connection returns.", severity="warning")
+
+    async def queue_offline_like(self, rkey: str, post: PostData) -> None:
+        await self.outbox.queue_like(self.client.me.did, rkey, post.uri, post.cid)
+        self._update_outbox_status()
+        self.notify("Offline: like queued.", severity="warning")
+
+    async def discard_offline_like(self, like_uri: str, post: PostData) -> bool:
+        """Take back a like still waiting in the outbox; True if there was one to drop."""
+        rkey = like_uri.rsplit("/", 1)[-1]
+        if not await self.outbox.discard_like(self.client.me.did, rkey, post.uri):
+            return False
+        self._update_outbox_status()
+        return True
+
+    async def queue_offline_dm(self, entry_id: str, convo_id: str, text: str, attempted_at: str) -> None:
+        await self.outbox.queue_dm(self.client.me.did, entry_id, convo_id, text, attempted_at)
+        self._update_outbox_status()
+        self.notify("Offline: message queued.", severity="warning")
+
+    @work(exclusive=True, group="outbox")
+    async def replay_outbox(self) -> None:
+        self._update_outbox_status()
+        if not self.client.me or not self.outbox.pending(self.client.me.did):
+            return
+        with request_priority(Priority.BULK):
+            sent, rejected = await self.outbox.replay(self.client)
+        self._update_outbox_status()
+        if sent:
+            self.notify(f"Sent {sent} queued write{'s' if sent != 1 else ''}.")
+        for reason in rejected:
+            self.notify(f"Queued write rejected: {reason}", severity="error")
+
+    def metrics_snapshot(self) -> dict:
+        """Request, cache, transport and event-loop figures for the current session."""
+        client = self.client
+        caches = {
+            "threads": client.thread_cache,
+            "profiles": client.profile_cache,
+            "sessions": self.clients,
+        }
+        last_stall = self.loop_monitor.stalls[-1] if self.loop_monitor.stalls else None
+        return {
+            "time": time.time(),
+            "account": client.me.handle if client.me else None,
+            "client": client.metrics.snapshot(),
+            "caches": {
+                name: {
+                    "hits": cache.hits,
+                    "misses": cache.misses,
+                    "hit_ratio": cache.hits / (cache.hits + cache.misses) if cache.hits + cache.misses else None,
+                }
+                for name, cache in caches.items()
+            },
+            "scheduler": client.scheduler.snapshot(),
+            "transport": transport.stats.snapshot(),
+            "loop": {
+                "stalls": self.loop_monitor.stall_count,
+                "max_lag_ms": round(self.loop_monitor.max_lag * 1000, 1),
+                "last_stack": last_stall.stack if last_stall else None,
+            },
+        }
+
+    def action_show_debug(self) -> None:
+        from bluesky_tui.screens.debug import DebugScreen
+
+        if not isinstance(self.screen, DebugScreen):
+            self.push_screen(DebugScreen())
+
+    def action_profile_snapshot(self) -> None:
+        if self.profiler is None:
+            self.notify("Profiling is off; start with --profile.", severity="warning")
+            return
+        path = self.profiler.snapshot()
+        self.notify(f"Profile written to {path}")
+
+    @work(group="metrics-file")
+    async def _write_metrics(self) -> None:
+        await offload(self.metrics_file.write, self.metrics_snapshot())
+
+    async def on_unmount(self) -> None:
+        self.loop_monitor.stop()
+        if self.metrics_file:
+            self.metrics_file.write(self.metrics_snapshot())
+            self.metrics_file.close()
+        await transport.close_shared_transport()
 
     async def on_mount(self) -> None:
         self.theme = self.settings.get("theme", "textual-dark")
+        self.loop_monitor.start()
+        self.set_interval(OUTBOX_REPLAY_INTERVAL, self.replay_outbox)
+        self.set_interval(SESSION_EVICT_INTERVAL, self._evict_idle_sessions)
+        if self.metrics_file:
+            self.set_interval(METRICS_FILE_INTERVAL, self._write_metrics)
 
         # If client is already authenticated (e.g. demo mode), skip login
         if self.client.me:
-            from bluesky_tui.screens.feed import FeedScreen
-            self.push_screen(FeedScreen())
+            self.activate_client(self.client)
             return
 
         from bluesky_tui.config import load_credentials
 
-        creds = load_credentials()
+        creds = await offload(load_credentials)
         if creds:
             try:
                 await self.client.login(creds["handle"], creds["app_password"])
-                from bluesky_tui.screens.feed import FeedScreen
-                self.push_screen(FeedScreen())
+                self.activate_client(self.client)
                 return
             except Exception:
                 pass
@@ -1,12 +1,20 @@
+import atexit
+import copy
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import keyring
 
 SERVICE_NAME = "bluesky_tui"
 CONFIG_DIR = Path.home() / ".config" / "bluesky_tui"
-CONFIG_FILE = CONFIG_DIR / "config.json"
+CONFIG_FILE = CONFIG_DIR / "config.json"  # legacy plaintext credentials, migrated away
+SETTINGS_FILE = CONFIG_DIR / "settings.json"
+ACCOUNTS_FILE = CONFIG_DIR / "accounts.json"
 
 log = logging.getLogger(__name__)
 
@@ -14,6 +22,10 @@ DEFAULT_SETTINGS: dict = {
     "theme": "textual-dark",
     "post_density": "normal",
     "default_filter": "all",
+    # User-defined feed filters; see filters.filter_from_setting
+    "custom_filters": [],
+    # Words, phrases, #hashtags and /regexes/ whose posts are hidden; see api.mutes
+    "muted_words": [],
     "posts_per_page": 30,
     "notification_filters": {
         "like": True,
@@ -26,32 +38,172 @@ DEFAULT_SETTINGS: dict = {
 }
 
 
-def load_settings() -> dict:
-    """Load settings from keyring, returning defaults for any missing keys."""
-    settings = dict(DEFAULT_SETTINGS)
+class JsonStore:
+    """A JSON file cached in memory.
+
+    Loads re-read the file only when its mtime has changed. Saves update the
+    cache at once and write the file *delay* seconds after the last save, on
+    a timer thread, so bursts of changes cost one write and never block the
+    event loop.
+    """
+
+    def __init__(self, path: Path, delay: float = 0.5) -> None:
+        self.path = path
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._data: Any = None
+        self._mtime: float | None = None
+        self._timer: threading.Timer | None = None
+        self._dirty = False
+
+    def exists(self) -> bool:
+        with self._lock:
+            return self._dirty or self.path.exists()
+
+    def load(self) -> Any:
+        """Return a copy of the stored data, or None if there is no file yet."""
+        with self._lock:
+            if not self._dirty:
+                try:
+                    mtime = self.path.stat().st_mtime
+                except FileNotFoundError:
+                    return None
+                if mtime != self._mtime:
+                    try:
+                        self._data = json.loads(self.path.read_text())
+                    except (OSError, json.JSONDecodeError) as e:
+                        log.warning("Failed to read %s: %s", self.path, e)
+                        return None
+                    self._mtime = mtime
+            return copy.deepcopy(self._data)
+
+    def save(self, data: Any) -> None:
+        with self._lock:
+            self._data = copy.deepcopy(data)
+            self._dirty = True
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes now."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(self._data, indent=2))
+                os.replace(tmp, self.path)
+                self._mtime = self.path.stat().st_mtime
+                self._dirty = False
+            except OSError as e:
+                log.warning("Failed to write %s: %s", self.path, e)
+
+
+_settings_store = JsonStore(SETTINGS_FILE)
+_accounts_store = JsonStore(ACCOUNTS_FILE)
+
+# Keyring is a D-Bus round trip on Linux: read each secret once, write in the background
+_secrets: dict[str, str | None] = {}
+_keyring_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keyring")
+
+
+def flush() -> None:
+    """Write all pending settings, account and secret changes before exit."""
+    _settings_store.flush()
+    _accounts_store.flush()
+    _keyring_writer.shutdown(wait=True)
+
+
+atexit.register(flush)
+
+
+def _keyring_write(fn, *args) -> None:
+    def run() -> None:
+        try:
+            fn(SERVICE_NAME, *args)
+        except Exception as e:
+            log.warning("Keyring write failed: %s", e)
+
     try:
-        blob = keyring.get_password(SERVICE_NAME, "settings")
-        if blob:
-            stored = json.loads(blob)
-            for key, value in stored.items():
-                if key == "notification_filters" and isinstance(value, dict):
-                    settings["notification_filters"] = {
-                        **DEFAULT_SETTINGS["notification_filters"],
-                        **value,
-                    }
-                else:
-                    settings[key] = value
-    except Exception as e:
-        log.debug("Failed to load settings: %s", e)
+        _keyring_writer.submit(run)
+    except RuntimeError:
+        run()  # interpreter shutting down; the executor no longer takes work
+
+
+def _secret_key(handle: str) -> str:
+    return f"app_password:{handle}"
+
+
+def get_app_password(handle: str) -> str | None:
+    """Return the saved app password for *handle*, reading keyring at most once."""
+    if handle not in _secrets:
+        try:
+            _secrets[handle] = keyring.get_password(SERVICE_NAME, _secret_key(handle))
+        except Exception as e:
+            log.debug("Keyring read (%s) failed: %s", handle, e)
+            return None
+    return _secrets[handle]
+
+
+def set_app_password(handle: str, app_password: str) -> None:
+    _secrets[handle] = app_password
+    _keyring_write(keyring.set_password, _secret_key(handle), app_password)
+
+
+def delete_app_password(handle: str) -> None:
+    _secrets[handle] = None
+    _keyring_write(keyring.delete_password, _secret_key(handle))
+
+
+def _merge_settings(stored: dict) -> dict:
+    settings = copy.deepcopy(DEFAULT_SETTINGS)
+    for key, value in stored.items():
+        if key == "notification_filters" and isinstance(value, dict):
+            settings["notification_filters"] = {
+                **DEFAULT_SETTINGS["notification_filters"],
+                **value,
+            }
+        else:
+            settings[key] = value
     return settings
 
 
+def load_settings() -> dict:
+    """Load settings, returning defaults for any missing keys."""
+    stored = _settings_store.load()
+    if stored is None and not _settings_store.exists():
+        stored = _migrate_keyring_settings() or {}
+        save_settings(stored)
+    return _merge_settings(stored or {})
+
+
 def save_settings(settings: dict) -> None:
-    """Save settings to keyring."""
+    """Save settings; the file is written shortly after, off the calling thread."""
+    _settings_store.save(settings)
+
+
+def _migrate_keyring_settings() -> dict | None:
+    """Move settings from the keyring blob used by earlier versions into the settings file."""
     try:
-        keyring.set_password(SERVICE_NAME, "settings", json.dumps(settings))
+        blob = keyring.get_password(SERVICE_NAME, "settings")
     except Exception as e:
-        log.warning("Failed to save settings: %s", e)
+        log.debug("Failed to load settings: %s", e)
+        return None
+    if not blob:
+        return None
+    try:
+        stored = json.loads(blob)
+    except json.JSONDecodeError:
+        return None
+    _keyring_write(keyring.delete_password, "settings")
+    return stored
 
 
 # ---------------------------------------------------------------------------
@@ -59,14 +211,33 @@ def save_settings(settings: dict) -> None:
 # ---------------------------------------------------------------------------
 
 def load_accounts() -> dict:
-    """Load the multi-account blob from keyring.
+    """Load saved accounts (handles only; see :func:`get_app_password`).
 
-    Migrates from the old single-account ``"credentials"`` key and legacy
-    config file if needed.
+    Migrates from the keyring blobs and legacy config file of earlier
+    versions if needed.
 
-    Returns a dict with ``"active"`` (str | None) and ``"accounts"`` (list).
+    Returns a dict with ``"active"`` (str | None) and ``"accounts"`` (list of
+    ``{"handle": ...}``).
     """
-    # Try new "accounts" key first
+    data = _accounts_store.load()
+    if data is None and not _accounts_store.exists():
+        legacy = _load_legacy_accounts()
+        for acct in legacy["accounts"]:
+            set_app_password(acct["handle"], acct["app_password"])
+        if legacy["accounts"]:
+            _keyring_write(keyring.delete_password, "accounts")
+        # Written even when empty so later loads don't probe keyring again
+        save_accounts(legacy)
+        data = legacy
+    if not data or "accounts" not in data:
+        return {"active": None, "accounts": []}
+    data["accounts"] = [{"handle": a["handle"]} for a in data["accounts"]]
+    return data
+
+
+def _load_legacy_accounts() -> dict:
+    """Read accounts with their passwords from where earlier versions kept them."""
+    # Multi-account keyring blob
     try:
         blob = keyring.get_password(SERVICE_NAME, "accounts")
         if blob:
@@ -76,41 +247,34 @@ def load_accounts() -> dict:
     except Exception as e:
         log.debug("Keyring read (accounts) failed: %s", e)
 
-    # Migrate from old "credentials" key
+    # Single-account "credentials" key
     try:
         blob = keyring.get_password(SERVICE_NAME, "credentials")
         if blob:
             old = json.loads(blob)
             if old.get("handle") and old.get("app_password"):
-                new_data = {
+                _keyring_write(keyring.delete_password, "credentials")
+                return {
                     "active": old["handle"],
                     "accounts": [
                         {"handle": old["handle"], "app_password": old["app_password"]}
                     ],
                 }
-                save_accounts(new_data)
-                try:
-                    keyring.delete_password(SERVICE_NAME, "credentials")
-                except Exception:
-                    pass
-                return new_data
     except Exception as e:
         log.debug("Keyring read (credentials) failed: %s", e)
 
-    # Migrate from legacy plaintext config file
+    # Legacy plaintext config file
     if CONFIG_FILE.exists():
         try:
             old = json.loads(CONFIG_FILE.read_text())
             if old.get("handle") and old.get("app_password"):
-                new_data = {
+                _remove_legacy_config()
+                return {
                     "active": old["handle"],
                     "accounts": [
                         {"handle": old["handle"], "app_password": old["app_password"]}
                     ],
                 }
-                save_accounts(new_data)
-                _remove_legacy_config()
-                return new_data
         except (json.JSONDecodeError, KeyError):
             pass
 
@@ -118,39 +282,37 @@ def load_accounts() -> dict:
 
 
 def save_accounts(data: dict) -> None:
-    """Save the multi-account blob to keyring."""
-    try:
-        keyring.set_password(SERVICE_NAME, "accounts", json.dumps(data))
-    except Exception as e:
-        log.warning("Keyring write (accounts) failed: %s", e)
+    """Save account metadata; passwords never go into the file."""
+    _accounts_store.save({
+        "active": data.get("active"),
+        "accounts": [{"handle": a["handle"]} for a in data.get("accounts", [])],
+    })
+
+
+def get_account_credentials(handle: str) -> dict | None:
+    """Return ``{"handle", "app_password"}`` for a saved account, or None."""
+    if not any(a["handle"] == handle for a in load_accounts()["accounts"]):
+        return None
+    app_password = get_app_password(handle)
+    if not app_password:
+        return None
+    return {"handle": handle, "app_password": app_password}
 
 
 def get_active_credentials() -> dict | None:
     """Return ``{"handle", "app_password"}`` for the active account, or None."""
-    data = load_accounts()
-    active = data.get("active")
-    if not active:
-        return None
-    for acct in data.get("accounts", []):
-        if acct["handle"] == active:
-            return {"handle": acct["handle"], "app_password": acct["app_password"]}
-    return None
+    active = load_accounts().get("active")
+    return get_account_credentials(active) if active else None
 
 
 def add_account(handle: str, app_password: str) -> None:
     """Add or update an account and set it as active."""
     data = load_accounts()
-    # Update existing or append
-    found = False
-    for acct in data["accounts"]:
-        if acct["handle"] == handle:
-            acct["app_password"] = app_password
-            found = True
-            break
-    if not found:
-        data["accounts"].append({"handle": handle, "app_password": app_password})
+    if not any(a["handle"] == handle for a in data["accounts"]):
+        data["accounts"].append({"handle": handle})
     data["active"] = handle
     save_accounts(data)
+    set_app_password(handle, app_password)
 
 
 def remove_account(handle: str) -> None:
@@ -160,6 +322,7 @@ def remove_account(handle: str) -> None:
     if data.get("active") == handle:
         data["active"] = data["accounts"][0]["handle"] if data["accounts"] else None
     save_accounts(data)
+    delete_app_password(handle)
 
 
 def set_active_account(handle: str) -> None:
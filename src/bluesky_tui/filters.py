@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+
+from bluesky_tui.api.models import PostData, PostFlags
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PostFilter:
+    """A feed filter over the flags and languages each post is parsed with.
+
+    A post matches if it has every flag in *require*, none in *exclude*, at
+    least one flag of each mask in *any_of*, and, when *langs* is set, one
+    of those languages. Filters compose with ``&``.
+    """
+
+    name: str
+    require: PostFlags = PostFlags.NONE
+    exclude: PostFlags = PostFlags.NONE
+    any_of: tuple[PostFlags, ...] = ()
+    langs: frozenset[str] = frozenset()
+
+    def __call__(self, post: PostData) -> bool:
+        flags = post.flags
+        if flags & self.require != self.require or flags & self.exclude:
+            return False
+        if not all(flags & mask for mask in self.any_of):
+            return False
+        return not self.langs or not self.langs.isdisjoint(post.langs)
+
+    def __and__(self, other: PostFilter) -> PostFilter:
+        if self.langs and other.langs:
+            langs = self.langs & other.langs
+        else:
+            langs = self.langs or other.langs
+        return PostFilter(
+            f"{self.name} & {other.name}",
+            require=self.require | other.require,
+            exclude=self.exclude | other.exclude,
+            any_of=self.any_of + other.any_of,
+            langs=langs,
+        )
+
+
+BUILTIN_FILTERS = (
+    PostFilter("all"),
+    PostFilter("posts only", exclude=PostFlags.REPOST | PostFlags.REPLY),
+    PostFilter("text only", exclude=PostFlags.IMAGE | PostFlags.VIDEO),
+    PostFilter("media", any_of=(PostFlags.IMAGE | PostFlags.VIDEO,)),
+)
+
+
+def _flags(names: list[str]) -> PostFlags:
+    flags = PostFlags.NONE
+    for name in names:
+        try:
+            flags |= PostFlags[name.upper()]
+        except KeyError:
+            raise ValueError(f"unknown post feature {name!r}") from None
+    return flags
+
+
+def filter_from_setting(spec: dict, known: dict[str, PostFilter]) -> PostFilter:
+    """Build a filter from a ``custom_filters`` entry, on top of the filter named in its "base"."""
+    post_filter = PostFilter(
+        spec["name"],
+        require=_flags(spec.get("require", [])),
+        exclude=_flags(spec.get("exclude", [])),
+        any_of=(_flags(spec["any"]),) if spec.get("any") else (),
+        langs=frozenset(spec.get("langs", [])),
+    )
+    if base := spec.get("base"):
+        if base not in known:
+            raise ValueError(f"unknown base filter {base!r}")
+        post_filter = replace(known[base] & post_filter, name=post_filter.name)
+    return post_filter
+
+
+def available_filters(settings: dict) -> list[PostFilter]:
+    """The built-in filters followed by the user's own, in cycling order."""
+    filters = {f.name: f for f in BUILTIN_FILTERS}
+    for spec in settings.get("custom_filters", []):
+        try:
+            post_filter = filter_from_setting(spec, filters)
+        except (KeyError, TypeError, ValueError) as e:
+            log.warning("Ignoring custom filter %r: %s", spec, e)
+            continue
+        filters[post_filter.name] = post_filter
+    return list(filters.values())
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Frames from these packages only show how the callback was dispatched
+_DISPATCH_FRAMES = ("/asyncio/", "/textual/")
+
+
+async def offload(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run the blocking *fn* on a worker thread so the event loop keeps drawing."""
+    return await asyncio.to_thread(functools.partial(fn, *args, **kwargs))
+
+
+@dataclass
+class Stall:
+    started: float  # wall-clock time the loop stopped responding
+    duration: float  # seconds
+    stack: str  # the loop thread's stack while it was blocked
+
+
+class LoopMonitor:
+    """Watchdog thread that notices when the event loop stops responding.
+
+    Every *interval* seconds it schedules a no-op on the loop. If that hasn't
+    run within *threshold* seconds, the loop thread's stack is captured (it is
+    whatever is blocking) and, once the loop catches up, the stall is recorded
+    in ``stalls`` and logged. Recorded durations count from the probe, so
+    they can undershoot a stall by up to *interval*.
+    """
+
+    def __init__(self, threshold: float = 0.1, interval: float = 0.25, keep: int = 50) -> None:
+        self.threshold = threshold
+        self.interval = interval
+        self.stalls: deque[Stall] = deque(maxlen=keep)
+        self.stall_count = 0
+        self.max_lag = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Watch the running loop; call from the loop's thread."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="loop-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            beat = threading.Event()
+            sent_at = time.time()
+            sent = time.perf_counter()
+            try:
+                self._loop.call_soon_threadsafe(beat.set)
+            except RuntimeError:  # loop closed
+                return
+            if beat.wait(self.threshold):
+                self.max_lag = max(self.max_lag, time.perf_counter() - sent)
+                continue
+            stack = self._loop_stack()
+            while not beat.wait(0.5):
+                if self._stop.is_set():
+                    return
+            self._record(Stall(sent_at, time.perf_counter() - sent, stack))
+
+    def _loop_stack(self) -> str:
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return ""
+        frames = [f for f in traceback.extract_stack(frame) if not any(p in f.filename for p in _DISPATCH_FRAMES)]
+        return "".join(traceback.format_list(frames or traceback.extract_stack(frame)))
+
+    def _record(self, stall: Stall) -> None:
+        self.stall_count += 1
+        self.max_lag = max(self.max_lag, stall.duration)
+        self.stalls.append(stall)
+        log.warning("Event loop blocked for %.0f ms in:\n%s", stall.duration * 1000, stall.stack)
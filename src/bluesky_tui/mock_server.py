@@ -0,0 +1,635 @@
+"""Local stand-in for the Bluesky PDS, AppView and chat service, for end-to-end load tests.
+
+Serves DemoClient's dataset (the hand-written demo, or a seeded synthetic one
+of any size) as XRPC over HTTP, with simulated latency, injected errors and
+``ratelimit-*`` headers, so the real BlueskyClient can be pointed at it:
+
+    python -m bluesky_tui.mock_server --posts 100000 --latency-ms 80 --rate-limit 600
+    python -m bluesky_tui --service-url http://127.0.0.1:2583
+
+Any password is accepted; log in with any handle from the dataset, or any
+other to get the demo user.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from bluesky_tui.api.demo_client import DemoClient, Latency
+from bluesky_tui.api.models import ConversationData, MessageData, PostData, ProfileData
+from bluesky_tui.api.replay import fake_jwt
+from bluesky_tui.api.write_queue import next_tid
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PORT = 2583  # the reference PDS's
+ACCESS_TOKEN_LIFETIME = 2 * 3600
+REFRESH_TOKEN_LIFETIME = 60 * 24 * 3600
+_NO_AUTH = frozenset({"com.atproto.server.createSession", "com.atproto.server.refreshSession"})
+
+
+class XrpcError(Exception):
+    def __init__(self, status: int, error: str, message: str = "") -> None:
+        super().__init__(message or error)
+        self.status = status
+        self.error = error
+
+
+class RateLimit:
+    """Fixed-window request budget, reported the way Bluesky's servers do."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self._reset = 0.0
+        self._remaining = limit
+
+    def take(self) -> tuple[bool, dict[str, str]]:
+        """Spend one request; return whether it is allowed and the headers to send."""
+        now = time.time()
+        if now >= self._reset:
+            self._reset = now + self.window
+            self._remaining = self.limit
+        allowed = self._remaining > 0
+        if allowed:
+            self._remaining -= 1
+        return allowed, {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self._remaining),
+            "RateLimit-Reset": str(int(self._reset)),
+            "RateLimit-Policy": f"{self.limit};w={int(self.window)}",
+        }
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _page(items: list, params: dict, default_limit: int) -> tuple[list, str | None]:
+    start = int(params.get("cursor") or 0)
+    end = start + min(int(params.get("limit") or default_limit), 100)
+    return items[start:end], str(end) if end < len(items) else None
+
+
+def _remove_item(items: list, item) -> None:
+    # By identity: list.remove would run PostData's field-by-field __eq__ against each post it passes
+    for i, candidate in enumerate(items):
+        if candidate is item:
+            del items[i]
+            return
+
+
+def _author(did: str, handle: str, display_name: str) -> dict:
+    return {"did": did, "handle": handle, "displayName": display_name}
+
+
+def _message_view(msg: MessageData) -> dict:
+    return {
+        "$type": "chat.bsky.convo.defs#messageView",
+        "id": msg.id,
+        "rev": msg.id,
+        "text": msg.text,
+        "sender": {"did": msg.sender_did},
+        "sentAt": msg.sent_at,
+    }
+
+
+def _convo_view(convo: ConversationData) -> dict:
+    view = {
+        "id": convo.id,
+        "rev": convo.last_message.id if convo.last_message else "0",
+        "members": [_author(m["did"], m["handle"], m["display_name"]) for m in convo.members],
+        "muted": convo.muted,
+        "unreadCount": convo.unread_count,
+    }
+    if convo.last_message:
+        view["lastMessage"] = _message_view(convo.last_message)
+    return view
+
+
+class MockServer:
+    """XRPC server over *data*, a DemoClient whose dataset it serves and updates.
+
+    Each request is delayed by a sample of *latency* (or *endpoint_latency*
+    for its endpoint), then counted against a *rate_limit* requests per
+    *rate_window* seconds budget shared by all clients; requests over it get
+    a 429. A further *error_rate* share fail with a 503. Posts, likes,
+    reposts, follows and messages written through the server show up in
+    later reads.
+    """
+
+    def __init__(
+        self,
+        data: DemoClient,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        latency: Latency | None = None,
+        endpoint_latency: dict[str, Latency] | None = None,
+        rate_limit: int = 3000,
+        rate_window: float = 300.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.data = data
+        self.latency = latency or Latency()
+        self.endpoint_latency = endpoint_latency or {}
+        self.rate_limit = RateLimit(rate_limit, rate_window)
+        self.error_rate = error_rate
+        self.requests = 0
+        self._rng = random.Random(seed + 2)
+        # Handlers run on one thread per connection; the dataset isn't thread-safe
+        self._lock = threading.Lock()
+        # Likes, reposts and follows created here: uri -> (collection, subject)
+        self._records: dict[str, tuple[str, str]] = {}
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def start(self) -> None:
+        """Serve on a background thread, e.g. from a benchmark."""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-server", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # -- Request handling ---------------------------------------------------
+
+    def handle(self, method: str, endpoint: str, params: dict, body: dict, authorized: bool) -> tuple[int, dict, dict]:
+        """Answer one XRPC call; return (status, headers, JSON body)."""
+        with self._lock:
+            self.requests += 1
+            delay = self.endpoint_latency.get(endpoint, self.latency).sample(self._rng)
+            roll = self._rng.random()
+            allowed, headers = self.rate_limit.take()
+        if delay:
+            time.sleep(delay)
+        if not allowed:
+            return 429, headers, {"error": "RateLimitExceeded", "message": "Rate Limit Exceeded"}
+        if roll < self.error_rate:
+            return 503, headers, {"error": "ServiceUnavailable", "message": "Injected failure"}
+        handler = _ROUTES.get((method, endpoint))
+        if handler is None:
+            return 501, headers, {"error": "MethodNotImplemented", "message": f"{method} {endpoint} is not served"}
+        if endpoint not in _NO_AUTH and not authorized:
+            return 401, headers, {"error": "AuthMissing", "message": "Authentication Required"}
+        try:
+            with self._lock:
+                return 200, headers, handler(self, params if method == "GET" else body)
+        except XrpcError as e:
+            return e.status, headers, {"error": e.error, "message": str(e)}
+
+    # -- Views --------------------------------------------------------------
+
+    def _post_view(self, post: PostData) -> dict:
+        record: dict = {"$type": "app.bsky.feed.post", "text": post.text, "createdAt": post.created_at}
+        if post.langs:
+            record["langs"] = list(post.langs)
+        if post.reply_parent_uri:
+            root = self.data._by_uri.get(post.reply_root_uri or post.reply_parent_uri)
+            parent = self.data._by_uri.get(post.reply_parent_uri)
+            record["reply"] = {
+                "root": {"uri": post.reply_root_uri or post.reply_parent_uri, "cid": root.cid if root else post.cid},
+                "parent": {"uri": post.reply_parent_uri, "cid": parent.cid if parent else post.cid},
+            }
+        viewer = {}
+        if post.like_uri:
+            viewer["like"] = post.like_uri
+        if post.repost_uri:
+            viewer["repost"] = post.repost_uri
+        view = {
+            "$type": "app.bsky.feed.defs#postView",
+            "uri": post.uri,
+            "cid": post.cid,
+            "author": _author(post.author_did, post.author_handle, post.author_display_name),
+            "record": record,
+            "replyCount": post.reply_count,
+            "repostCount": post.repost_count,
+            "likeCount": post.like_count,
+            "indexedAt": post.created_at,
+            "viewer": viewer,
+        }
+        if post.has_video:
+            view["embed"] = {
+                "$type": "app.bsky.embed.video#view",
+                "cid": post.cid,
+                "playlist": f"https://video.invalid/{post.cid}/playlist.m3u8",
+            }
+        elif post.has_image:
+            view["embed"] = {
+                "$type": "app.bsky.embed.images#view",
+                "images": [{"thumb": "https://cdn.invalid/thumb", "fullsize": "https://cdn.invalid/full", "alt": ""}],
+            }
+        return view
+
+    def _ref_view(self, uri: str) -> dict:
+        post = self.data._by_uri.get(uri)
+        if post is None:
+            return {"$type": "app.bsky.feed.defs#notFoundPost", "uri": uri, "notFound": True}
+        return self._post_view(post)
+
+    def _feed_item(self, post: PostData) -> dict:
+        item: dict = {"post": self._post_view(post)}
+        if post.reply_parent_uri:
+            item["reply"] = {
+                "root": self._ref_view(post.reply_root_uri or post.reply_parent_uri),
+                "parent": self._ref_view(post.reply_parent_uri),
+            }
+        if post.reason_repost_by:
+            by = self.data._by_handle.get(post.reason_repost_by)
+            item["reason"] = {
+                "$type": "app.bsky.feed.defs#reasonRepost",
+                "by": _author(by.did, by.handle, by.display_name) if by else _author(
+                    "did:plc:unknown", post.reason_repost_by, post.reason_repost_by,
+                ),
+                "indexedAt": post.created_at,
+            }
+        return item
+
+    def _thread_view(self, post: PostData, depth: int, parent_height: int) -> dict:
+        view: dict = {"$type": "app.bsky.feed.defs#threadViewPost", "post": self._post_view(post)}
+        parent = self.data._by_uri.get(post.reply_parent_uri) if post.reply_parent_uri else None
+        if parent is not None and parent_height > 0:
+            view["parent"] = self._thread_view(parent, 0, parent_height - 1)
+        if depth > 0:
+            # Omitted, not empty, once the requested depth runs out
+            view["replies"] = [
+                self._thread_view(reply, depth - 1, 0) for reply in self.data._replies.get(post.uri, [])
+            ]
+        return view
+
+    def _profile(self, actor: str) -> ProfileData:
+        profile = self.data._profiles.get(actor) or self.data._by_handle.get(actor)
+        if profile is None:
+            raise XrpcError(400, "InvalidRequest", "Profile not found")
+        return profile
+
+    def _session(self, profile: ProfileData) -> dict:
+        now = int(time.time())
+        return {
+            "did": profile.did,
+            "handle": profile.handle,
+            "accessJwt": fake_jwt({
+                "scope": "com.atproto.access", "sub": profile.did, "iat": now, "exp": now + ACCESS_TOKEN_LIFETIME,
+            }),
+            "refreshJwt": fake_jwt({
+                "scope": "com.atproto.refresh", "sub": profile.did, "iat": now, "exp": now + REFRESH_TOKEN_LIFETIME,
+            }),
+            "active": True,
+        }
+
+    # -- Endpoints ----------------------------------------------------------
+
+    def create_session(self, body: dict) -> dict:
+        identifier = body.get("identifier", "")
+        return self._session(self.data._by_handle.get(identifier) or self.data._profiles.get(identifier) or self.data.me)
+
+    def refresh_session(self, body: dict) -> dict:
+        return self._session(self.data.me)
+
+    def get_profile(self, params: dict) -> dict:
+        p = self._profile(params.get("actor", ""))
+        return {
+            "did": p.did,
+            "handle": p.handle,
+            "displayName": p.display_name,
+            "description": p.description,
+            "followersCount": p.followers_count,
+            "followsCount": p.following_count,
+            "postsCount": p.posts_count,
+            "viewer": {"following": p.follow_uri} if p.follow_uri else {},
+        }
+
+    def get_timeline(self, params: dict) -> dict:
+        posts, cursor = _page(self.data._posts, params, 50)
+        return {"feed": [self._feed_item(p) for p in posts], "cursor": cursor}
+
+    def get_author_feed(self, params: dict) -> dict:
+        profile = self._profile(params.get("actor", ""))
+        posts, cursor = _page(self.data._by_author.get(profile.did, []), params, 50)
+        return {"feed": [self._feed_item(p) for p in posts], "cursor": cursor}
+
+    def get_post_thread(self, params: dict) -> dict:
+        post = self.data._by_uri.get(params.get("uri", ""))
+        if post is None:
+            raise XrpcError(400, "NotFound", f"Post not found: {params.get('uri')}")
+        depth = int(params.get("depth") or 6)
+        parent_height = int(params.get("parentHeight") or 80)
+        return {"thread": self._thread_view(post, depth, parent_height)}
+
+    def list_notifications(self, params: dict) -> dict:
+        notifications, cursor = _page(self.data._notifications, params, 50)
+        views = []
+        for n in notifications:
+            if n.reason in ("like", "repost"):
+                subject = self.data._by_uri.get(n.subject_uri)
+                record = {
+                    "$type": f"app.bsky.feed.{n.reason}",
+                    "subject": {"uri": n.subject_uri, "cid": subject.cid if subject else n.cid},
+                    "createdAt": n.created_at,
+                }
+            elif n.reason == "follow":
+                record = {"$type": "app.bsky.graph.follow", "subject": self.data.me.did, "createdAt": n.created_at}
+            else:
+                record = {"$type": "app.bsky.feed.post", "text": n.text, "createdAt": n.created_at}
+            view = {
+                "uri": n.uri,
+                "cid": n.cid,
+                "author": _author(n.author_did, n.author_handle, n.author_display_name),
+                "reason": n.reason,
+                "record": record,
+                "isRead": n.is_read,
+                "indexedAt": n.created_at,
+            }
+            if n.subject_uri:
+                view["reasonSubject"] = n.subject_uri
+            views.append(view)
+        return {"notifications": views, "cursor": cursor}
+
+    def update_seen(self, body: dict) -> dict:
+        for n in self.data._notifications:
+            n.is_read = True
+        return {}
+
+    def _create(self, repo: str, collection: str, rkey: str | None, record: dict) -> tuple[str, str]:
+        rkey = rkey or next_tid()
+        uri = f"at://{repo}/{collection}/{rkey}"
+        cid = f"bafyreimock{rkey}"
+        if uri in self.data._by_uri or uri in self._records:
+            raise XrpcError(400, "InvalidRequest", "Record already exists")
+        if collection == "app.bsky.feed.post":
+            reply = record.get("reply") or {}
+            parent = self.data._by_uri.get(reply.get("parent", {}).get("uri", ""))
+            if parent is not None:
+                parent.reply_count += 1
+            author = self.data._profiles.get(repo, self.data.me)
+            post = PostData(
+                uri=uri,
+                cid=cid,
+                author_did=author.did,
+                author_handle=author.handle,
+                author_display_name=author.display_name,
+                text=record.get("text", ""),
+                created_at=record.get("createdAt") or _now(),
+                like_count=0,
+                repost_count=0,
+                reply_count=0,
+                is_liked=False,
+                is_reposted=False,
+                like_uri=None,
+                repost_uri=None,
+                reason_repost_by=None,
+                reply_parent_uri=parent.uri if parent else None,
+                reply_parent_author=parent.author_handle if parent else None,
+                reply_root_uri=reply.get("root", {}).get("uri") if parent else None,
+                embed_type=None,
+                embed_text=None,
+                embed_author=None,
+                has_image=False,
+                has_video=False,
+                langs=record.get("langs") or (),
+            )
+            # Index just this post; re-indexing the whole dataset under the lock would stall every request
+            self.data._posts.insert(0, post)
+            self.data._by_uri[uri] = post
+            self.data._by_author.setdefault(post.author_did, []).insert(0, post)
+            if parent is not None:
+                self.data._replies.setdefault(parent.uri, []).append(post)  # oldest reply first
+            return uri, cid
+        subject = record.get("subject")
+        subject = subject.get("uri", "") if isinstance(subject, dict) else subject or ""
+        self._records[uri] = (collection, subject)
+        self._apply(collection, subject, uri, +1)
+        return uri, cid
+
+    def _delete(self, repo: str, collection: str, rkey: str) -> None:
+        uri = f"at://{repo}/{collection}/{rkey}"
+        if uri in self._records:
+            collection, subject = self._records.pop(uri)
+            self._apply(collection, subject, None, -1)
+        elif uri in self.data._by_uri:
+            post = self.data._by_uri.pop(uri)
+            _remove_item(self.data._posts, post)
+            _remove_item(self.data._by_author.get(post.author_did, []), post)
+            if post.reply_parent_uri:
+                _remove_item(self.data._replies.get(post.reply_parent_uri, []), post)
+                parent = self.data._by_uri.get(post.reply_parent_uri)
+                if parent is not None:
+                    parent.reply_count = max(0, parent.reply_count - 1)
+
+    def _apply(self, collection: str, subject: str, uri: str | None, change: int) -> None:
+        """Reflect a like, repost or follow being created (+1) or deleted (-1) in the views."""
+        if collection == "app.bsky.graph.follow":
+            profile = self.data._profiles.get(subject)
+            if profile is not None:
+                profile.follow_uri, profile.is_following = uri, change > 0
+                profile.followers_count += change
+            return
+        post = self.data._by_uri.get(subject)
+        if post is None:
+            return
+        if collection == "app.bsky.feed.like":
+            post.like_uri, post.is_liked = uri, change > 0
+            post.like_count += change
+        elif collection == "app.bsky.feed.repost":
+            post.repost_uri, post.is_reposted = uri, change > 0
+            post.repost_count += change
+
+    def create_record(self, body: dict) -> dict:
+        uri, cid = self._create(body["repo"], body["collection"], body.get("rkey"), body.get("record") or {})
+        return {"uri": uri, "cid": cid}
+
+    def delete_record(self, body: dict) -> dict:
+        self._delete(body["repo"], body["collection"], body["rkey"])
+        return {}
+
+    def apply_writes(self, body: dict) -> dict:
+        results = []
+        for write in body.get("writes", []):
+            if write.get("$type", "").endswith("#delete"):
+                self._delete(body["repo"], write["collection"], write["rkey"])
+                results.append({"$type": "com.atproto.repo.applyWrites#deleteResult"})
+            else:
+                uri, cid = self._create(body["repo"], write["collection"], write.get("rkey"), write.get("value") or {})
+                results.append({"$type": "com.atproto.repo.applyWrites#createResult", "uri": uri, "cid": cid})
+        return {"results": results}
+
+    def get_record(self, params: dict) -> dict:
+        uri = f"at://{params.get('repo')}/{params.get('collection')}/{params.get('rkey')}"
+        if uri not in self._records:
+            raise XrpcError(400, "RecordNotFound", f"Could not locate record: {uri}")
+        collection, subject = self._records[uri]
+        return {
+            "uri": uri,
+            "value": {"$type": collection, "subject": {"uri": subject, "cid": "bafyreimock"}, "createdAt": _now()},
+        }
+
+    def _convo(self, convo_id: str) -> ConversationData:
+        for convo in self.data._conversations:
+            if convo.id == convo_id:
+                return convo
+        raise XrpcError(400, "InvalidConvo", "Convo not found")
+
+    def list_convos(self, params: dict) -> dict:
+        convos, cursor = _page(self.data._conversations, params, 50)
+        return {"convos": [_convo_view(c) for c in convos], "cursor": cursor}
+
+    def get_messages(self, params: dict) -> dict:
+        convo = self._convo(params.get("convoId", ""))
+        # Stored oldest first; served newest first
+        newest_first = self.data._messages.get(convo.id, [])[::-1]
+        messages, cursor = _page(newest_first, params, 50)
+        return {"messages": [_message_view(m) for m in messages], "cursor": cursor}
+
+    def send_message(self, body: dict) -> dict:
+        convo = self._convo(body.get("convoId", ""))
+        me = self.data.me
+        msg = MessageData(
+            id=next_tid(),
+            convo_id=convo.id,
+            sender_did=me.did,
+            sender_handle=me.handle,
+            sender_display_name=me.display_name,
+            text=body.get("message", {}).get("text", ""),
+            sent_at=_now(),
+            is_mine=True,
+        )
+        self.data._messages.setdefault(convo.id, []).append(msg)
+        convo.last_message = msg
+        return _message_view(msg)
+
+    def update_read(self, body: dict) -> dict:
+        convo = self._convo(body.get("convoId", ""))
+        convo.unread_count = 0
+        return {"convo": _convo_view(convo)}
+
+
+_ROUTES = {
+    ("POST", "com.atproto.server.createSession"): MockServer.create_session,
+    ("POST", "com.atproto.server.refreshSession"): MockServer.refresh_session,
+    ("GET", "app.bsky.actor.getProfile"): MockServer.get_profile,
+    ("GET", "app.bsky.feed.getTimeline"): MockServer.get_timeline,
+    ("GET", "app.bsky.feed.getAuthorFeed"): MockServer.get_author_feed,
+    ("GET", "app.bsky.feed.getPostThread"): MockServer.get_post_thread,
+    ("GET", "app.bsky.notification.listNotifications"): MockServer.list_notifications,
+    ("POST", "app.bsky.notification.updateSeen"): MockServer.update_seen,
+    ("POST", "com.atproto.repo.createRecord"): MockServer.create_record,
+    ("POST", "com.atproto.repo.deleteRecord"): MockServer.delete_record,
+    ("POST", "com.atproto.repo.applyWrites"): MockServer.apply_writes,
+    ("GET", "com.atproto.repo.getRecord"): MockServer.get_record,
+    ("GET", "chat.bsky.convo.listConvos"): MockServer.list_convos,
+    ("GET", "chat.bsky.convo.getMessages"): MockServer.get_messages,
+    ("POST", "chat.bsky.convo.sendMessage"): MockServer.send_message,
+    ("POST", "chat.bsky.convo.updateRead"): MockServer.update_read,
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, as the real services
+    server_version = "bluesky_tui-mock"
+
+    def _serve(self, method: str) -> None:
+        url = urlsplit(self.path)
+        if not url.path.startswith("/xrpc/"):
+            self._send(404, {}, {"error": "NotFound", "message": "Not an XRPC path"})
+            return
+        body: dict = {}
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            try:
+                body = json.loads(self.rfile.read(length))
+            except ValueError:
+                self._send(400, {}, {"error": "InvalidRequest", "message": "Body is not JSON"})
+                return
+        try:
+            status, headers, payload = self.server.mock.handle(
+                method,
+                url.path.removeprefix("/xrpc/"),
+                dict(parse_qsl(url.query)),
+                body,
+                self.headers.get("Authorization", "").startswith("Bearer "),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            status, headers, payload = 400, {}, {"error": "InvalidRequest", "message": f"Bad input: {e!r}"}
+        self._send(status, headers, payload)
+
+    def _send(self, status: int, headers: dict, payload: dict) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up on the request (cancelled, or a hedged read that lost)
+            log.debug("%s went away before the response was sent", self.address_string())
+
+    def do_GET(self) -> None:
+        self._serve("GET")
+
+    def do_POST(self) -> None:
+        self._serve("POST")
+
+    def log_message(self, format: str, *args) -> None:
+        log.debug("%s " + format, self.address_string(), *args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--posts", type=int, help="Generate this many synthetic posts (default: the small demo dataset)")
+    parser.add_argument("--users", type=int, default=500, help="Synthetic accounts the posts are spread over")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Median log-normal delay per request")
+    parser.add_argument("--rate-limit", type=int, default=3000, help="Requests allowed per --rate-window")
+    parser.add_argument("--rate-window", type=float, default=300.0, metavar="SECONDS")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail with a 503")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s %(message)s")
+    server = MockServer(
+        DemoClient(posts=args.posts, users=args.users, seed=args.seed),
+        host=args.host,
+        port=args.port,
+        latency=Latency(args.latency_ms / 1000),
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    log.info("Serving on %s (python -m bluesky_tui --service-url %s)", server.url, server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+# Rows per section of a text report
+REPORT_ROWS = 40
+# Allocations are grouped by line, so only the innermost frame is needed
+TRACEMALLOC_FRAMES = 1
+
+
+class SessionProfiler:
+    """cProfile (and optionally tracemalloc) over a whole app session.
+
+    Each report is a ``.prof`` file, loadable with pstats or snakeviz, and a
+    ``.txt`` summary: the top functions by cumulative and own time and, when
+    *trace_memory* is on, the lines holding the most allocated memory.
+    """
+
+    def __init__(self, out_dir: Path, trace_memory: bool = False) -> None:
+        self.out_dir = out_dir
+        self.trace_memory = trace_memory
+        self._profile = cProfile.Profile()
+        self._started = 0.0
+
+    def start(self) -> None:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        if self.trace_memory:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._started = time.monotonic()
+        self._profile.enable()
+
+    def stop(self) -> Path:
+        """Stop profiling and write the final report; return its .txt path."""
+        self._profile.disable()
+        path = self._write("exit")
+        if self.trace_memory:
+            tracemalloc.stop()
+        return path
+
+    def snapshot(self) -> Path:
+        """Write a report of the session so far without stopping; return its .txt path."""
+        # Collecting stats disables the profiler
+        path = self._write("snapshot")
+        self._profile.enable()
+        return path
+
+    def _write(self, label: str) -> Path:
+        # Taken first so the report's own allocations don't show up in it
+        memory = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        stem = self.out_dir / f"profile-{time.strftime('%Y%m%d-%H%M%S')}-{label}"
+        self._profile.dump_stats(stem.with_suffix(".prof"))
+        report = io.StringIO()
+        report.write(f"Session time: {time.monotonic() - self._started:.1f}s\n\n")
+        stats = pstats.Stats(self._profile, stream=report).strip_dirs()
+        for key in ("cumulative", "tottime"):
+            report.write(f"== Top {REPORT_ROWS} by {key} ==\n")
+            stats.sort_stats(key).print_stats(REPORT_ROWS)
+        if memory is not None:
+            report.write(_allocation_report(memory))
+        path = stem.with_suffix(".txt")
+        path.write_text(report.getvalue())
+        log.info("Wrote profile report %s", path)
+        return path
+
+
+def _allocation_report(snapshot: tracemalloc.Snapshot) -> str:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ))
+    top = snapshot.statistics("lineno")
+    current, peak = tracemalloc.get_traced_memory()
+    lines = [
+        f"== Top {REPORT_ROWS} allocations by line ==",
+        f"Traced memory: {current / 2**20:.1f} MiB now, {peak / 2**20:.1f} MiB peak",
+    ]
+    for stat in top[:REPORT_ROWS]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines) + "\n"
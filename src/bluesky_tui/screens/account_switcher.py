@@ -6,6 +6,8 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView, ListItem
 
+from bluesky_tui.loop_monitor import offload
+
 
 class AccountItem(ListItem):
     """A row representing a saved account."""
@@ -110,18 +112,18 @@ class AccountSwitcherScreen(Screen):
 
     @work
     async def _switch_to(self, handle: str) -> None:
-        from bluesky_tui.config import set_active_account, load_accounts
+        from bluesky_tui.config import get_account_credentials, set_active_account
 
         set_active_account(handle)
 
-        # Find the credentials for this account
-        data = load_accounts()
-        creds = None
-        for acct in data["accounts"]:
-            if acct["handle"] == handle:
-                creds = acct
-                break
+        # A recently used account is still logged in: switch at once
+        client = self.app.clients.get(handle)
+        if client is not None:
+            self.app.activate_client(client)
+            return
 
+        # A keyring read can block for a while (D-Bus, a locked keychain)
+        creds = await offload(get_account_credentials, handle)
         if not creds:
             self.app.notify("Account not found.", severity="error")
             return
@@ -136,9 +138,7 @@ class AccountSwitcherScreen(Screen):
             self.app.notify(f"Login failed: {e}", severity="error")
             return
 
-        self.app.client = new_client
-        from bluesky_tui.screens.feed import FeedScreen
-        self.app.switch_screen(FeedScreen())
+        self.app.activate_client(new_client)
 
     def action_remove_account(self) -> None:
         lv = self.query_one("#account-list", ListView)
@@ -214,6 +214,8 @@ class AccountSwitcherScreen(Screen):
             if confirmed:
                 from bluesky_tui.config import remove_account
                 remove_account(handle)
+                self.app.clients.pop(handle)
+                self.app.forget_session(handle)
                 self._build_list()
                 self.app.notify(f"Removed @{handle}")
 
@@ -7,7 +7,9 @@ from textual.screen import ModalScreen
 from textual.widgets import Static, TextArea, Button
 from textual.containers import Vertical, Horizontal
 
+from bluesky_tui.api.errors import is_network_error
 from bluesky_tui.api.models import PostData
+from bluesky_tui.api.write_queue import next_tid
 
 MAX_CHARS = 300
 
@@ -128,15 +130,22 @@ class ComposeScreen(ModalScreen[PostData | None]):
         btn = self.query_one("#post-btn", Button)
         btn.disabled = True
         btn.label = "Posting..."
+        # Chosen up front so a post queued offline keeps its identity when replayed
+        rkey = next_tid()
         try:
             post = await self.app.client.create_post(
                 text=text,
                 reply_to=self._reply_to,
                 quote=self._quote,
+                rkey=rkey,
             )
             self.app.notify("Post sent!")
             self.dismiss(post)
         except Exception as e:
+            if is_network_error(e):
+                await self.app.queue_offline_post(rkey, text, self._reply_to, self._quote)
+                self.dismiss(None)
+                return
             self.app.notify(f"Failed to post: {e}", severity="error")
             btn.disabled = False
             btn.label = "Post"
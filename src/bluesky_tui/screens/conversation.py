@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -7,9 +9,14 @@ from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView, Input, Button
 from textual.containers import Horizontal
 
+from bluesky_tui.api.errors import is_network_error
+from bluesky_tui.api.scheduler import Priority, request_priority
+from bluesky_tui.api.write_queue import next_tid
 from bluesky_tui.widgets.message_item import MessageItem
 from bluesky_tui.api.models import ConversationData, MessageData
 
+log = logging.getLogger(__name__)
+
 
 class ConversationScreen(Screen):
     BINDINGS = [
@@ -22,6 +29,7 @@ class ConversationScreen(Screen):
         super().__init__()
         self._convo = convo
         self._last_message_id: str | None = None
+        self._poll_error: str | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -36,12 +44,12 @@ class ConversationScreen(Screen):
 
     def on_mount(self) -> None:
         my_did = self.app.client.me.did if self.app.client.me else ""
-        name = self._convo.display_name(my_did)
-        self.query_one("#convo-title", Static).update(f"Conversation with {name}")
+        self._title = f"Conversation with {self._convo.display_name(my_did)}"
+        self.query_one("#convo-title", Static).update(self._title)
         self._load_messages()
         self.set_interval(60, self._poll_new_messages)
 
-    @work
+    @work(exclusive=True, group="load")
     async def _load_messages(self) -> None:
         status = self.query_one("#convo-title", Static)
         try:
@@ -50,6 +58,8 @@ class ConversationScreen(Screen):
             message_list.clear()
             for msg in messages:
                 message_list.append(MessageItem(msg))
+            for entry in self._queued_messages():
+                message_list.append(MessageItem(self._message_from_text(entry.payload["text"], entry.queued_at), pending=True))
             if messages:
                 self._last_message_id = messages[-1].id
                 # Mark as read
@@ -74,10 +84,12 @@ class ConversationScreen(Screen):
     def _poll_new_messages(self) -> None:
         self._fetch_new_messages()
 
-    @work
+    @work(exclusive=True, group="poll")
     async def _fetch_new_messages(self) -> None:
         try:
-            messages, _ = await self.app.client.get_messages(self._convo.id)
+            with request_priority(Priority.VISIBLE):
+                messages, _ = await self.app.client.get_messages(self._convo.id)
+            self._set_poll_error(None)
             if not messages:
                 return
             # Find messages newer than last known
@@ -104,8 +116,19 @@ class ConversationScreen(Screen):
                     await self.app.client.mark_convo_read(self._convo.id, self._last_message_id)
                 except Exception:
                     pass
-        except Exception:
-            pass  # Silent poll failures — don't spam notifications
+        except Exception as e:
+            # The client has already retried; report once and keep polling
+            log.info("Polling %s failed: %s", self._convo.id, e)
+            self._set_poll_error(str(e))
+
+    def _set_poll_error(self, error: str | None) -> None:
+        if error and not self._poll_error:
+            self.app.notify(f"Can't fetch new messages: {error}", severity="warning")
+        elif self._poll_error and not error:
+            self.app.notify("Receiving new messages again.")
+        self._poll_error = error
+        title = f"{self._title}  [dim](new messages paused)[/dim]" if error else self._title
+        self.query_one("#convo-title", Static).update(title)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "message-input":
@@ -124,21 +147,32 @@ class ConversationScreen(Screen):
         input_widget.value = ""
         self._do_send(text)
 
-    @work
-    async def _do_send(self, text: str) -> None:
-        # Optimistic: append a placeholder message immediately
-        my_did = self.app.client.me.did if self.app.client.me else ""
-        from datetime import datetime, timezone
-        optimistic = MessageData(
+    def _queued_messages(self) -> list:
+        if not self.app.client.me:
+            return []
+        return [
+            e for e in self.app.outbox.pending(self.app.client.me.did, "dm")
+            if e.payload["convo_id"] == self._convo.id
+        ]
+
+    def _message_from_text(self, text: str, sent_at: str) -> MessageData:
+        me = self.app.client.me
+        return MessageData(
             id="__optimistic__",
             convo_id=self._convo.id,
-            sender_did=my_did,
-            sender_handle=self.app.client.me.handle if self.app.client.me else "",
-            sender_display_name=self.app.client.me.display_name if self.app.client.me else "",
+            sender_did=me.did if me else "",
+            sender_handle=me.handle if me else "",
+            sender_display_name=me.display_name if me else "",
             text=text,
-            sent_at=datetime.now(timezone.utc).isoformat(),
+            sent_at=sent_at,
             is_mine=True,
         )
+
+    @work
+    async def _do_send(self, text: str) -> None:
+        # Optimistic: append a placeholder message immediately
+        from datetime import datetime, timezone
+        optimistic = self._message_from_text(text, datetime.now(timezone.utc).isoformat())
         message_list = self.query_one("#message-list", ListView)
         optimistic_widget = MessageItem(optimistic)
         message_list.append(optimistic_widget)
@@ -153,6 +187,12 @@ class ConversationScreen(Screen):
             message_list.scroll_end(animate=False)
         except Exception as e:
             optimistic_widget.remove()
+            if is_network_error(e):
+                # Keep it on screen as queued; the app's outbox sends it once we're back online
+                await self.app.queue_offline_dm(next_tid(), self._convo.id, text, optimistic.sent_at)
+                message_list.append(MessageItem(optimistic, pending=True))
+                message_list.scroll_end(animate=False)
+                return
             self.app.notify(f"Failed to send message: {e}", severity="error")
 
     def action_focus_input(self) -> None:
@@ -6,6 +6,8 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView
 
+from bluesky_tui.api.scheduler import Priority, request_priority
+from bluesky_tui.widgets.bulk_mount import BulkListView
 from bluesky_tui.widgets.conversation_item import ConversationItem
 from bluesky_tui.api.models import ConversationData
 
@@ -29,20 +31,21 @@ class ConversationsScreen(Screen):
     def compose(self) -> ComposeResult:
         yield Header()
         yield Static("Messages", id="conversations-title")
-        yield ListView(id="convo-list")
+        yield BulkListView(id="convo-list", item_height=2)
         yield Static("Loading...", id="status-bar")
         yield Footer()
 
     def on_mount(self) -> None:
         self._load_conversations()
-        self.set_interval(60, self._load_conversations)
+        self.set_interval(60, lambda: self._load_conversations(Priority.VISIBLE))
 
-    @work
-    async def _load_conversations(self) -> None:
+    @work(exclusive=True, group="load")
+    async def _load_conversations(self, priority: Priority = Priority.INTERACTIVE) -> None:
         status = self.query_one("#status-bar", Static)
         status.update("Loading messages...")
         try:
-            convos, cursor = await self.app.client.list_conversations()
+            with request_priority(priority):
+                convos, cursor = await self.app.client.list_conversations()
             self._cursor = cursor
             self._all_convos = list(convos)
             self._rebuild_list()
@@ -63,11 +66,10 @@ class ConversationsScreen(Screen):
                 self.app.notify(f"Failed to load messages: {e}", severity="error")
 
     def _rebuild_list(self) -> None:
-        convo_list = self.query_one("#convo-list", ListView)
-        convo_list.clear()
         my_did = self.app.client.me.did if self.app.client.me else ""
-        for convo in self._all_convos:
-            convo_list.append(ConversationItem(convo, my_did))
+        self.query_one("#convo-list", BulkListView).set_items(
+            [ConversationItem(convo, my_did) for convo in self._all_convos]
+        )
 
     def _update_title(self) -> None:
         total_unread = sum(c.unread_count for c in self._all_convos)
@@ -96,11 +98,12 @@ class ConversationsScreen(Screen):
             self.app.push_screen(ConversationScreen(event.item.convo))
 
     def action_refresh(self) -> None:
+        self.workers.cancel_group(self, "load-more")
         self._cursor = None
         self._all_convos = []
         self._load_conversations()
 
-    @work
+    @work(exclusive=True, group="load-more")
     async def _load_more(self) -> None:
         if not self._cursor:
             return
@@ -111,9 +114,9 @@ class ConversationsScreen(Screen):
             self._cursor = cursor
             self._all_convos.extend(convos)
             my_did = self.app.client.me.did if self.app.client.me else ""
-            convo_list = self.query_one("#convo-list", ListView)
-            for convo in convos:
-                convo_list.append(ConversationItem(convo, my_did))
+            self.query_one("#convo-list", BulkListView).add_items(
+                [ConversationItem(convo, my_did) for convo in convos]
+            )
             self._update_title()
             status.update("")
         except Exception as e:
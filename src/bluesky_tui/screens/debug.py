@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from rich.console import Group
+from rich.table import Table
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import VerticalScroll
+from textual.screen import Screen
+from textual.widgets import Header, Footer, Static
+
+REFRESH_INTERVAL = 1.0
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def _kib(count: int) -> str:
+    return f"{count / 1024:.1f}"
+
+
+def _ratio(value: float | None) -> str:
+    return "-" if value is None else f"{value:.0%}"
+
+
+def _endpoint_table(endpoints: dict) -> Table:
+    table = Table(title="Endpoints", title_justify="left", expand=True)
+    table.add_column("Endpoint")
+    for name in ("Calls", "Err %", "p50 ms", "p95 ms", "p99 ms", "KiB out", "KiB in"):
+        table.add_column(name, justify="right")
+    # Slowest first: that's what this screen is for
+    rows = sorted(endpoints.items(), key=lambda item: item[1]["p95_ms"] or 0, reverse=True)
+    for name, stats in rows:
+        table.add_row(
+            name,
+            str(stats["calls"]),
+            _ratio(stats["error_rate"]),
+            _ms(stats["p50_ms"]),
+            _ms(stats["p95_ms"]),
+            _ms(stats["p99_ms"]),
+            _kib(stats["bytes_sent"]),
+            _kib(stats["bytes_received"]),
+        )
+    return table
+
+
+def _pairs_table(title: str, rows: list[tuple[str, object]]) -> Table:
+    table = Table(title=title, title_justify="left", show_header=False, expand=True)
+    table.add_column("Name")
+    table.add_column("Value", justify="right")
+    for name, value in rows:
+        table.add_row(name, str(value))
+    return table
+
+
+def _last_frame(stack: str) -> str:
+    # Frames are a "File ..., line N, in f" line, then the source line when it is available
+    lines = stack.strip().splitlines()
+    return next((line.strip() for line in reversed(lines) if line.lstrip().startswith("File ")), lines[-1].strip())
+
+
+class DebugScreen(Screen):
+    """Live request, cache and event-loop figures for diagnosing a slow session."""
+
+    BINDINGS = [
+        Binding("escape", "go_back", "Back"),
+        Binding("q", "go_back", "Back"),
+        Binding("f12", "go_back", "Back", show=False),
+    ]
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        with VerticalScroll():
+            yield Static(id="debug-body")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._refresh()
+        self.set_interval(REFRESH_INTERVAL, self._refresh)
+
+    def _refresh(self) -> None:
+        data = self.app.metrics_snapshot()
+        client = data["client"]
+        caches = [
+            (f"{name} hit ratio", f"{_ratio(cache['hit_ratio'])} ({cache['hits']}/{cache['hits'] + cache['misses']})")
+            for name, cache in data["caches"].items()
+        ]
+        counters = [
+            ("requests", client["requests"]),
+            ("errors", client["errors"]),
+            ("cancelled", client["cancelled"]),
+            ("deduplicated", client["deduplicated"]),
+            ("retries", client["retries"]),
+            ("hedges (won)", f"{client['hedges']} ({client['hedge_wins']})"),
+            ("circuit trips / rejections", f"{client['circuit_trips']} / {client['circuit_rejections']}"),
+            ("rate limited", data["scheduler"]["rate_limited"]),
+            ("connection reuse", _ratio(data["transport"]["reuse_rate"])),
+            ("handshake median ms", _ms(data["transport"]["handshake_ms_median"])),
+        ]
+        loop = data["loop"]
+        rendering = [
+            ("stalls over 100 ms", loop["stalls"]),
+            ("max loop lag ms", _ms(loop["max_lag_ms"])),
+        ]
+        if loop["last_stack"] and loop["last_stack"].strip():
+            rendering.append(("last stall in", _last_frame(loop["last_stack"])))
+        self.query_one("#debug-body", Static).update(Group(
+            _endpoint_table(client["endpoints"]),
+            _pairs_table("Caches", caches),
+            _pairs_table("Requests", counters),
+            _pairs_table("Event loop", rendering),
+        ))
+
+    def action_go_back(self) -> None:
+        self.app.pop_screen()
@@ -4,13 +4,16 @@ from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Header, Footer, Static, ListView
 
-from bluesky_tui.api.models import PostData
+from bluesky_tui.api.errors import is_network_error
+from bluesky_tui.filters import BUILTIN_FILTERS, PostFilter, available_filters
 from bluesky_tui.widgets.post_list import PostList
 from bluesky_tui.widgets.post import PostWidget
 
-FILTERS = ["all", "posts only", "text only"]
+# Seconds the cursor must rest on a post before its thread is prefetched
+PREFETCH_DWELL = 0.4
 
 
 class FeedScreen(Screen):
@@ -28,8 +31,10 @@ class FeedScreen(Screen):
         Binding("u", "my_profile", "Me"),
         Binding("n", "notifications", "Notifs"),
         Binding("m", "messages", "Messages"),
+        Binding("i", "inbox", "Inbox"),
         Binding("s", "settings", "Settings"),
         Binding("f", "cycle_filter", "Filter"),
+        Binding("slash", "search", "Search"),
         Binding("space", "load_more", "More", show=False),
         Binding("R", "refresh_feed", "Refresh"),
         Binding("a", "switch_account", "Accounts"),
@@ -39,8 +44,9 @@ class FeedScreen(Screen):
     def __init__(self) -> None:
         super().__init__()
         self._cursor: str | None = None
-        self._all_posts: list[PostData] = []
+        self._filters: list[PostFilter] = list(BUILTIN_FILTERS)
         self._filter_index: int = 0
+        self._dwell_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -50,33 +56,30 @@ class FeedScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
+        self._filters = available_filters(self.app.settings)
         default_filter = self.app.settings.get("default_filter", "all")
-        if default_filter in FILTERS:
-            self._filter_index = FILTERS.index(default_filter)
+        names = [f.name for f in self._filters]
+        if default_filter in names:
+            self._filter_index = names.index(default_filter)
+        self._apply_filter()
         if self.app.settings.get("post_density") == "compact":
             self.add_class("compact-density")
         self._load_timeline()
+        # Flush anything this account queued while offline in an earlier session
+        self.app.replay_outbox()
 
-    def _apply_filter(self, posts: list[PostData]) -> list[PostData]:
-        f = FILTERS[self._filter_index]
-        if f == "posts only":
-            return [p for p in posts if not p.reason_repost_by and not p.reply_parent_uri]
-        elif f == "text only":
-            return [p for p in posts if not p.has_image and not p.has_video]
-        return posts
-
-    def _refresh_list(self) -> None:
-        filtered = self._apply_filter(self._all_posts)
-        self.query_one("#feed-list", PostList).set_posts(filtered)
-        label = FILTERS[self._filter_index]
-        self.query_one("#filter-bar", Static).update(f"Filter: {label}")
+    def _apply_filter(self) -> None:
+        # Hides and shows rows already in the list; posts loaded later are filtered as they mount
+        post_filter = self._filters[self._filter_index]
+        self.query_one("#feed-list", PostList).filter_posts(post_filter)
+        self.query_one("#filter-bar", Static).update(f"Filter: {post_filter.name}")
 
     def action_cycle_filter(self) -> None:
-        self._filter_index = (self._filter_index + 1) % len(FILTERS)
-        self._refresh_list()
-        self.app.notify(f"Filter: {FILTERS[self._filter_index]}")
+        self._filter_index = (self._filter_index + 1) % len(self._filters)
+        self._apply_filter()
+        self.app.notify(f"Filter: {self._filters[self._filter_index].name}")
 
-    @work
+    @work(exclusive=True, group="load")
     async def _load_timeline(self) -> None:
         status = self.query_one("#status-bar", Static)
         status.update("Loading timeline...")
@@ -84,8 +87,7 @@ class FeedScreen(Screen):
             limit = self.app.settings.get("posts_per_page", 30)
             posts, cursor = await self.app.client.get_timeline(limit=limit)
             self._cursor = cursor
-            self._all_posts = posts
-            self._refresh_list()
+            self.query_one("#feed-list", PostList).set_posts(posts)
             status.update("")
         except Exception as e:
             status.update(f"Error: {e}")
@@ -116,10 +118,15 @@ class FeedScreen(Screen):
             data.like_uri = None
             widget.post_data = data
             widget._refresh_display()
+            if not old_uri:
+                return
+            if await self.app.discard_offline_like(old_uri, data):
+                return  # never sent, so there is nothing to delete on the server
             try:
-                if old_uri:
-                    await self.app.client.unlike(old_uri)
+                await self.app.client.unlike(old_uri, data.uri)
             except Exception as e:
+                if data.is_liked:
+                    return  # liked again since; that write carries the current state
                 data.is_liked = True
                 data.like_count += 1
                 data.like_uri = old_uri
@@ -127,18 +134,28 @@ class FeedScreen(Screen):
                 widget._refresh_display()
                 self.app.notify(f"Unlike failed: {e}", severity="error")
         else:
-            # Optimistic like
+            # Optimistic like; the record URI is known before the write is committed
+            pending = self.app.client.like(data.uri, data.cid)
             data.is_liked = True
             data.like_count += 1
+            data.like_uri = pending.uri
             widget.post_data = data
             widget._refresh_display()
             try:
-                like_uri = await self.app.client.like(data.uri, data.cid)
-                data.like_uri = like_uri
-                widget.post_data = data
+                like_uri = await pending
+                if like_uri and data.like_uri == pending.uri:
+                    data.like_uri = like_uri
+                    widget.post_data = data
             except Exception as e:
+                if data.like_uri != pending.uri:
+                    return  # unliked since; nothing to roll back
+                if is_network_error(e):
+                    # Keep the like; the outbox sends it with the same rkey once we're back online
+                    await self.app.queue_offline_like(pending.rkey, data)
+                    return
                 data.is_liked = False
                 data.like_count = max(0, data.like_count - 1)
+                data.like_uri = None
                 widget.post_data = data
                 widget._refresh_display()
                 self.app.notify(f"Like failed: {e}", severity="error")
@@ -161,10 +178,13 @@ class FeedScreen(Screen):
             data.repost_uri = None
             widget.post_data = data
             widget._refresh_display()
+            if not old_uri:
+                return
             try:
-                if old_uri:
-                    await self.app.client.unrepost(old_uri)
+                await self.app.client.unrepost(old_uri, data.uri)
             except Exception as e:
+                if data.is_reposted:
+                    return
                 data.is_reposted = True
                 data.repost_count += 1
                 data.repost_uri = old_uri
@@ -172,21 +192,40 @@ class FeedScreen(Screen):
                 widget._refresh_display()
                 self.app.notify(f"Unrepost failed: {e}", severity="error")
         else:
+            pending = self.app.client.repost(data.uri, data.cid)
             data.is_reposted = True
             data.repost_count += 1
+            data.repost_uri = pending.uri
             widget.post_data = data
             widget._refresh_display()
             try:
-                repost_uri = await self.app.client.repost(data.uri, data.cid)
-                data.repost_uri = repost_uri
-                widget.post_data = data
+                repost_uri = await pending
+                if repost_uri and data.repost_uri == pending.uri:
+                    data.repost_uri = repost_uri
+                    widget.post_data = data
             except Exception as e:
+                if data.repost_uri != pending.uri:
+                    return
                 data.is_reposted = False
                 data.repost_count = max(0, data.repost_count - 1)
+                data.repost_uri = None
                 widget.post_data = data
                 widget._refresh_display()
                 self.app.notify(f"Repost failed: {e}", severity="error")
 
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        if self._dwell_timer:
+            self._dwell_timer.stop()
+        self.app.prefetcher.cancel()
+        if isinstance(event.item, PostWidget) and event.item.post_data:
+            uri = event.item.post_data.uri
+            self._dwell_timer = self.set_timer(PREFETCH_DWELL, lambda: self._prefetch_thread(uri))
+
+    def _prefetch_thread(self, uri: str) -> None:
+        post = self.query_one("#feed-list", PostList).selected_post
+        if post and post.uri == uri:
+            self.app.prefetcher.prefetch(self.app.client, uri)
+
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if isinstance(event.item, PostWidget) and event.item.post_data:
             from bluesky_tui.screens.thread import ThreadScreen
@@ -218,11 +257,10 @@ class FeedScreen(Screen):
             self.app.push_screen(ProfileScreen(post.author_did))
 
     def action_view_on_web(self) -> None:
-        import webbrowser
         post_list = self.query_one("#feed-list", PostList)
         post = post_list.selected_post
         if post:
-            webbrowser.open(post.web_url)
+            self.app.open_url(post.web_url)
 
     def action_delete_post(self) -> None:
         self._delete_post()
@@ -247,7 +285,7 @@ class FeedScreen(Screen):
     def action_load_more(self) -> None:
         self._load_more()
 
-    @work
+    @work(exclusive=True, group="load-more")
     async def _load_more(self) -> None:
         if not self._cursor:
             self.app.notify("No more posts to load.")
@@ -258,16 +296,14 @@ class FeedScreen(Screen):
             limit = self.app.settings.get("posts_per_page", 30)
             posts, cursor = await self.app.client.get_timeline(cursor=self._cursor, limit=limit)
             self._cursor = cursor
-            self._all_posts.extend(posts)
-            filtered = self._apply_filter(posts)
-            self.query_one("#feed-list", PostList).append_posts(filtered)
+            self.query_one("#feed-list", PostList).append_posts(posts)
             status.update("")
         except Exception as e:
             status.update(f"Error: {e}")
 
     def action_refresh_feed(self) -> None:
+        self.workers.cancel_group(self, "load-more")
         self._cursor = None
-        self._all_posts.clear()
         self._load_timeline()
 
     def action_my_profile(self) -> None:
@@ -283,6 +319,14 @@ class FeedScreen(Screen):
         from bluesky_tui.screens.conversations import ConversationsScreen
         self.app.push_screen(ConversationsScreen())
 
+    def action_search(self) -> None:
+        from bluesky_tui.screens.search import SearchScreen
+        self.app.push_screen(SearchScreen())
+
+    def action_inbox(self) -> None:
+        from bluesky_tui.screens.inbox import InboxScreen
+        self.app.push_screen(InboxScreen())
+
     def action_switch_account(self) -> None:
         from bluesky_tui.screens.account_switcher import AccountSwitcherScreen
         self.app.push_screen(AccountSwitcherScreen())
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+
+from textual import work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import Header, Footer, Static, ListView
+
+from bluesky_tui.api.inbox import InboxAggregator, InboxEntry
+from bluesky_tui.loop_monitor import offload
+from bluesky_tui.widgets.inbox_item import InboxItem
+
+INBOX_POLL_INTERVAL = 60
+
+
+class InboxScreen(Screen):
+    """Notifications and conversations of every saved account in one list."""
+
+    BINDINGS = [
+        Binding("j", "cursor_down", "Down", show=False),
+        Binding("k", "cursor_up", "Up", show=False),
+        Binding("enter", "open_entry", "Open"),
+        Binding("R", "refresh", "Refresh"),
+        Binding("space", "load_more", "More", show=False),
+        Binding("escape", "go_back", "Back"),
+        Binding("q", "go_back", "Back"),
+    ]
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Accounts it signs in join the app's pool, so the next visit (or a switch) reuses them
+        self._inbox = InboxAggregator(on_login=lambda client: self.app.pool_client(client))
+        self._accounts: list[tuple[str, str]] = []
+        # Merging and patching the list must not interleave between workers
+        self._apply_lock = asyncio.Lock()
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Static("Inbox", id="inbox-title")
+        yield ListView(id="inbox-list")
+        yield Static("Loading...", id="status-bar")
+        yield Footer()
+
+    async def on_mount(self) -> None:
+        from bluesky_tui.config import get_app_password, load_accounts
+
+        current = self.app.client
+        if current.me:
+            self._inbox.add_client(current.me.handle, current)
+            self._accounts.append((current.me.handle, ""))
+        for acct in load_accounts().get("accounts", []):
+            handle = acct["handle"]
+            if any(h == handle for h, _ in self._accounts):
+                continue
+            pooled = self.app.clients.peek(handle)
+            if pooled is not None:
+                self._inbox.add_client(handle, pooled)
+                self._accounts.append((handle, ""))
+            else:
+                self._accounts.append((handle, await offload(get_app_password, handle) or ""))
+        count = len(self._accounts)
+        self.query_one("#inbox-title", Static).update(f"Inbox ({count} account{'s' if count != 1 else ''})")
+        self._poll()
+        self.set_interval(INBOX_POLL_INTERVAL, self._poll)
+
+    async def _apply(self, batch: list[InboxEntry]) -> None:
+        async with self._apply_lock:
+            removed, inserted = self._inbox.merge(batch)
+            inbox_list = self.query_one("#inbox-list", ListView)
+            if removed:
+                await inbox_list.remove_items(removed)
+            for index in inserted:
+                await inbox_list.insert(index, [InboxItem(self._inbox.entries[index])])
+
+    async def _fetch(self, more: bool) -> None:
+        status = self.query_one("#status-bar", Static)
+        status.update("Loading more..." if more else "Refreshing...")
+        async for batch in self._inbox.poll(self._accounts, more=more):
+            # Shielded so a cancelled worker can't leave the list half-patched
+            await asyncio.shield(self._apply(batch))
+        if self._inbox.errors:
+            failed = ", ".join(f"@{handle} ({kind})" for handle, kind in self._inbox.errors)
+            status.update(f"Couldn't load: {failed}")
+        else:
+            status.update("")
+
+    @work(exclusive=True, group="load")
+    async def _poll(self) -> None:
+        await self._fetch(more=False)
+
+    def action_load_more(self) -> None:
+        if not self._inbox.has_more():
+            self.app.notify("Nothing more to load.")
+            return
+        self._load_more()
+
+    @work(exclusive=True, group="load-more")
+    async def _load_more(self) -> None:
+        await self._fetch(more=True)
+
+    def action_refresh(self) -> None:
+        self._poll()
+
+    def action_cursor_down(self) -> None:
+        self.query_one("#inbox-list", ListView).action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        self.query_one("#inbox-list", ListView).action_cursor_up()
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        if isinstance(event.item, InboxItem):
+            self._open(event.item.entry)
+
+    def action_open_entry(self) -> None:
+        child = self.query_one("#inbox-list", ListView).highlighted_child
+        if isinstance(child, InboxItem):
+            self._open(child.entry)
+
+    def _open(self, entry: InboxEntry) -> None:
+        # Open as the account the entry belongs to
+        client = self._inbox.clients.get(entry.account)
+        if client is not None and client is not self.app.client:
+            from bluesky_tui.config import set_active_account
+
+            set_active_account(entry.account)
+            self.app.activate_client(client)
+
+        if entry.conversation:
+            from bluesky_tui.screens.conversation import ConversationScreen
+            self.app.push_screen(ConversationScreen(entry.conversation))
+            return
+        n = entry.notification
+        if n.reason in ("like", "repost", "reply", "mention", "quote") and n.subject_uri:
+            from bluesky_tui.screens.thread import ThreadScreen
+            self.app.push_screen(ThreadScreen(n.subject_uri))
+        else:
+            from bluesky_tui.screens.profile import ProfileScreen
+            self.app.push_screen(ProfileScreen(n.author_did))
+
+    def action_go_back(self) -> None:
+        self.app.pop_screen()
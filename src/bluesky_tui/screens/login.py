@@ -79,13 +79,18 @@ class LoginScreen(Screen):
         login_btn.label = "Logging in..."
         error_label.remove_class("visible")
 
+        # Adding an account: leave the current one's client logged in for switching back
+        client = self.app.client
+        if client.me is not None:
+            from bluesky_tui.api.client import BlueskyClient
+            client = BlueskyClient()
+
         try:
-            await self.app.client.login(handle, password)
+            await client.login(handle, password)
             if save_checkbox.value:
                 from bluesky_tui.config import add_account
                 add_account(handle, password)
-            from bluesky_tui.screens.feed import FeedScreen
-            self.app.switch_screen(FeedScreen())
+            self.app.activate_client(client)
         except Exception as e:
             error_label.update(f"Login failed: {e}")
             error_label.add_class("visible")
@@ -7,6 +7,7 @@ from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView
 
 from bluesky_tui.api.models import NotificationData
+from bluesky_tui.widgets.bulk_mount import BulkListView
 from bluesky_tui.widgets.notification_item import (
     NotificationItem,
     GroupedNotificationItem,
@@ -63,7 +64,7 @@ class NotificationsScreen(Screen):
     def compose(self) -> ComposeResult:
         yield Header()
         yield Static("Notifications", id="notif-title")
-        yield ListView(id="notif-list")
+        yield BulkListView(id="notif-list", item_height=2)
         yield Static("Loading...", id="status-bar")
         yield Footer()
 
@@ -89,14 +90,10 @@ class NotificationsScreen(Screen):
         return [n for n in notifications if _is_enabled(n)]
 
     def _rebuild_list(self) -> None:
-        notif_list = self.query_one("#notif-list", ListView)
-        notif_list.clear()
         filtered = self._filter_by_type(self._all_notifications)
-        items = _group_notifications(filtered)
-        for item in items:
-            notif_list.append(item)
+        self.query_one("#notif-list", BulkListView).set_items(_group_notifications(filtered))
 
-    @work
+    @work(exclusive=True, group="load")
     async def _load_notifications(self) -> None:
         status = self.query_one("#status-bar", Static)
         status.update("Loading notifications...")
@@ -157,6 +154,7 @@ class NotificationsScreen(Screen):
             self.app.push_screen(ProfileScreen(child.data.author_did))
 
     def action_refresh_notifications(self) -> None:
+        self.workers.cancel_group(self, "load-more")
         self._cursor = None
         self._all_notifications.clear()
         self._load_notifications()
@@ -164,7 +162,7 @@ class NotificationsScreen(Screen):
     def action_load_more(self) -> None:
         self._load_more()
 
-    @work
+    @work(exclusive=True, group="load-more")
     async def _load_more(self) -> None:
         if not self._cursor:
             self.app.notify("No more notifications.")
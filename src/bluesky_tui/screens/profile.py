@@ -6,6 +6,7 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView
 
+from bluesky_tui.api.errors import is_network_error
 from bluesky_tui.widgets.post import PostWidget
 from bluesky_tui.widgets.post_list import PostList
 from bluesky_tui.widgets.user_header import UserHeader
@@ -41,9 +42,11 @@ class ProfileScreen(Screen):
     def on_mount(self) -> None:
         if self.app.settings.get("post_density") == "compact":
             self.add_class("compact-density")
+        # Header and posts are independent requests; render whichever lands first
         self._load_profile()
+        self._load_posts()
 
-    @work
+    @work(exclusive=True, group="load-profile")
     async def _load_profile(self) -> None:
         try:
             self._profile = await self.app.client.get_profile(self._did)
@@ -51,7 +54,12 @@ class ProfileScreen(Screen):
             header = UserHeader(self._profile, id="profile-header")
             self.mount(header, before=placeholder)
             placeholder.remove()
+        except Exception as e:
+            self.query_one("#status-bar", Static).update(f"Error: {e}")
 
+    @work(exclusive=True, group="load-posts")
+    async def _load_posts(self) -> None:
+        try:
             limit = self.app.settings.get("posts_per_page", 30)
             posts, cursor = await self.app.client.get_author_feed(self._did, limit=limit)
             self._cursor = cursor
@@ -70,27 +78,47 @@ class ProfileScreen(Screen):
 
     @work
     async def _toggle_follow(self) -> None:
-        if not self._profile:
+        profile = self._profile
+        if not profile:
             return
-        try:
-            if self._profile.is_following and self._profile.follow_uri:
-                await self.app.client.unfollow(self._profile.follow_uri)
-                self._profile.is_following = False
-                self._profile.follow_uri = None
-                self.app.notify(f"Unfollowed @{self._profile.handle}")
-            else:
-                uri = await self.app.client.follow(self._profile.did)
-                self._profile.is_following = True
-                self._profile.follow_uri = uri
-                self.app.notify(f"Followed @{self._profile.handle}")
-            # Refresh header
+        # Optimistic; self._profile is the client's cached object, so the cache stays current too
+        if profile.is_following and profile.follow_uri:
+            old_uri = profile.follow_uri
+            profile.is_following = False
+            profile.follow_uri = None
+            self._refresh_header()
             try:
-                header = self.query_one("#profile-header", UserHeader)
-                header.update_profile(self._profile)
-            except Exception:
-                pass
-        except Exception as e:
-            self.app.notify(f"Follow action failed: {e}", severity="error")
+                await self.app.client.unfollow(old_uri, profile.did)
+                self.app.notify(f"Unfollowed @{profile.handle}")
+            except Exception as e:
+                if not profile.is_following:
+                    profile.is_following = True
+                    profile.follow_uri = old_uri
+                    self._refresh_header()
+                self.app.notify(f"Follow action failed: {e}", severity="error")
+        else:
+            pending = self.app.client.follow(profile.did)
+            profile.is_following = True
+            profile.follow_uri = pending.uri
+            self._refresh_header()
+            try:
+                uri = await pending
+                if uri and profile.follow_uri == pending.uri:
+                    profile.follow_uri = uri
+                self.app.notify(f"Followed @{profile.handle}")
+            except Exception as e:
+                if profile.follow_uri == pending.uri:
+                    profile.is_following = False
+                    profile.follow_uri = None
+                    self._refresh_header()
+                self.app.notify(f"Follow action failed: {e}", severity="error")
+
+    def _refresh_header(self) -> None:
+        try:
+            header = self.query_one("#profile-header", UserHeader)
+            header.update_profile(self._profile)
+        except Exception:
+            pass
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if isinstance(event.item, PostWidget) and event.item.post_data:
@@ -114,6 +142,7 @@ class ProfileScreen(Screen):
         if not widget or not widget.post_data:
             return
         data = widget.post_data
+
         if data.is_liked:
             old_uri = data.like_uri
             data.is_liked = False
@@ -121,34 +150,50 @@ class ProfileScreen(Screen):
             data.like_uri = None
             widget.post_data = data
             widget._refresh_display()
+            if not old_uri:
+                return
+            if await self.app.discard_offline_like(old_uri, data):
+                return  # never sent, so there is nothing to delete on the server
             try:
-                if old_uri:
-                    await self.app.client.unlike(old_uri)
+                await self.app.client.unlike(old_uri, data.uri)
             except Exception:
+                if data.is_liked:
+                    return  # liked again since; that write carries the current state
                 data.is_liked = True
                 data.like_count += 1
                 data.like_uri = old_uri
                 widget.post_data = data
                 widget._refresh_display()
         else:
+            # The record URI is known before the write is committed
+            pending = self.app.client.like(data.uri, data.cid)
             data.is_liked = True
             data.like_count += 1
+            data.like_uri = pending.uri
             widget.post_data = data
             widget._refresh_display()
             try:
-                like_uri = await self.app.client.like(data.uri, data.cid)
-                data.like_uri = like_uri
-                widget.post_data = data
-            except Exception:
+                like_uri = await pending
+                if like_uri and data.like_uri == pending.uri:
+                    data.like_uri = like_uri
+                    widget.post_data = data
+            except Exception as e:
+                if data.like_uri != pending.uri:
+                    return  # unliked since; nothing to roll back
+                if is_network_error(e):
+                    # Keep the like; the outbox sends it with the same rkey once we're back online
+                    await self.app.queue_offline_like(pending.rkey, data)
+                    return
                 data.is_liked = False
                 data.like_count = max(0, data.like_count - 1)
+                data.like_uri = None
                 widget.post_data = data
                 widget._refresh_display()
 
     def action_load_more(self) -> None:
         self._load_more()
 
-    @work
+    @work(exclusive=True, group="load-more")
     async def _load_more(self) -> None:
         if not self._cursor:
             return
@@ -161,11 +206,10 @@ class ProfileScreen(Screen):
             self.app.notify(f"Failed to load more: {e}", severity="error")
 
     def action_view_on_web(self) -> None:
-        import webbrowser
         post_list = self.query_one("#profile-posts", PostList)
         post = post_list.selected_post
         if post:
-            webbrowser.open(post.web_url)
+            self.app.open_url(post.web_url)
 
     def action_go_back(self) -> None:
         self.app.pop_screen()
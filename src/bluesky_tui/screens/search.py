@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import Header, Footer, Static, ListView, Input
+
+from bluesky_tui.api.search_index import SearchResult
+from bluesky_tui.widgets.bulk_mount import BulkListView
+from bluesky_tui.widgets.search_result import SearchResultItem
+
+RESULT_LIMIT = 50
+
+
+class SearchScreen(Screen):
+    """Search everything loaded this session (posts, notifications, messages) as you type."""
+
+    BINDINGS = [
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("escape", "go_back", "Back"),
+    ]
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Input(placeholder="Search posts, notifications and messages you've seen...", id="search-input")
+        yield BulkListView(id="search-results", item_height=2)
+        yield Static("", id="status-bar")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._show_index_size()
+        self.query_one("#search-input", Input).focus()
+
+    def _show_index_size(self) -> None:
+        count = len(self.app.client.search_index)
+        self.query_one("#status-bar", Static).update(f"{count} items indexed this session")
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        results_list = self.query_one("#search-results", BulkListView)
+        if not event.value.strip():
+            results_list.set_items([])
+            self._show_index_size()
+            return
+        start = time.perf_counter()
+        results = self.app.client.search_index.search(event.value, limit=RESULT_LIMIT)
+        elapsed = (time.perf_counter() - start) * 1000
+        results_list.set_items([SearchResultItem(result) for result in results], index=0 if results else None)
+        self.query_one("#status-bar", Static).update(
+            f"{len(results)}{'+' if len(results) == RESULT_LIMIT else ''} results in {elapsed:.1f} ms"
+        )
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        child = self.query_one("#search-results", BulkListView).highlighted_child
+        if isinstance(child, SearchResultItem):
+            self._open(child.result)
+
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        if isinstance(event.item, SearchResultItem):
+            self._open(event.item.result)
+
+    def _open(self, result: SearchResult) -> None:
+        if result.kind == "message":
+            convo = self.app.client.search_index.conversations.get(result.item.convo_id)
+            if convo is None:
+                self.app.notify("That conversation is no longer loaded.", severity="warning")
+                return
+            from bluesky_tui.screens.conversation import ConversationScreen
+            self.app.push_screen(ConversationScreen(convo))
+            return
+        from bluesky_tui.screens.thread import ThreadScreen
+        if result.kind == "post":
+            self.app.push_screen(ThreadScreen(result.item.uri, post=result.item))
+        else:
+            # Only replies, mentions and quotes are indexed; their URI is the post itself
+            self.app.push_screen(ThreadScreen(result.item.uri))
+
+    def action_cursor_down(self) -> None:
+        self.query_one("#search-results", BulkListView).action_cursor_down()
+
+    def action_cursor_up(self) -> None:
+        self.query_one("#search-results", BulkListView).action_cursor_up()
+
+    def action_go_back(self) -> None:
+        self.app.pop_screen()
@@ -5,10 +5,10 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView, ListItem
 
+from bluesky_tui.filters import available_filters
 
 THEMES = ["textual-dark", "textual-light", "textual-ansi"]
 DENSITIES = ["normal", "compact"]
-FILTERS = ["all", "posts only", "text only"]
 POSTS_PER_PAGE = [15, 30, 50]
 NOTIFICATION_TYPES = ["like", "repost", "reply", "follow", "mention", "quote"]
 
@@ -201,9 +201,10 @@ class SettingsScreen(Screen):
             return
 
         if key == "default_filter":
+            filters = [f.name for f in available_filters(self._settings)]
             current = self._settings["default_filter"]
-            idx = FILTERS.index(current) if current in FILTERS else 0
-            new_val = FILTERS[(idx + 1) % len(FILTERS)]
+            idx = filters.index(current) if current in filters else 0
+            new_val = filters[(idx + 1) % len(filters)]
             self._settings["default_filter"] = new_val
             child.update_value(new_val)
             self._save()
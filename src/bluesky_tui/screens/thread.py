@@ -6,14 +6,47 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, ListView
 
+from bluesky_tui.api.errors import is_network_error
+from bluesky_tui.api.models import PostData, ThreadData, ThreadNode
+from bluesky_tui.api.scheduler import Priority, request_priority
 from bluesky_tui.widgets.post import PostWidget
 from bluesky_tui.widgets.post_list import PostList
+from bluesky_tui.widgets.thread_post import ThreadPostWidget
+
+# Cached threads younger than this (seconds) are shown without a refetch
+REVALIDATE_AFTER = 10.0
+
+
+def _visible_rows(nodes: list[ThreadNode], depth: int) -> list[ThreadPostWidget]:
+    """Build widgets for *nodes* and every expanded descendant, in display order."""
+    rows: list[ThreadPostWidget] = []
+    for node in nodes:
+        rows.append(ThreadPostWidget(node, depth))
+        if node.expanded:
+            rows.extend(_visible_rows(node.replies, depth + 1))
+    return rows
+
+
+def _carry_over_subtrees(old: list[ThreadNode], new: list[ThreadNode]) -> None:
+    """Keep replies the user already expanded when a fresher thread replaces *old*."""
+    previous = {node.post.uri: node for node in old}
+    for node in new:
+        prev = previous.get(node.post.uri)
+        if prev is None:
+            continue
+        node.expanded = prev.expanded
+        if node.replies_loaded:
+            _carry_over_subtrees(prev.replies, node.replies)
+        elif prev.replies_loaded:
+            node.replies = prev.replies
+            node.replies_loaded = True
 
 
 class ThreadScreen(Screen):
     BINDINGS = [
         Binding("j", "cursor_down", "Down", show=False),
         Binding("k", "cursor_up", "Up", show=False),
+        Binding("e", "toggle_expand", "Expand"),
         Binding("l", "toggle_like", "Like"),
         Binding("r", "reply", "Reply"),
         Binding("p", "view_profile", "Profile"),
@@ -22,9 +55,13 @@ class ThreadScreen(Screen):
         Binding("q", "go_back", "Back"),
     ]
 
-    def __init__(self, post_uri: str) -> None:
+    def __init__(self, post_uri: str, post: PostData | None = None) -> None:
         super().__init__()
         self._post_uri = post_uri
+        self._post = post  # shown on its own while the thread loads, if given
+        self._expanding: set[str] = set()
+        self._thread: ThreadData | None = None
+        self._placeholder = False  # only self._post is on screen
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -36,33 +73,59 @@ class ThreadScreen(Screen):
     def on_mount(self) -> None:
         if self.app.settings.get("post_density") == "compact":
             self.add_class("compact-density")
+        # Stale-while-revalidate: show a cached copy at once, then refresh it
+        cache = self.app.client.thread_cache
+        cached = cache.get(self._post_uri)
+        if cached:
+            self._render_thread(cached)
+            age = cache.age(self._post_uri)
+            if age is not None and age < REVALIDATE_AFTER:
+                return
+        elif self._post:
+            self._render_thread(ThreadData(parents=[], post=self._post, replies=[]))
+            self._placeholder = True
         self._load_thread()
 
-    @work
+    def _render_thread(self, thread: ThreadData) -> None:
+        post_list = self.query_one("#thread-list", PostList)
+        # The placeholder's one row is the opened post, which the loaded thread highlights anyway
+        selected = None if self._placeholder else post_list.selected_post
+        self._placeholder = False
+        self._thread = thread
+        all_posts = []
+        for parent in thread.parents:
+            all_posts.append(parent)
+        if thread.post:
+            all_posts.append(thread.post)
+        rows = [PostWidget(post) for post in all_posts] + _visible_rows(thread.replies, 1)
+
+        # Keep the cursor on the same post across a revalidation, else highlight the main post
+        index = len(thread.parents)
+        if selected:
+            for i, row in enumerate(rows):
+                if row.post_data and row.post_data.uri == selected.uri:
+                    index = i
+                    break
+        post_list.set_items(rows, index=index if rows else None)
+
+    @work(exclusive=True, group="load")
     async def _load_thread(self) -> None:
         status = self.query_one("#status-bar", Static)
-        status.update("Loading thread...")
+        revalidating = self._thread is not None and not self._placeholder
+        status.update("Refreshing thread..." if revalidating else "Loading thread...")
+        # Revalidating a thread already on screen can yield to the user's own requests
+        priority = Priority.VISIBLE if revalidating else Priority.INTERACTIVE
         try:
-            thread = await self.app.client.get_post_thread(self._post_uri)
-            post_list = self.query_one("#thread-list", PostList)
-            all_posts = []
-            for parent in thread.parents:
-                all_posts.append(parent)
-            if thread.post:
-                all_posts.append(thread.post)
-            for reply in thread.replies:
-                all_posts.append(reply)
-            post_list.set_posts(all_posts)
-
-            # Highlight the main post
-            main_idx = len(thread.parents)
-            if main_idx < len(post_list.children):
-                post_list.index = main_idx
-
+            with request_priority(priority):
+                thread = await self.app.client.get_post_thread(self._post_uri)
+            if self._thread:
+                _carry_over_subtrees(self._thread.replies, thread.replies)
+            self._render_thread(thread)
             status.update("")
         except Exception as e:
             status.update(f"Error: {e}")
-            self.app.notify(f"Failed to load thread: {e}", severity="error")
+            if not revalidating:
+                self.app.notify(f"Failed to load thread: {e}", severity="error")
 
     def action_cursor_down(self) -> None:
         self.query_one("#thread-list", PostList).action_cursor_down()
@@ -70,6 +133,70 @@ class ThreadScreen(Screen):
     def action_cursor_up(self) -> None:
         self.query_one("#thread-list", PostList).action_cursor_up()
 
+    def on_list_view_selected(self, event: ListView.Selected) -> None:
+        if isinstance(event.item, ThreadPostWidget):
+            self._toggle_expand(event.item)
+
+    def action_toggle_expand(self) -> None:
+        widget = self.query_one("#thread-list", PostList).selected_widget
+        if isinstance(widget, ThreadPostWidget):
+            self._toggle_expand(widget)
+
+    def _toggle_expand(self, widget: ThreadPostWidget) -> None:
+        node = widget.node
+        if node.expanded:
+            self._collapse(widget)
+        elif node.replies_loaded:
+            self._expand(widget)
+        elif node.can_expand:
+            self._fetch_and_expand(widget)
+
+    def _expand(self, widget: ThreadPostWidget) -> None:
+        post_list = self.query_one("#thread-list", PostList)
+        widget.node.expanded = True
+        widget._refresh_display()
+        rows = _visible_rows(widget.node.replies, widget.depth + 1)
+        if rows:
+            post_list.insert(post_list.children.index(widget) + 1, rows)
+
+    def _collapse(self, widget: ThreadPostWidget) -> None:
+        post_list = self.query_one("#thread-list", PostList)
+        widget.node.expanded = False
+        widget._refresh_display()
+        # Descendant rows are the contiguous run of deeper rows right after this one
+        start = post_list.children.index(widget) + 1
+        end = start
+        children = post_list.children
+        while end < len(children):
+            child = children[end]
+            if not isinstance(child, ThreadPostWidget) or child.depth <= widget.depth:
+                break
+            end += 1
+        if end > start:
+            post_list.remove_items(range(start, end))
+
+    @work
+    async def _fetch_and_expand(self, widget: ThreadPostWidget) -> None:
+        node = widget.node
+        if node.post.uri in self._expanding:
+            return
+        self._expanding.add(node.post.uri)
+        status = self.query_one("#status-bar", Static)
+        status.update("Loading replies...")
+        try:
+            node.replies = await self.app.client.get_thread_replies(node.post.uri)
+            node.replies_loaded = True
+            # The row may have gone meanwhile (a parent collapsed, a refresh re-rendered
+            # the list); the node keeps the replies for when it is shown again
+            if widget.is_attached and widget in self.query_one("#thread-list", PostList).children:
+                self._expand(widget)
+            status.update("")
+        except Exception as e:
+            status.update(f"Error: {e}")
+            self.app.notify(f"Failed to load replies: {e}", severity="error")
+        finally:
+            self._expanding.discard(node.post.uri)
+
     def action_toggle_like(self) -> None:
         self._toggle_like()
 
@@ -88,10 +215,15 @@ class ThreadScreen(Screen):
             data.like_uri = None
             widget.post_data = data
             widget._refresh_display()
+            if not old_uri:
+                return
+            if await self.app.discard_offline_like(old_uri, data):
+                return  # never sent, so there is nothing to delete on the server
             try:
-                if old_uri:
-                    await self.app.client.unlike(old_uri)
+                await self.app.client.unlike(old_uri, data.uri)
             except Exception as e:
+                if data.is_liked:
+                    return  # liked again since; that write carries the current state
                 data.is_liked = True
                 data.like_count += 1
                 data.like_uri = old_uri
@@ -99,17 +231,28 @@ class ThreadScreen(Screen):
                 widget._refresh_display()
                 self.app.notify(f"Unlike failed: {e}", severity="error")
         else:
+            # The record URI is known before the write is committed
+            pending = self.app.client.like(data.uri, data.cid)
             data.is_liked = True
             data.like_count += 1
+            data.like_uri = pending.uri
             widget.post_data = data
             widget._refresh_display()
             try:
-                like_uri = await self.app.client.like(data.uri, data.cid)
-                data.like_uri = like_uri
-                widget.post_data = data
+                like_uri = await pending
+                if like_uri and data.like_uri == pending.uri:
+                    data.like_uri = like_uri
+                    widget.post_data = data
             except Exception as e:
+                if data.like_uri != pending.uri:
+                    return  # unliked since; nothing to roll back
+                if is_network_error(e):
+                    # Keep the like; the outbox sends it with the same rkey once we're back online
+                    await self.app.queue_offline_like(pending.rkey, data)
+                    return
                 data.is_liked = False
                 data.like_count = max(0, data.like_count - 1)
+                data.like_uri = None
                 widget.post_data = data
                 widget._refresh_display()
                 self.app.notify(f"Like failed: {e}", severity="error")
@@ -129,11 +272,10 @@ class ThreadScreen(Screen):
             self.app.push_screen(ProfileScreen(post.author_did))
 
     def action_view_on_web(self) -> None:
-        import webbrowser
         post_list = self.query_one("#thread-list", PostList)
         post = post_list.selected_post
         if post:
-            webbrowser.open(post.web_url)
+            self.app.open_url(post.web_url)
 
     def action_go_back(self) -> None:
         self.app.pop_screen()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator
+
+from textual.await_remove import AwaitRemove
+from textual.widget import Widget
+from textual.widgets import ListItem, ListView
+from textual.worker import Worker
+
+# Mount work per batch before the screen gets a frame (one frame at 60 fps)
+FRAME_BUDGET = 1 / 60
+MAX_BATCH = 100
+
+
+class BulkMounter:
+    """Mounts widgets into *container* a batch at a time instead of all at once.
+
+    The first screenful of each request (judged by *item_height*, the fewest
+    rows an item takes) is mounted immediately, so it is on screen and
+    selectable as soon as the caller returns. The rest is queued, and built
+    and mounted by a worker one batch per frame: each batch is mounted with
+    layout suspended, then the screen lays out and repaints once before the
+    next.
+    Key presses are handled throughout. Batches are sized from the time per
+    widget of the previous one, to take about *budget* seconds, or as long
+    as the frame in between once layout costs more than that, so a long list
+    doesn't spend most of its time re-laying itself out.
+    """
+
+    def __init__(self, container: Widget, item_height: int = 1, budget: float = FRAME_BUDGET) -> None:
+        self.container = container
+        self.item_height = item_height
+        self.budget = budget
+        self._pending: deque[Iterator[Widget]] = deque()
+        self._worker: Worker | None = None
+
+    def _screenful(self) -> int:
+        height = self.container.size.height or self.container.app.size.height
+        return max(1, -(-height // self.item_height))
+
+    def mount(self, widgets: Iterable[Widget]) -> None:
+        """Mount *widgets* after everything already mounted or queued.
+
+        *widgets* is consumed as mounting proceeds, so a generator should not
+        depend on anything the caller changes afterwards.
+        """
+        widgets = iter(widgets)
+        if not self._pending:
+            first = list(islice(widgets, self._screenful()))
+            if first:
+                self.container.mount(*first)
+        self._pending.append(widgets)
+        if self._worker is None or self._worker.is_finished:
+            self._worker = self.container.run_worker(self._drain(), group="bulk-mount")
+
+    @property
+    def busy(self) -> bool:
+        """Whether widgets are still queued or being mounted."""
+        return bool(self._pending) or (self._worker is not None and not self._worker.is_finished)
+
+    def cancel(self) -> None:
+        """Drop the queued widgets, e.g. because the container is being cleared."""
+        self._pending.clear()
+
+    def _take(self, count: int) -> list[Widget]:
+        batch: list[Widget] = []
+        while self._pending and len(batch) < count:
+            batch.extend(islice(self._pending[0], count - len(batch)))
+            if len(batch) < count:
+                self._pending.popleft()
+        return batch
+
+    async def _drain(self) -> None:
+        size = self._screenful()
+        while batch := self._take(size):
+            started = time.perf_counter()
+            # Lay out once per batch rather than as each widget finishes mounting
+            with self.container.app.batch_update():
+                await self.container.mount(*batch)
+            mounted = time.perf_counter()
+            await self._next_frame()
+            frame = time.perf_counter() - mounted
+            per_widget = max(mounted - started, 1e-4) / len(batch)
+            size = max(1, min(MAX_BATCH, int(max(self.budget, frame) / per_widget)))
+
+    async def _next_frame(self) -> None:
+        refreshed = asyncio.get_running_loop().create_future()
+        if self.container.call_after_refresh(lambda: refreshed.done() or refreshed.set_result(None)):
+            await refreshed
+
+
+class BulkListView(ListView):
+    """ListView filled through a BulkMounter, for lists that can run to hundreds of items."""
+
+    def __init__(self, *children: ListItem, item_height: int = 1, **kwargs) -> None:
+        super().__init__(*children, **kwargs)
+        self.mounter = BulkMounter(self, item_height=item_height)
+
+    def set_items(self, items: Iterable[ListItem], index: int | None = None) -> None:
+        """Replace the list's contents with *items*, highlighting row *index* once it is mounted."""
+        self.mounter.cancel()
+        removed = self.clear()
+        self.mounter.mount(items)
+        if index is None:
+            self.workers.cancel_group(self, "bulk-highlight")
+        else:
+            self.run_worker(self._highlight_when_mounted(removed, index), group="bulk-highlight", exclusive=True)
+
+    async def _highlight_when_mounted(self, removed: AwaitRemove, index: int) -> None:
+        # The old rows hold their indexes until they are gone, and the row may still be queued
+        await removed
+        while index >= len(self) and self.mounter.busy:
+            await self.mounter._next_frame()
+        if len(self):
+            self.index = min(index, len(self) - 1)
+
+    def add_items(self, items: Iterable[ListItem]) -> None:
+        """Append *items* after everything already in (or on its way into) the list."""
+        self.mounter.mount(items)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from textual.app import ComposeResult
+from textual.widgets import Static, ListItem
+
+from bluesky_tui.api.inbox import InboxEntry
+from bluesky_tui.widgets.notification_item import REASON_ICONS, REASON_VERBS, _relative_time
+
+
+class InboxItem(ListItem):
+    """A notification or conversation in the combined inbox, labelled with its account."""
+
+    DEFAULT_CSS = """
+    InboxItem {
+        height: auto;
+        padding: 0 1;
+        border-bottom: solid $surface-lighten-2;
+    }
+    InboxItem.unread {
+        background: $surface-lighten-1;
+    }
+    InboxItem > .inbox-account {
+        color: $accent;
+    }
+    InboxItem > .inbox-text {
+        padding: 0 0 0 4;
+        color: $text-muted;
+    }
+    """
+
+    def __init__(self, entry: InboxEntry, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.entry = entry
+
+    def compose(self) -> ComposeResult:
+        e = self.entry
+        ts = _relative_time(e.timestamp)
+        if e.notification:
+            n = e.notification
+            icon = REASON_ICONS.get(n.reason, "?")
+            verb = REASON_VERBS.get(n.reason, n.reason)
+            line = f"{icon} [bold]{n.author_display_name}[/bold] {verb}  [dim]{ts}[/dim]"
+            text = n.text[:120]
+        else:
+            c = e.conversation
+            unread = f"  [bold red]{c.unread_count}[/bold red]" if c.unread_count else ""
+            line = f"✉ [bold]{c.display_name(e.my_did)}[/bold]{unread}  [dim]{ts}[/dim]"
+            text = c.last_message.text[:120] if c.last_message else ""
+        yield Static(f"@{e.account}", classes="inbox-account")
+        yield Static(line, classes="inbox-line")
+        if text:
+            yield Static(text, classes="inbox-text")
+
+    def on_mount(self) -> None:
+        e = self.entry
+        if (e.notification and not e.notification.is_read) or (e.conversation and e.conversation.unread_count):
+            self.add_class("unread")
@@ -41,6 +41,9 @@ class MessageItem(ListItem):
         background: $surface-lighten-1;
         border-left: thick $accent;
     }
+    MessageItem.pending {
+        border-left: thick $warning;
+    }
     MessageItem.received {
         border-left: thick $surface-lighten-3;
     }
@@ -52,9 +55,10 @@ class MessageItem(ListItem):
     }
     """
 
-    def __init__(self, message: MessageData, **kwargs) -> None:
+    def __init__(self, message: MessageData, pending: bool = False, **kwargs) -> None:
         super().__init__(**kwargs)
         self._message = message
+        self._pending = pending
 
     def compose(self) -> ComposeResult:
         yield Static("", id="msg-header", classes="msg-header")
@@ -65,6 +69,9 @@ class MessageItem(ListItem):
         ts = _relative_time(m.sent_at)
         if m.is_mine:
             self.add_class("sent")
+            if self._pending:
+                self.add_class("pending")
+                ts = "queued, not sent yet"
             self.query_one("#msg-header", Static).update(
                 f"[dim]{ts}[/dim]  [bold]You[/bold]"
             )
@@ -1,27 +1,73 @@
 from __future__ import annotations
 
+from typing import Callable
+
 from textual.app import ComposeResult
-from textual.widgets import ListView
 
 from bluesky_tui.api.models import PostData
+from bluesky_tui.widgets.bulk_mount import BulkListView
 from bluesky_tui.widgets.post import PostWidget
 
 
-class PostList(ListView):
+class PostList(BulkListView):
     CSS = """
     PostList {
         height: 1fr;
     }
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        # Author, text and stats lines at the least
+        super().__init__(*args, item_height=3, **kwargs)
+        # Posts it rejects stay mounted but hidden, so changing it needs no remount
+        self.post_filter: Callable[[PostData], bool] | None = None
+
+    def _build(self, post: PostData) -> PostWidget:
+        widget = PostWidget(post)
+        if self.post_filter and not self.post_filter(post):
+            widget.display = False
+        return widget
+
     def set_posts(self, posts: list[PostData]) -> None:
-        self.clear()
-        for post in posts:
-            self.append(PostWidget(post))
+        self.set_items(map(self._build, list(posts)))
 
     def append_posts(self, posts: list[PostData]) -> None:
-        for post in posts:
-            self.append(PostWidget(post))
+        self.add_items(map(self._build, list(posts)))
+
+    def filter_posts(self, post_filter: Callable[[PostData], bool] | None) -> None:
+        """Show only the posts *post_filter* accepts (all of them for None)."""
+        self.post_filter = post_filter
+        with self.app.batch_update():
+            for item in self.children:
+                if isinstance(item, PostWidget) and item.post_data:
+                    shown = post_filter is None or post_filter(item.post_data)
+                    # Only rows that change are touched; each one costs a style update and refresh
+                    if item.display != shown:
+                        item.display = shown
+        highlighted = self.highlighted_child
+        if highlighted is not None and not highlighted.display:
+            if not (self._move_cursor(1) or self._move_cursor(-1)):
+                self.index = None
+
+    def _move_cursor(self, direction: int) -> bool:
+        """Highlight the next shown, enabled item in *direction*; False if there is none."""
+        nodes = self._nodes
+        if self.index is None:
+            start = -1 if direction > 0 else len(nodes)
+        else:
+            start = self.index
+        stop = len(nodes) if direction > 0 else -1
+        for index in range(start + direction, stop, direction):
+            if nodes[index].display and not nodes[index].disabled:
+                self.index = index
+                return True
+        return False
+
+    def action_cursor_down(self) -> None:
+        self._move_cursor(1)
+
+    def action_cursor_up(self) -> None:
+        self._move_cursor(-1)
 
     @property
     def selected_post(self) -> PostData | None:
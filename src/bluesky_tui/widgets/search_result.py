@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from rich.markup import escape
+from textual.app import ComposeResult
+from textual.widgets import Static, ListItem
+
+from bluesky_tui.api.search_index import SearchResult
+from bluesky_tui.widgets.notification_item import REASON_ICONS, _relative_time
+
+KIND_ICONS = {
+    "post": "[cyan]▪[/cyan]",
+    "message": "[blue]✉[/blue]",
+}
+
+
+class SearchResultItem(ListItem):
+    """A post, notification or direct message matching a search."""
+
+    DEFAULT_CSS = """
+    SearchResultItem {
+        height: auto;
+        padding: 0 1;
+        border-bottom: solid $surface-lighten-2;
+    }
+    SearchResultItem > .search-text {
+        padding: 0 0 0 2;
+        color: $text-muted;
+    }
+    """
+
+    def __init__(self, result: SearchResult, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.result = result
+
+    def compose(self) -> ComposeResult:
+        r = self.result
+        item = r.item
+        if r.kind == "message":
+            icon = KIND_ICONS["message"]
+            name, handle, ts = item.sender_display_name, item.sender_handle, item.sent_at
+        else:
+            icon = REASON_ICONS.get(item.reason, "?") if r.kind == "notification" else KIND_ICONS["post"]
+            name, handle, ts = item.author_display_name, item.author_handle, item.created_at
+        yield Static(
+            f"{icon} [bold]{escape(name or handle)}[/bold] [dim]@{handle}  {_relative_time(ts)}[/dim]",
+            classes="search-header",
+        )
+        yield Static(escape(item.text[:200]), classes="search-text")
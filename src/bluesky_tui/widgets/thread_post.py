@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from textual.app import ComposeResult
+from textual.widgets import Static
+
+from bluesky_tui.api.models import ThreadNode
+from bluesky_tui.widgets.post import PostWidget
+
+INDENT_PER_LEVEL = 2
+
+
+class ThreadPostWidget(PostWidget):
+    """A reply inside a thread tree, indented by depth with an expand/collapse hint."""
+
+    DEFAULT_CSS = """
+    ThreadPostWidget > .post-thread-hint {
+        color: $accent;
+        padding: 0 0 0 2;
+    }
+    """
+
+    def __init__(self, node: ThreadNode, depth: int, **kwargs) -> None:
+        super().__init__(node.post, **kwargs)
+        self.node = node
+        self.depth = depth
+
+    def compose(self) -> ComposeResult:
+        yield from super().compose()
+        yield Static("", id="thread-hint", classes="post-thread-hint")
+
+    def on_mount(self) -> None:
+        self.styles.padding = (0, 1, 0, 1 + self.depth * INDENT_PER_LEVEL)
+        super().on_mount()
+
+    def _refresh_display(self) -> None:
+        super()._refresh_display()
+        hint = self.query_one("#thread-hint", Static)
+        node = self.node
+        if not node.can_expand:
+            hint.display = False
+            return
+        count = len(node.replies) if node.replies_loaded else node.post.reply_count
+        noun = "reply" if count == 1 else "replies"
+        if node.expanded:
+            hint.update(f"▾ {count} {noun} (e to collapse)")
+        else:
+            hint.update(f"▸ {count} {noun} (e to expand)")
+        hint.display = True